@@ -38,11 +38,14 @@ from random import random, gauss
 from functools import partial
 from math import sin, cos
 
+import numpy as np
+
 import bpy
 from bpy.props import FloatProperty, IntProperty, BoolProperty, EnumProperty
 from mathutils import Vector, Euler, Matrix, Quaternion
 
 from .simplefork import simplefork, simplefork2, quadfork, bridgequads  # simple skinning algorithm building blocks
+from . import arrayskin  # skinning of all branchpoints at once with numpy
 from .sca import SCA, Branchpoint  # the core class that implements the space colonization algorithm and the definition of a segment
 from .timer import Timer
 
@@ -400,14 +403,8 @@ def skin(aloop, bloop, faces):
         faces.append((aloop[i], aloop[(i + 1) % n], bloop[(i + 1) % n], bloop[i]))
 
 
-def createGeometry(tree, power=0.5, scale=0.01, addleaves=False, pleaf=0.5, leafsize=0.5, leafrandomsize=0.1, leafrandomrot=0.1,
-    nomodifiers=True, skinmethod='NATIVE', subsurface=False,
-    maxleafconnections=2, bleaf=1.0, connectoffset=-0.1,
-    timeperf=True):
-
-    timings = Timer()
-
-    p = bpy.context.scene.cursor_location
+def nativeSkin(tree, power, scale, p, nomodifiers, skinmethod, timings):
+    """return verts, edges and faces of the tree skeleton and the skin made by the native skinning method"""
     verts = []
     edges = []
     faces = []
@@ -518,10 +515,42 @@ def createGeometry(tree, power=0.5, scale=0.01, addleaves=False, pleaf=0.5, leaf
     # end of native skinning section
     timings.add('nativeskin')
 
-    # create the tree mesh
+    return verts, edges, faces
+
+
+def createGeometry(tree, power=0.5, scale=0.01, addleaves=False, pleaf=0.5, leafsize=0.5, leafrandomsize=0.1, leafrandomrot=0.1,
+    nomodifiers=True, skinmethod='NATIVE', subsurface=False,
+    maxleafconnections=2, bleaf=1.0, connectoffset=-0.1,
+    timeperf=True, timings=None):
+
+    # when the caller passes its own timer it is responsible for reporting the timings
+    if timings is None:
+        timings = Timer()
+    else:
+        timeperf = False
+
+    p = bpy.context.scene.cursor_location
     mesh = bpy.data.meshes.new('Tree')
-    mesh.from_pydata(verts, edges, faces)
-    mesh.update(calc_edges=True)
+
+    if nomodifiers is False and skinmethod == 'NATIVE':
+        verts, edges, faces = nativeSkin(tree, power, scale, p, nomodifiers, skinmethod, timings)
+        mesh.from_pydata(verts, edges, faces)
+        mesh.update(calc_edges=True)
+    else:
+        # the skeleton and the array based skin are computed for all branchpoints at once
+        for n, bp in enumerate(tree.branchpoints):
+            bp.index = n
+        co, parent, apex, shoot, connections = arrayskin.tree_arrays(tree.branchpoints)
+        timings.add('skeleton')
+
+        if nomodifiers is False and skinmethod == 'ARRAY':
+            verts, edges, loops, loop_start, loop_total = arrayskin.skin(co, parent, apex, shoot, connections, power, scale)
+        else:
+            verts, edges = arrayskin.skeleton(co, parent)
+            loops = loop_start = loop_total = None
+        timings.add('arrayskin')
+
+        arrayskin.mesh_from_arrays(mesh, verts + np.array(p[:]), edges, loops, loop_start, loop_total)
 
     # create the tree object an make it the only selected and active object in the scene
     obj_new = bpy.data.objects.new(mesh.name, mesh)
@@ -551,10 +580,11 @@ def createGeometry(tree, power=0.5, scale=0.01, addleaves=False, pleaf=0.5, leaf
 
             skinverts = bpy.context.active_object.data.skin_vertices[0].data
 
-            for i, v in enumerate(skinverts):
-                v.radius = [(radii[i] ** power) * scale, (radii[i] ** power) * scale]
-                if i in roots:
-                    v.use_root = True
+            radii = np.array([bp.connections for bp in tree.branchpoints], dtype=np.float32) ** power * scale
+            skinverts.foreach_set('radius', np.repeat(radii, 2))
+            for i, bp in enumerate(tree.branchpoints):
+                if bp.parent is None:
+                    skinverts[i].use_root = True
 
             # add an extra subsurf modifier to smooth the skin
             bpy.ops.object.modifier_add(type='SUBSURF')
@@ -693,7 +723,7 @@ class SCATree(bpy.types.Operator):
                     min=0)
     maxTime = FloatProperty(name="Maximum Time",
                     description=("The maximum time to run the generation for "
-                                "in seconds/generation (0.0 = Disabled). Currently ignored"),
+                                "in seconds/generation (0.0 = Disabled)"),
                     default=0.0,
                     min=0.0,
                     soft_max=10)
@@ -770,7 +800,8 @@ class SCATree(bpy.types.Operator):
 
     noModifiers = BoolProperty(name="No Modifers", default=True)
     subSurface = BoolProperty(name="Sub Surface", default=False, description="Add subsurface modifier to trunk skin")
-    skinMethod = EnumProperty(items=[('NATIVE', 'Native', 'Built in skinning method', 1), ('BLENDER', 'Skin modifier', 'Use Blenders skin modifier', 2)],
+    skinMethod = EnumProperty(items=[('NATIVE', 'Native', 'Built in skinning method', 1), ('BLENDER', 'Skin modifier', 'Use Blenders skin modifier', 2),
+                    ('ARRAY', 'Fast', 'Built in skinning method for all branches at once, suitable for very large trees', 3)],
                     options={'ANIMATABLE', 'SKIP_SAVE'},
                     name='Skinning method',
                     description='How to add a surface to the trunk skeleton')
@@ -834,13 +865,13 @@ class SCATree(bpy.types.Operator):
             base = bpy.context.scene.objects.link(obj_markers)
         timings.add('showmarkers')
 
-        sca.iterate2(newendpointsper1000=self.newEndPointsPer1000, maxtime=self.maxTime)
+        sca.iterate3(newendpointsper1000=self.newEndPointsPer1000, maxtime=self.maxTime)
         timings.add('iterate')
 
         obj_new = createGeometry(sca, self.power, self.scale, self.addLeaves, self.pLeaf, self.leafSize, self.leafRandomSize, self.leafRandomRot,
             self.noModifiers, self.skinMethod, self.subSurface,
             self.leafMaxConnections, self.bLeaf, self.connectoffset,
-            self.timePerformance)
+            self.timePerformance, timings)
 
         timings.add('objcreationstart')
         if self.addObjects:
@@ -862,6 +893,7 @@ class SCATree(bpy.types.Operator):
         if self.timePerformance:
             timings.add('Total')
             print(timings)
+            self.report({'INFO'}, str(timings))
 
         return {'FINISHED'}
 
@@ -0,0 +1,232 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  SCA Tree Generator, a Blender addon
+#  (c) 2013 Michel J. Anders (varkenvarken)
+#
+#  This module is: arrayskin.py
+#  skinning of complete trees with numpy arrays
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# <pep8 compliant>
+
+# the same geometry as the native skinning method in __init__.py, but every
+# fork and every ring is computed for all branchpoints at once:
+# - every fork gets the quadfork block of simplefork.py,
+# - every other branchpoint gets a quad ring perpendicular to the branch,
+# - every internode is bridged with four quads between the ring at the parent
+#   side and the ring at the child side.
+
+import numpy as np
+
+# a quad ring as multiples of the (normal, side) vectors, in the vertex order used by quadfork
+RING = np.array([(1, 1), (1, -1), (-1, -1), (-1, 1)], dtype=np.float64)
+
+# the faces of quadfork, the 22 vertices are
+# 0-3 ring towards the parent, 4-7 ring towards the apex, 8-11 ring towards the shoot,
+# 12-17 top of the connecting block and 18-21 bottom of the connecting block
+QUADFORK_QUADS = np.array([
+    (0, 1, 19, 18),        # p1->p0 bottom
+    (1, 2, 20, 19),
+    (2, 3, 21, 20),
+    (3, 0, 18, 21),
+
+    (13, 14, 5, 4),        # p2 -> p0 top right
+    (14, 15, 6, 5),
+    (15, 16, 7, 6),
+    (16, 13, 4, 7),
+
+    (12, 13, 9, 8),        # p3 -> p0 top left
+    (13, 16, 10, 9),
+    (16, 17, 11, 10),
+    (17, 12, 8, 11),
+
+    (12, 17, 21, 18),      # connecting block
+    (19, 20, 15, 14)], dtype=np.int64)
+QUADFORK_PENTAGONS = np.array([
+    (18, 19, 14, 13, 12),
+    (20, 21, 17, 16, 15)], dtype=np.int64)
+QUADFORK_VERTS = 22
+
+# the 8 ways to connect two quad rings: 4 rotations in both directions
+_BRIDGES = np.array([[(s + d * i) % 4 for i in range(4)] for d in (1, -1) for s in range(4)], dtype=np.int64)
+
+
+def normalized(v):
+    """normalize an (..., 3) array of vectors, zero length vectors stay zero"""
+    length = np.sqrt((v * v).sum(axis=-1))[..., None]
+    return np.divide(v, length, out=np.zeros_like(v), where=length > 0)
+
+
+def rings(center, n, a, r):
+    """return an (n, 4, 3) array of quad rings around center in the plane spanned by n and a"""
+    offsets = RING[None, :, 0, None] * n[:, None, :] + RING[None, :, 1, None] * a[:, None, :]
+    return center[:, None, :] + offsets * r[:, None, None]
+
+
+def frames(d):
+    """return (n, a), two unit vectors perpendicular to each direction d"""
+    ref = np.zeros_like(d)
+    vertical = np.abs(normalized(d)[:, 2]) > 0.9
+    ref[~vertical, 2] = 1
+    ref[vertical, 0] = 1
+    a = normalized(np.cross(d, ref))
+    n = normalized(np.cross(a, d))
+    return n, a
+
+
+def quadforks(p0, p1, p2, p3, r0, r1, r2, r3):
+    """the vertices of simplefork.quadfork for arrays of forks, returns an (n, 22, 3) array"""
+    d1 = p1 - p0
+    d2 = p2 - p0
+    d3 = p3 - p0
+    a = normalized(d3 - d2)
+    n = normalized(np.cross(d2, d3))
+    v2 = rings(p0 + d2 / 3, n, a, r2)
+    v3 = rings(p0 + d3 / 3, n, a, r3)
+
+    a = normalized(np.cross(d1, n))
+    n = normalized(np.cross(a, d1))
+    v1 = rings(p0 + d1 / 3, n, a, r1)
+
+    # the top of the connecting block consist of two quads
+    v0 = rings(p0, n, a, r0)
+    v0ab = p0 + n * r0[:, None]
+    v0cd = p0 - n * r0[:, None]
+    # the bottom is a single quad (which means the front and back are 5gons)
+    vb0 = v0 + (normalized(d1) * r0[:, None] * 0.1)[:, None, :]
+
+    return np.concatenate((v1, v2, v3,
+        v0[:, 0:1], v0ab[:, None], v0[:, 1:2], v0[:, 2:3], v0cd[:, None], v0[:, 3:4],
+        vb0), axis=1)
+
+
+def bridges(verts, aring, bring):
+    """return an (n, 4, 4) array of quads connecting the quad rings aring and bring.
+
+    of all the ways to connect the rings the one with the shortest edges is used.
+    """
+    va = verts[aring]
+    vb = verts[bring][:, _BRIDGES]     # (n, 8, 4, 3)
+    d = vb - va[:, None]
+    best = np.argmin((d * d).sum(axis=(2, 3)), axis=1)
+    bring = bring[np.arange(len(bring))[:, None], _BRIDGES[best]]
+    following = [1, 2, 3, 0]
+    return np.stack((aring, aring[:, following], bring[:, following], bring), axis=2)
+
+
+def template_faces(index, template):
+    """apply a face template to every row of vertex indices"""
+    return index[:, template].reshape(-1, template.shape[1])
+
+
+def tree_arrays(branchpoints):
+    """return the location, parent, apex, shoot and connections of all branchpoints as arrays, missing links are -1"""
+    co = np.array([bp.v[:] for bp in branchpoints], dtype=np.float64).reshape(-1, 3)
+    links = np.array([[-1 if i is None else i for i in (bp.parent, bp.apex, bp.shoot)] for bp in branchpoints], dtype=np.int64).reshape(-1, 3)
+    connections = np.array([bp.connections for bp in branchpoints], dtype=np.float64)
+    return co, links[:, 0], links[:, 1], links[:, 2], connections
+
+
+def skeleton(co, parent):
+    """return the vertices and edges of the bare skeleton"""
+    child = np.flatnonzero(parent >= 0)
+    edges = np.stack((child, parent[child]), axis=1)
+    return co, edges
+
+
+def skin(co, parent, apex, shoot, connections, power=0.5, scale=0.01):
+    """skin a tree given as arrays.
+
+    returns vertices, edges, loop vertex indices, loop starts and loop totals.
+    the first len(co) vertices and all edges are the skeleton.
+    """
+    nbp = len(co)
+    r = ((connections + 1) ** power) * scale
+    fork = (apex >= 0) & (shoot >= 0)
+    haschildren = apex >= 0
+    hasparent = parent >= 0
+
+    # forks
+    forks = np.flatnonzero(fork)
+    p0 = co[forks]
+    p2 = co[apex[forks]]
+    p3 = co[shoot[forks]]
+    fparent = parent[forks]
+    p1 = np.where((fparent >= 0)[:, None], co[fparent], p0 - (p2 - p0))
+    r1 = np.where(fparent >= 0, (connections[fparent] ** power) * scale, r[forks])
+    forkverts = quadforks(p0, p1, p2, p3, r[forks], r1, r[apex[forks]], r[shoot[forks]])
+
+    # rings at the other branchpoints, and an extra ring beyond the tips
+    ringed = np.flatnonzero(~fork & (haschildren | hasparent))
+    rparent = parent[ringed]
+    rapex = apex[ringed]
+    ahead = np.where((rapex >= 0)[:, None], co[rapex], co[ringed])
+    behind = np.where((rparent >= 0)[:, None], co[rparent], co[ringed])
+    n, a = frames(ahead - behind)
+    ringverts = rings(co[ringed], n, a, r[ringed])
+    tips = np.flatnonzero(rapex < 0)
+    tipverts = ringverts[tips] + (co[ringed[tips]] - behind[tips])[:, None, :]
+
+    # vertex indices of all rings
+    start = nbp
+    forkindex = (start + np.arange(len(forks) * QUADFORK_VERTS)).reshape(-1, QUADFORK_VERTS)
+    start += forkindex.size
+    ringindex = (start + np.arange(len(ringed) * 4)).reshape(-1, 4)
+    start += ringindex.size
+    tipindex = (start + np.arange(len(tips) * 4)).reshape(-1, 4)
+    verts = np.concatenate((co, forkverts.reshape(-1, 3), ringverts.reshape(-1, 3), tipverts.reshape(-1, 3)))
+
+    # the ring a branchpoint connects to its parent with, and the ring it connects to its apex and shoot with
+    inring = np.zeros((nbp, 4), dtype=np.int64)
+    apexring = np.zeros((nbp, 4), dtype=np.int64)
+    shootring = np.zeros((nbp, 4), dtype=np.int64)
+    inring[ringed] = ringindex
+    apexring[ringed] = ringindex
+    inring[forks] = forkindex[:, 0:4]
+    apexring[forks] = forkindex[:, 4:8]
+    shootring[forks] = forkindex[:, 8:12]
+
+    # bridge every internode
+    child = np.flatnonzero(hasparent)
+    outring = np.where((shoot[parent[child]] == child)[:, None], shootring[parent[child]], apexring[parent[child]])
+    quads = np.concatenate((bridges(verts, outring, inring[child]).reshape(-1, 4),
+        bridges(verts, ringindex[tips], tipindex).reshape(-1, 4),
+        template_faces(forkindex, QUADFORK_QUADS)))
+    pentagons = template_faces(forkindex, QUADFORK_PENTAGONS)
+
+    loops = np.concatenate((quads.ravel(), pentagons.ravel()))
+    loop_total = np.concatenate((np.full(len(quads), 4, dtype=np.int64), np.full(len(pentagons), 5, dtype=np.int64)))
+    loop_start = np.cumsum(loop_total) - loop_total
+
+    _, edges = skeleton(co, parent)
+    return verts, edges, loops, loop_start, loop_total
+
+
+def mesh_from_arrays(mesh, verts, edges, loops=None, loop_start=None, loop_total=None):
+    """fill an empty mesh, faces are given as loops like in the mesh itself"""
+    mesh.vertices.add(len(verts))
+    mesh.vertices.foreach_set("co", np.ascontiguousarray(verts, dtype=np.float32).ravel())
+    mesh.edges.add(len(edges))
+    mesh.edges.foreach_set("vertices", np.ascontiguousarray(edges, dtype=np.int32).ravel())
+    if loops is not None and len(loop_total):
+        mesh.loops.add(len(loops))
+        mesh.loops.foreach_set("vertex_index", np.ascontiguousarray(loops, dtype=np.int32))
+        mesh.polygons.add(len(loop_total))
+        mesh.polygons.foreach_set("loop_start", np.ascontiguousarray(loop_start, dtype=np.int32))
+        mesh.polygons.foreach_set("loop_total", np.ascontiguousarray(loop_total, dtype=np.int32))
+    mesh.update(calc_edges=True)
@@ -0,0 +1,284 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  SCA Tree Generator, a Blender addon
+#  (c) 2013 Michel J. Anders (varkenvarken)
+#
+#  This module is: pointgrid.py
+#  a bucketed uniform grid for batched nearest neighbor queries
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# <pep8 compliant>
+
+import numpy as np
+
+# cell coordinates are packed into a single int64 key, 21 bits per axis
+_BITS = 21
+_OFFSET = 1 << (_BITS - 1)
+_MASK = (1 << _BITS) - 1
+
+# upper bound on the number of candidate cells or points handled in one go
+CHUNK_SIZE = 1 << 20
+
+
+def cell_keys(cells):
+    '''pack an (..., 3) array of integer cell coordinates into int64 keys'''
+    c = (cells + _OFFSET) & _MASK
+    return (c[..., 0] << (2 * _BITS)) | (c[..., 1] << _BITS) | c[..., 2]
+
+
+_rings = {}
+
+
+def ring_offsets(k):
+    '''return the cell offsets at chebyshev distance exactly k as an (n, 3) array'''
+    if k not in _rings:
+        r = np.arange(-k, k + 1)
+        offsets = np.stack(np.meshgrid(r, r, r, indexing='ij'), axis=-1).reshape(-1, 3)
+        _rings[k] = offsets[np.abs(offsets).max(axis=1) == k].astype(np.int64)
+    return _rings[k]
+
+
+class Grid:
+    '''a uniform grid of 3d points that can grow incrementally.
+
+    points are stored in insertion order and are referred to by that index.
+    points can be disabled, disabled points are skipped by queries that
+    ask for enabled points only.
+    '''
+
+    def __init__(self, cellsize, co=None):
+        self.cellsize = float(cellsize)
+        self.count = 0
+        self.co = np.empty((64, 3), dtype=np.float64)
+        self.keys = np.empty(64, dtype=np.int64)
+        self.enabled = np.empty(64, dtype=np.bool_)
+        self._dirty = False
+        self._order = np.empty(0, dtype=np.int64)
+        self._sortedkeys = np.empty(0, dtype=np.int64)
+        self._ncells = 0
+        if co is not None:
+            self.insert(co)
+
+    def __len__(self):
+        return self.count
+
+    def points(self):
+        return self.co[:self.count]
+
+    def cells(self, co):
+        return np.floor(co / self.cellsize).astype(np.int64)
+
+    def insert(self, co):
+        '''add points, returns the indices of the new points'''
+        co = np.asarray(co, dtype=np.float64).reshape(-1, 3)
+        n = len(co)
+        start = self.count
+        end = start + n
+        if end > len(self.co):
+            size = max(end, 2 * len(self.co))
+            self.co = np.resize(self.co, (size, 3))
+            self.keys = np.resize(self.keys, size)
+            self.enabled = np.resize(self.enabled, size)
+        self.co[start:end] = co
+        self.keys[start:end] = cell_keys(self.cells(co))
+        self.enabled[start:end] = True
+        self.count = end
+        self._dirty = self._dirty or n > 0
+        return np.arange(start, end)
+
+    def disable(self, indices):
+        self.enabled[indices] = False
+
+    def _update(self):
+        '''sort points by cell key, only done when points were added since the last query'''
+        if self._dirty:
+            keys = self.keys[:self.count]
+            self._order = np.argsort(keys, kind='mergesort')
+            self._sortedkeys = keys[self._order]
+            if self.count:
+                self._ncells = 1 + np.count_nonzero(self._sortedkeys[1:] != self._sortedkeys[:-1])
+            self._dirty = False
+
+    def _candidates(self, cells, queries, offsets):
+        '''return (query, point) index pairs for all points in the offset cells around each query'''
+        keys = cell_keys(cells[:, None, :] + offsets[None, :, :]).ravel()
+        lo = np.searchsorted(self._sortedkeys, keys, side='left')
+        counts = np.searchsorted(self._sortedkeys, keys, side='right') - lo
+        total = counts.sum()
+        q = np.repeat(np.repeat(queries, len(offsets)), counts)
+        within = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        p = self._order[np.repeat(lo, counts) + within]
+        return q, p
+
+    def _best(self, co, q, p, index, dist2):
+        '''keep the closest candidate per query'''
+        if len(q) == 0:
+            return
+        d = co[q] - self.co[p]
+        d2 = (d * d).sum(axis=1)
+        order = np.lexsort((d2, q))
+        q = q[order]
+        first = np.ones(len(q), dtype=np.bool_)
+        first[1:] = q[1:] != q[:-1]
+        q = q[first]
+        d2 = d2[order][first]
+        p = p[order][first]
+        better = d2 < dist2[q]
+        index[q[better]] = p[better]
+        dist2[q[better]] = d2[better]
+
+    def _brute(self, co, queries, enabled_only, index, dist2):
+        points = np.arange(self.count)
+        if enabled_only:
+            points = points[self.enabled[:self.count]]
+        if len(points) == 0:
+            return
+        pco = self.co[points]
+        step = max(1, CHUNK_SIZE // len(points))
+        for i in range(0, len(queries), step):
+            qi = queries[i:i + step]
+            d = co[qi][:, None, :] - pco[None, :, :]
+            d2 = (d * d).sum(axis=2)
+            j = np.argmin(d2, axis=1)
+            d2 = d2[np.arange(len(qi)), j]
+            better = d2 < dist2[qi]
+            index[qi[better]] = points[j[better]]
+            dist2[qi[better]] = d2[better]
+
+    def nearest(self, co, maxdist, enabled_only=True):
+        '''find the nearest point closer than maxdist for each point in co.
+
+        maxdist can be a scalar or an array with a distance per query.
+        returns an array of point indices (-1 if nothing was found)
+        and an array of squared distances (inf if nothing was found).
+        '''
+        co = np.asarray(co, dtype=np.float64).reshape(-1, 3)
+        n = len(co)
+        index = np.full(n, -1, dtype=np.int64)
+        dist2 = np.full(n, np.inf)
+        if n == 0 or self.count == 0:
+            return index, dist2
+        self._update()
+
+        maxd2 = np.broadcast_to(np.asarray(maxdist, dtype=np.float64) ** 2, (n,))
+        cells = self.cells(co)
+        active = np.arange(n)
+        kmax = int(np.ceil(np.sqrt(maxd2.max()) / self.cellsize))
+        for k in range(kmax + 1):
+            offsets = ring_offsets(k)
+            if len(offsets) > self._ncells:
+                # the ring has more cells than the grid has occupied cells, comparing all points is cheaper
+                self._brute(co, active, enabled_only, index, dist2)
+                break
+            step = max(1, CHUNK_SIZE // len(offsets))
+            for i in range(0, len(active), step):
+                queries = active[i:i + step]
+                q, p = self._candidates(cells[queries], queries, offsets)
+                if enabled_only:
+                    keep = self.enabled[p]
+                    q, p = q[keep], p[keep]
+                self._best(co, q, p, index, dist2)
+            # points in rings beyond k are at least k cells away
+            bound = (k * self.cellsize) ** 2
+            active = active[(dist2[active] > bound) & (maxd2[active] > bound)]
+            if len(active) == 0:
+                break
+
+        outside = dist2 >= maxd2
+        index[outside] = -1
+        dist2[outside] = np.inf
+        return index, dist2
+
+    def pairs(self, co, maxdist, enabled_only=True):
+        '''return (query, point) index pairs and their squared distances for all points closer than maxdist'''
+        co = np.asarray(co, dtype=np.float64).reshape(-1, 3)
+        empty = np.empty(0, dtype=np.int64)
+        if len(co) == 0 or self.count == 0:
+            return empty, empty, np.empty(0)
+        self._update()
+        kmax = int(np.ceil(maxdist / self.cellsize))
+        offsets = np.concatenate([ring_offsets(k) for k in range(kmax + 1)])
+        q, p = self._candidates(self.cells(co), np.arange(len(co)), offsets)
+        if enabled_only:
+            keep = self.enabled[p]
+            q, p = q[keep], p[keep]
+        d = co[q] - self.co[p]
+        d2 = (d * d).sum(axis=1)
+        keep = d2 < maxdist * maxdist
+        return q[keep], p[keep], d2[keep]
+
+
+if __name__ == "__main__":
+
+    import unittest
+    from time import time
+
+    class TestGrid(unittest.TestCase):
+
+        def brute(self, co, pco, maxdist):
+            d2 = ((co[:, None, :] - pco[None, :, :]) ** 2).sum(axis=2)
+            j = np.argmin(d2, axis=1)
+            d2 = d2[np.arange(len(co)), j]
+            j[d2 >= maxdist * maxdist] = -1
+            return j
+
+        def test_nearest(self):
+            rng = np.random.RandomState(0)
+            pco = rng.uniform(0, 10, (2000, 3))
+            co = rng.uniform(-2, 12, (3000, 3))
+            grid = Grid(0.5)
+            grid.insert(pco[:1000])
+            grid.insert(pco[1000:])
+            for maxdist in (0.3, 1.0, 100.0):
+                index, dist2 = grid.nearest(co, maxdist)
+                self.assertTrue(np.array_equal(index, self.brute(co, pco, maxdist)))
+
+        def test_disabled(self):
+            rng = np.random.RandomState(1)
+            pco = rng.uniform(0, 10, (1000, 3))
+            co = rng.uniform(0, 10, (1000, 3))
+            grid = Grid(1.0, pco)
+            disabled = np.arange(0, 1000, 3)
+            grid.disable(disabled)
+            index, dist2 = grid.nearest(co, 2.0)
+            self.assertTrue(np.all(grid.enabled[index[index >= 0]]))
+            enabled = np.setdiff1d(np.arange(1000), disabled)
+            expect = self.brute(co, pco[enabled], 2.0)
+            self.assertTrue(np.array_equal(index, np.where(expect < 0, -1, enabled[expect])))
+            index, dist2 = grid.nearest(co, 2.0, enabled_only=False)
+            self.assertTrue(np.array_equal(index, self.brute(co, pco, 2.0)))
+
+        def test_pairs(self):
+            rng = np.random.RandomState(2)
+            pco = rng.uniform(0, 5, (500, 3))
+            grid = Grid(0.25, pco)
+            q, p, d2 = grid.pairs(pco, 0.3)
+            d2 = ((pco[:, None, :] - pco[None, :, :]) ** 2).sum(axis=2)
+            self.assertEqual(len(q), np.count_nonzero(d2 < 0.09))
+
+        def test_performance(self):
+            rng = np.random.RandomState(3)
+            print("<performance test, may take several seconds>")
+            grid = Grid(0.5)
+            grid.insert(rng.uniform(0, 10, (10000, 3)))
+            co = rng.uniform(0, 10, (20000, 3))
+            s = time()
+            grid.nearest(co, 10.0)
+            print("nearest of {0:d} points in {1:d}: {2:.3f}s".format(len(co), len(grid), time() - s))
+
+    unittest.main()
@@ -25,10 +25,13 @@ from collections import defaultdict as dd
 from random import random, seed, expovariate
 from math import sqrt, pow, sin, cos
 from functools import partial
+from time import time
 
+import numpy as np
 from mathutils import Vector
 
 from .kdtree import Tree
+from .pointgrid import Grid
 
 
 class Branchpoint:
@@ -246,3 +249,156 @@ class SCA:
                     self.endpoints.append(next(self.volumepoint))
                     endpointsadded += 1
                     t += expovariate(newendpointsper1000)  # time to new 'endpoint add event'
+
+    def iterate3(self, newendpointsper1000=0, maxtime=0.0):
+        """iterate using a bucketed grid for the branchpoints.
+
+        instead of searching the nearest branchpoint for every endpoint on every
+        iteration we remember it and only compare the endpoints against the
+        branchpoints that were added in the previous iteration. endpoints that
+        are new or whose nearest branchpoint became a fork are looked up in the
+        grid of all branchpoints, all of them in a single batch.
+
+        the branchpoints grown are the same as with iterate2, only their order
+        within an iteration may differ. unlike iterate2 endpoints within the
+        kill distance of a fork are removed as well.
+        """
+        start = time()
+        endpointsadded = 0.0
+        niterations = 0.0
+        newendpointsper1000 /= 1000.0
+        t = expovariate(newendpointsper1000) if newendpointsper1000 > 0.0 else 1  # time to the first new 'endpoint add event'
+
+        killdist = sqrt(self.KILLDIST)
+        influence = sqrt(self.INFLUENCE)
+        tooclose = sqrt(1e-3)
+
+        nstart = len(self.branchpoints)
+        grid = Grid(killdist)
+        for bpi, bp in enumerate(self.branchpoints):
+            bp.index = bpi
+        grid.insert([bp.v[:] for bp in self.branchpoints])
+        grid.disable([bp.index for bp in self.branchpoints if bp.shoot is not None])  # forks do not attract endpoints
+        pending = np.empty(0, dtype=np.int64)  # branchpoints not yet compared to the remembered nearest branchpoints
+
+        endpoints = np.array([e[:] for e in self.endpoints], dtype=np.float64).reshape(-1, 3)
+        nearest = np.full(len(endpoints), -1, dtype=np.int64)
+        nearestdist = np.full(len(endpoints), np.inf)
+        stale = np.ones(len(endpoints), dtype=np.bool_)
+
+        while self.NBP > 0 and (len(endpoints) > 0):
+            if maxtime > 0.0 and time() - start > maxtime:
+                break
+            self.NBP -= 1
+
+            kill = np.zeros(len(endpoints), dtype=np.bool_)
+
+            # compare the endpoints we already know about to the newly added branchpoints only
+            known = np.flatnonzero(~stale)
+            if len(pending) and len(known):
+                bi, ei, distance = Grid(influence / 2, endpoints[known]).pairs(grid.co[pending], influence)
+                bi, ei = pending[bi], known[ei]
+                kill[ei[distance < self.KILLDIST]] = True
+                order = np.lexsort((distance, ei))
+                bi, ei, distance = bi[order], ei[order], distance[order]
+                first = np.ones(len(ei), dtype=np.bool_)
+                first[1:] = ei[1:] != ei[:-1]
+                closer = first & (distance < nearestdist[ei])
+                nearest[ei[closer]] = bi[closer]
+                nearestdist[ei[closer]] = distance[closer]
+
+            # look up new endpoints and endpoints that lost their nearest branchpoint in the full grid
+            stale = np.flatnonzero(stale)
+            if len(stale):
+                _, distance = grid.nearest(endpoints[stale], killdist, enabled_only=False)  # forks can still kill endpoints
+                kill[stale[distance < self.KILLDIST]] = True
+                index, distance = grid.nearest(endpoints[stale], influence)
+                nearest[stale] = index
+                nearestdist[stale] = distance
+
+            keep = ~kill
+            endpoints = endpoints[keep]
+            nearest = nearest[keep]
+            nearestdist = nearestdist[keep]
+            stale = np.zeros(len(endpoints), dtype=np.bool_)
+            pending = np.empty(0, dtype=np.int64)
+
+            attracted = np.flatnonzero(nearest >= 0)
+            if len(attracted) < 1:
+                break
+
+            # average direction towards the attracting endpoints for every branchpoint
+            bi = nearest[attracted]
+            bpco = grid.points()
+            dv = endpoints[attracted] - bpco[bi]
+            dv /= np.sqrt((dv * dv).sum(axis=1))[:, None]
+            n = np.bincount(bi, minlength=len(bpco))
+            sd = np.stack([np.bincount(bi, weights=dv[:, i], minlength=len(bpco)) for i in range(3)], axis=1)
+            growing = np.flatnonzero(n)
+            sd = sd[growing] / n[growing, None]
+            # like iterate2 this uses the squared length, both for the threshold and to scale the
+            # direction before the tropism is added, so trees with tropism come out the same as well
+            ll = (sd * sd).sum(axis=1)
+            # if the unnormalised direction is very small, the endpoints are nearly coplanar/colinear and at roughly the same distance
+            # so no endpoints will be killed and we might end up adding the same branch again and again
+            big = ll >= 1e-3
+            growing, sd, ll = growing[big], sd[big], ll[big]
+            sd /= ll[:, None]
+            sd[:, 2] += self.TROPISM
+            sd /= np.sqrt((sd * sd).sum(axis=1))[:, None]
+            newp = bpco[growing] + sd * self.d
+
+            # skip new branchpoints too close to an existing one or to one added earlier in this iteration
+            index, _ = grid.nearest(newp, tooclose, enabled_only=False)
+            ok = index < 0
+            q, p, _ = Grid(tooclose, newp).pairs(newp, tooclose)
+            ok[q[p < q]] = False
+
+            newbps = []
+            for bi, p in zip(growing[ok].tolist(), newp[ok].tolist()):
+                v = Vector(p)
+                if self.exclude(v):
+                    continue
+                bp = Branchpoint(v, bi)
+                self.branchpoints.append(bp)
+                nbpi = len(self.branchpoints) - 1
+                bp.index = nbpi
+                newbps.append(p)
+                bp = self.branchpoints[bi]
+                if bp.apex is None:
+                    bp.apex = nbpi
+                else:
+                    bp.shoot = nbpi
+                    grid.disable(bi)
+                    stale[nearest == bi] = True
+            if len(newbps):
+                pending = grid.insert(newbps)
+
+            if newendpointsper1000 > 0.0:
+                # generate new endpoints with a poisson process
+                # when we first arrive here, t already hold the time to the first event
+                niterations += 1
+                newendpoints = []
+                while t < niterations:  # we keep on adding endpoints as long as the next event still happens within this iteration
+                    newendpoints.append(next(self.volumepoint)[:])
+                    endpointsadded += 1
+                    t += expovariate(newendpointsper1000)  # time to new 'endpoint add event'
+                if len(newendpoints):
+                    endpoints = np.concatenate((endpoints, np.array(newendpoints).reshape(-1, 3)))
+                    nearest = np.concatenate((nearest, np.full(len(newendpoints), -1, dtype=np.int64)))
+                    nearestdist = np.concatenate((nearestdist, np.full(len(newendpoints), np.inf)))
+                    stale = np.concatenate((stale, np.ones(len(newendpoints), dtype=np.bool_)))
+
+        self.endpoints = [Vector(e) for e in endpoints.tolist()]
+
+        # every new branchpoint adds a connection to all its ancestors,
+        # parents always precede their children so one pass in reverse order suffices
+        added = [0] * len(self.branchpoints)
+        for bpi in range(len(self.branchpoints) - 1, -1, -1):
+            bp = self.branchpoints[bpi]
+            if bpi >= nstart:
+                added[bpi] += 1
+            if bp.parent is not None:
+                added[bp.parent] += added[bpi]
+        for bpi, bp in enumerate(self.branchpoints):
+            bp.connections += added[bpi] - (1 if bpi >= nstart else 0)
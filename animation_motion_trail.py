@@ -164,19 +164,21 @@ def world_to_screen(context, vector):
     return(x, y)
 
 
+# calculate location of display_ob in worldspace at the current frame
+def get_current_location(display_ob, offset_ob):
+    display_mat = getattr(display_ob, "matrix", False)
+    if not display_mat:
+        # posebones have "matrix", objects have "matrix_world"
+        display_mat = display_ob.matrix_world
+    return(display_mat.to_translation() + \
+        offset_ob.matrix_world.to_translation())
+
+
 # calculate location of display_ob in worldspace
 def get_location(frame, display_ob, offset_ob, curves):
     if offset_ob:
         bpy.context.scene.frame_set(frame)
-        display_mat = getattr(display_ob, "matrix", False)
-        if not display_mat:
-            # posebones have "matrix", objects have "matrix_world"
-            display_mat = display_ob.matrix_world
-        if offset_ob:
-            loc = display_mat.to_translation() + \
-                offset_ob.matrix_world.to_translation()
-        else:
-            loc = display_mat.to_translation()
+        loc = get_current_location(display_ob, offset_ob)
     else:
         fcx, fcy, fcz = curves
         locx = fcx.evaluate(frame)
@@ -187,8 +189,246 @@ def get_location(frame, display_ob, offset_ob, curves):
     return(loc)
 
 
+# key of the locations of display_ob in the trail cache
+def get_trail_key(display_ob, offset_ob):
+    if offset_ob:
+        # posebone
+        return((offset_ob.name, display_ob.name))
+    return((display_ob.name, ""))
+
+
+# get the fcurves the location of a trail depends on, with their cache keys
+def get_dependencies(action_ob, child):
+    curves = get_curves(action_ob, child)
+    action = action_ob.animation_data.action
+    if child and action:
+        # posebone, its location also depends on the parent bones
+        bones = [child] + list(child.parent_recursive)
+        if action_ob.constraints or [pb for pb in bones if pb.constraints]:
+            # constraints can depend on any curve
+            curves = list(action.fcurves)
+        else:
+            names = [pb.name for pb in bones]
+            curves = [fc for fc in action.fcurves if not \
+                fc.data_path.startswith('pose.bones["') or \
+                fc.data_path.split("\"")[1] in names]
+
+    dependencies = []
+    for i, fc in enumerate(curves):
+        if isinstance(fc, fake_fcurve):
+            dependencies.append([(action_ob.name, "", i), fc])
+        else:
+            dependencies.append([(action_ob.name, fc.data_path,
+                fc.array_index), fc])
+    return(dependencies)
+
+
+# get the values of the properties of a struct, like a modifier or a
+# constraint, used to find out if any of its settings changed
+def get_rna_state(struct):
+    state = []
+    for prop in struct.bl_rna.properties:
+        if prop.identifier == "rna_type":
+            continue
+        value = getattr(struct, prop.identifier, None)
+        if prop.type == 'COLLECTION':
+            value = tuple([get_rna_state(item) for item in value])
+        elif prop.type == 'POINTER':
+            # only the datablock it points to, like a constraint target
+            if isinstance(value, bpy.types.ID):
+                value = value.name
+            else:
+                continue
+        elif getattr(prop, "array_length", 0):
+            value = tuple(value)
+        state.append(value)
+    return(tuple(state))
+
+
+# get the state of a curve, used to find the keyframes that were edited
+def get_curve_state(fc):
+    if isinstance(fc, fake_fcurve):
+        return([(fc.loc,), [], [], [], [], []])
+    points = fc.keyframe_points
+    co = [0.0] * (2 * len(points))
+    left = co[:]
+    right = co[:]
+    points.foreach_get("co", co)
+    points.foreach_get("handle_left", left)
+    points.foreach_get("handle_right", right)
+    interpolation = [0] * len(points)
+    easing = interpolation[:]
+    try:
+        points.foreach_get("interpolation", interpolation)
+        points.foreach_get("easing", easing)
+    except (AttributeError, TypeError, RuntimeError):
+        # no bulk access to enum properties
+        interpolation = [kf.interpolation for kf in points]
+        easing = [getattr(kf, "easing", None) for kf in points]
+    modifiers = tuple([get_rna_state(mod) for mod in fc.modifiers])
+    return([(fc.extrapolation, fc.mute, modifiers), co, left, right,
+        interpolation, easing])
+
+
+# get the state of the constraints and drivers a trail depends on, these
+# can change the whole trail
+def get_trail_state(action_ob, child):
+    constraints = [action_ob.constraints]
+    if child:
+        constraints += [pb.constraints for pb in [child] + \
+            list(child.parent_recursive)]
+    state = [tuple([get_rna_state(con) for con in cons]) for cons in \
+        constraints]
+    for fc in action_ob.animation_data.drivers:
+        state.append((fc.data_path, fc.array_index,
+            get_rna_state(fc.driver), get_curve_state(fc)))
+    return(state)
+
+
+# get the frame range in which a curve changed between two states
+def get_changed_range(old, new):
+    if old == new:
+        return(False)
+    if old[0] != new[0]:
+        return([-float("inf"), float("inf")])
+
+    def keys(state):
+        header, co, left, right, interpolation, easing = state
+        return([co[i:i+2] + left[i:i+2] + right[i:i+2] + \
+            [interpolation[i//2], easing[i//2]] for i in range(0, len(co), 2)])
+
+    old_keys = keys(old)
+    new_keys = keys(new)
+    n = min(len(old_keys), len(new_keys))
+    # unchanged keyframes at the start and the end
+    start = 0
+    while start < n and old_keys[start] == new_keys[start]:
+        start += 1
+    end = 0
+    while end < n - start and old_keys[-1 - end] == new_keys[-1 - end]:
+        end += 1
+    # the curve changed between the unchanged keyframes next to the edits,
+    # and up to infinity if the extrapolated first or last one was edited
+    if start:
+        range_min = old_keys[start - 1][0]
+    else:
+        range_min = -float("inf")
+    if end:
+        range_max = old_keys[-end][0]
+    else:
+        range_max = float("inf")
+    return([range_min, range_max])
+
+
+# locations of the trails in worldspace, kept between redraws and only
+# recalculated for the frames affected by edited keyframes
+class trail_cache():
+    def __init__(self):
+        # key: trail key, value: dict with frame as key and location as value
+        self.locations = {}
+        # key: (trail key, curve key), value: state of the curve
+        self.states = {}
+        # key: trail key, value: set with the keys of the curves it uses
+        self.dependencies = {}
+        # key: trail key, value: state of its constraints and drivers
+        self.trail_states = {}
+
+    # remove the locations of the trails of the given objects, for changes
+    # that can't be detected from the curves, like edited rest poses
+    def clear(self, objects):
+        for action_ob, child, offset_ob in objects:
+            if child:
+                display_ob = child
+            else:
+                display_ob = action_ob
+            self.locations.pop(get_trail_key(display_ob, offset_ob), None)
+
+    # remove the locations that changed since the last update
+    def update(self, objects):
+        states = {}
+        ranges = {}
+        for action_ob, child, offset_ob in objects:
+            if not action_ob.animation_data:
+                continue
+            if child:
+                display_ob = child
+            else:
+                display_ob = action_ob
+            trail_key = get_trail_key(display_ob, offset_ob)
+            locations = self.locations.setdefault(trail_key, {})
+            dependencies = get_dependencies(action_ob, child)
+            curve_keys = set([curve_key for curve_key, fc in dependencies])
+            if curve_keys != self.dependencies.get(trail_key):
+                # curves were added or removed
+                locations.clear()
+                self.dependencies[trail_key] = curve_keys
+            trail_state = get_trail_state(action_ob, child)
+            if trail_state != self.trail_states.get(trail_key):
+                locations.clear()
+                self.trail_states[trail_key] = trail_state
+            for curve_key, fc in dependencies:
+                if curve_key not in states:
+                    states[curve_key] = get_curve_state(fc)
+                state = states[curve_key]
+                old = self.states.get((trail_key, curve_key))
+                self.states[(trail_key, curve_key)] = state
+                if not locations:
+                    continue
+                if old is None:
+                    locations.clear()
+                    continue
+                if (curve_key, id(old)) not in ranges:
+                    ranges[(curve_key, id(old))] = get_changed_range(old,
+                        state)
+                changed = ranges[(curve_key, id(old))]
+                if changed:
+                    for frame in [f for f in locations if \
+                    changed[0] <= f <= changed[1]]:
+                        del locations[frame]
+
+    # calculate the missing locations of several trails at once,
+    # requests is a list of [display_ob, offset_ob, curves, frames]
+    def fetch(self, context, requests):
+        bone_frames = {}
+        for display_ob, offset_ob, curves, frames in requests:
+            locations = self.locations.setdefault(get_trail_key(display_ob,
+                offset_ob), {})
+            missing = sorted(set([f for f in frames if f not in locations]))
+            if not missing:
+                continue
+            if offset_ob:
+                for frame in missing:
+                    bone_frames.setdefault(frame, []).append([display_ob,
+                        offset_ob, locations])
+                continue
+            # evaluate each curve over all frames
+            values = [[fc.evaluate(frame) for frame in missing] for fc in \
+                curves]
+            for frame, locx, locy, locz in zip(missing, *values):
+                locations[frame] = mathutils.Vector([locx, locy, locz])
+
+        # change the frame once for all posebones
+        if bone_frames:
+            frame_old = context.scene.frame_current
+            for frame in sorted(bone_frames):
+                context.scene.frame_set(frame)
+                for display_ob, offset_ob, locations in bone_frames[frame]:
+                    locations[frame] = get_current_location(display_ob,
+                        offset_ob)
+            context.scene.frame_set(frame_old)
+
+    # get the location of a trail, calculating it if it isn't cached
+    def location(self, frame, display_ob, offset_ob, curves):
+        locations = self.locations.setdefault(get_trail_key(display_ob,
+            offset_ob), {})
+        if frame not in locations:
+            locations[frame] = get_location(frame, display_ob, offset_ob,
+                curves)
+        return(locations[frame])
+
+
 # get position of keyframes and handles at the start of dragging
-def get_original_animation_data(context, keyframes):
+def get_original_animation_data(context, keyframes, trail_cache):
     keyframes_ori = {}
     handles_ori = {}
 
@@ -215,7 +455,7 @@ def get_original_animation_data(context, keyframes):
         frame_old = context.scene.frame_current
         keyframes_ori[display_ob.name] = {}
         for frame in keyframes[display_ob.name]:
-            loc = get_location(frame, display_ob, offset_ob, curves)
+            loc = trail_cache.location(frame, display_ob, offset_ob, curves)
             keyframes_ori[display_ob.name][frame] = [frame, loc]
 
         # get handle positions
@@ -281,22 +521,56 @@ def calc_callback(self, context):
     if selection_change:
         # value: editbone inverted rotation matrix or None
         self.edit_bones = {}
-    if selection_change or not self.lock or context.window_manager.\
-    motion_trail.force_update:
-        # contains locations of path, keyframes and timebeads
-        self.cached = {"path":{}, "keyframes":{}, "timebeads_timing":{},
-            "timebeads_speed":{}}
-    if self.cached["path"]:
-        use_cache = True
-    else:
-        use_cache = False
+    if selection_change or context.window_manager.motion_trail.clear_cache:
+        # recalculate the trails when they are (re)selected, after a mode
+        # switch or when a setting changed, so edits that the cache can't
+        # detect can still be refreshed
+        self.trail_cache.clear(objects)
     self.perspective = context.region_data.perspective_matrix.copy()
     self.displayed = objects # store, so it can be checked next time
     context.window_manager.motion_trail.force_update = False
+    context.window_manager.motion_trail.clear_cache = False
 
     global_undo = context.user_preferences.edit.use_global_undo
     context.user_preferences.edit.use_global_undo = False
 
+    if context.window_manager.motion_trail.path_before == 0:
+        range_min = context.scene.frame_start
+    else:
+        range_min = max(context.scene.frame_start,
+            context.scene.frame_current - \
+            context.window_manager.motion_trail.path_before)
+    if context.window_manager.motion_trail.path_after == 0:
+        range_max = context.scene.frame_end
+    else:
+        range_max = min(context.scene.frame_end,
+            context.scene.frame_current + \
+            context.window_manager.motion_trail.path_after)
+    step = 11 - context.window_manager.motion_trail.path_resolution
+
+    # remove locations changed by edited keyframes, then calculate the
+    # missing locations of the path and keyframes of all objects at once
+    self.trail_cache.update(objects)
+    requests = []
+    for action_ob, child, offset_ob in objects:
+        if not action_ob.animation_data:
+            continue
+        curves = get_curves(action_ob, child)
+        kf_time = set([kf.co[0] for fc in curves for kf in \
+            fc.keyframe_points])
+        frames = [range_min-1] + list(range(range_min, range_max + 1, step))
+        frames += kf_time
+        if context.window_manager.motion_trail.mode == 'timing' and kf_time:
+            n = context.window_manager.motion_trail.timebeads * (len(kf_time) \
+                - 1)
+            dframe = (range_max - range_min) / (n + 1)
+            frames += [range_min + i * dframe for i in range(1, n+1)]
+        if child:
+            requests.append([child, offset_ob, curves, frames])
+        else:
+            requests.append([action_ob, offset_ob, curves, frames])
+    self.trail_cache.fetch(context, requests)
+
     for action_ob, child, offset_ob in objects:
         if selection_change:
             if not child:
@@ -314,18 +588,6 @@ def calc_callback(self, context):
         if len(curves) == 0:
             continue
 
-        if context.window_manager.motion_trail.path_before == 0:
-            range_min = context.scene.frame_start
-        else:
-            range_min = max(context.scene.frame_start,
-                context.scene.frame_current - \
-                context.window_manager.motion_trail.path_before)
-        if context.window_manager.motion_trail.path_after == 0:
-            range_max = context.scene.frame_end
-        else:
-            range_max = min(context.scene.frame_end,
-                context.scene.frame_current + \
-                context.window_manager.motion_trail.path_after)
         fcx, fcy, fcz = curves
         if child:
             display_ob = child
@@ -336,23 +598,12 @@ def calc_callback(self, context):
         path = []
         speeds = []
         frame_old = context.scene.frame_current
-        step = 11 - context.window_manager.motion_trail.path_resolution
-
-        if not use_cache:
-            if display_ob.name not in self.cached["path"]:
-                self.cached["path"][display_ob.name] = {}
-        if use_cache and range_min-1 in self.cached["path"][display_ob.name]:
-            prev_loc = self.cached["path"][display_ob.name][range_min-1]
-        else:
-            prev_loc = get_location(range_min-1, display_ob, offset_ob, curves)
-            self.cached["path"][display_ob.name][range_min-1] = prev_loc
 
+        prev_loc = self.trail_cache.location(range_min-1, display_ob,
+            offset_ob, curves)
         for frame in range(range_min, range_max + 1, step):
-            if use_cache and frame in self.cached["path"][display_ob.name]:
-                loc = self.cached["path"][display_ob.name][frame]
-            else:
-                loc = get_location(frame, display_ob, offset_ob, curves)
-                self.cached["path"][display_ob.name][frame] = loc
+            loc = self.trail_cache.location(frame, display_ob, offset_ob,
+                curves)
             if not context.region or not context.space_data:
                 continue
             x, y = world_to_screen(context, loc)
@@ -403,9 +654,6 @@ def calc_callback(self, context):
         handle_difs = {}
         kf_time = []
         click = []
-        if not use_cache:
-            if display_ob.name not in self.cached["keyframes"]:
-                self.cached["keyframes"][display_ob.name] = {}
 
         for fc in curves:
             for kf in fc.keyframe_points:
@@ -426,12 +674,8 @@ def calc_callback(self, context):
                 kf_time.append(kf.co[0])
                 co = kf.co[0]
 
-                if use_cache and co in \
-                self.cached["keyframes"][display_ob.name]:
-                    loc = self.cached["keyframes"][display_ob.name][co]
-                else:
-                    loc = get_location(co, display_ob, offset_ob, curves)
-                    self.cached["keyframes"][display_ob.name][co] = loc
+                loc = self.trail_cache.location(co, display_ob, offset_ob,
+                    curves)
                 if handle_difs:
                     handle_difs[co]["keyframe_loc"] = loc
 
@@ -460,8 +704,8 @@ def calc_callback(self, context):
                 if vecs["keyframe_loc"] != None:
                     vec_keyframe = vecs["keyframe_loc"]
                 else:
-                    vec_keyframe = get_location(frame, display_ob, offset_ob,
-                        curves)
+                    vec_keyframe = self.trail_cache.location(frame,
+                        display_ob, offset_ob, curves)
                 x_left, y_left = world_to_screen(context, vec_left*2 + \
                     vec_keyframe)
                 x_right, y_right = world_to_screen(context, vec_right*2 + \
@@ -480,20 +724,11 @@ def calc_callback(self, context):
             n = context.window_manager.motion_trail.timebeads * (len(kf_time) \
                 - 1)
             dframe = (range_max - range_min) / (n + 1)
-            if not use_cache:
-                if display_ob.name not in self.cached["timebeads_timing"]:
-                    self.cached["timebeads_timing"][display_ob.name] = {}
 
             for i in range(1, n+1):
                 frame = range_min + i * dframe
-                if use_cache and frame in \
-                self.cached["timebeads_timing"][display_ob.name]:
-                    loc = self.cached["timebeads_timing"][display_ob.name]\
-                        [frame]
-                else:
-                    loc = get_location(frame, display_ob, offset_ob, curves)
-                    self.cached["timebeads_timing"][display_ob.name][frame] = \
-                        loc
+                loc = self.trail_cache.location(frame, display_ob, offset_ob,
+                    curves)
                 x, y = world_to_screen(context, loc)
                 timebeads[frame] = [x, y]
                 click.append([frame, "timebead", mathutils.Vector([x,y]),
@@ -520,9 +755,6 @@ def calc_callback(self, context):
                             angles[kf.co[0]]["right"].append(angle)
             timebeads = {}
             kf_time.sort()
-            if not use_cache:
-                if display_ob.name not in self.cached["timebeads_speed"]:
-                    self.cached["timebeads_speed"][display_ob.name] = {}
 
             for frame, sides in angles.items():
                 if sides["left"]:
@@ -531,15 +763,8 @@ def calc_callback(self, context):
                     perc = max(0.4, min(1, perc * 5))
                     previous = kf_time[kf_time.index(frame) - 1]
                     bead_frame = frame - perc * ((frame - previous - 2) / 2)
-                    if use_cache and bead_frame in \
-                    self.cached["timebeads_speed"][display_ob.name]:
-                        loc = self.cached["timebeads_speed"][display_ob.name]\
-                            [bead_frame]
-                    else:
-                        loc = get_location(bead_frame, display_ob, offset_ob,
-                            curves)
-                        self.cached["timebeads_speed"][display_ob.name]\
-                            [bead_frame] = loc
+                    loc = self.trail_cache.location(bead_frame, display_ob,
+                        offset_ob, curves)
                     x, y = world_to_screen(context, loc)
                     timebeads[bead_frame] = [x, y]
                     click.append([bead_frame, "timebead", mathutils.\
@@ -550,15 +775,8 @@ def calc_callback(self, context):
                     perc = max(0.4, min(1, perc * 5))
                     next = kf_time[kf_time.index(frame) + 1]
                     bead_frame = frame + perc * ((next - frame - 2) / 2)
-                    if use_cache and bead_frame in \
-                    self.cached["timebeads_speed"][display_ob.name]:
-                        loc = self.cached["timebeads_speed"][display_ob.name]\
-                            [bead_frame]
-                    else:
-                        loc = get_location(bead_frame, display_ob, offset_ob,
-                            curves)
-                        self.cached["timebeads_speed"][display_ob.name]\
-                            [bead_frame] = loc
+                    loc = self.trail_cache.location(bead_frame, display_ob,
+                        offset_ob, curves)
                     x, y = world_to_screen(context, loc)
                     timebeads[bead_frame] = [x, y]
                     click.append([bead_frame, "timebead", mathutils.\
@@ -1378,7 +1596,8 @@ class MotionTrailOperator(bpy.types.Operator):
                     self.active_keyframe = self.active_frame
                     self.active_frame = False
                 self.keyframes_ori, self.handles_ori = \
-                    get_original_animation_data(context, self.keyframes)
+                    get_original_animation_data(context, self.keyframes,
+                    self.trail_cache)
                 self.drag_mouse_ori = mathutils.Vector([event.mouse_region_x,
                     event.mouse_region_y])
                 self.drag = True
@@ -1541,8 +1760,7 @@ class MotionTrailOperator(bpy.types.Operator):
                 self.displayed = []
                 context.window_manager.motion_trail.force_update = True
                 context.window_manager.motion_trail.handle_type_enabled = False
-                self.cached = {"path":{}, "keyframes":{},
-                    "timebeads_timing":{}, "timebeads_speed":{}}
+                self.trail_cache = trail_cache()
 
                 for kmi in kmis:
                     kmi.active = False
@@ -1644,6 +1862,7 @@ class MotionTrailPanel(bpy.types.Panel):
 class MotionTrailProps(bpy.types.PropertyGroup):
     def internal_update(self, context):
         context.window_manager.motion_trail.force_update = True
+        context.window_manager.motion_trail.clear_cache = True
         if context.area:
             context.area.tag_redraw()
 
@@ -1654,6 +1873,10 @@ class MotionTrailProps(bpy.types.PropertyGroup):
         description="Force calc_callback to fully execute",
         default=False)
 
+    clear_cache = bpy.props.BoolProperty(name="internal use",
+        description="Force calc_callback to recalculate all locations",
+        default=False)
+
     handle_type_enabled = bpy.props.BoolProperty(default=False)
     handle_type_frame = bpy.props.FloatProperty()
     handle_type_side = bpy.props.StringProperty()
@@ -38,15 +38,18 @@ bl_info = {
 if 'bpy' in locals():
     import importlib
     library = importlib.reload(library)
+    cache = importlib.reload(cache)
     download = importlib.reload(download)
     makehuman = importlib.reload(makehuman)
     initialize_subjects = importlib.reload(initialize_subjects)
     update_motions = importlib.reload(update_motions)
 else:
     from . import library
+    from . import cache
     from . import download
     from . import makehuman
-    from .data import initialize_subjects, update_motions
+    from .data import initialize_subjects, update_motions, \
+        mocap_cache, subject_path
 
 import os
 import bpy
@@ -71,12 +74,10 @@ class CMUMocapSubjectBrowser(bpy.types.Panel):
             sidx = cml.subject_list[cml.subject_active].idx
             remote_fname = library.skeleton_url.format(sidx)
             tid = "{0:02d}".format(sidx)
-            local_path = os.path.expanduser(cml.local_storage)
-            if cml.follow_structure:
-                local_path = os.path.join(local_path, tid)
-            local_fname = os.path.join(local_path, tid + ".asf")
+            local_fname = os.path.join(subject_path(cml, sidx), tid + ".asf")
+            mc = mocap_cache(cml)
             do_import = False
-            if os.path.exists(local_fname):
+            if mc.is_cached(local_fname):
                 label = "Import Selected"
                 do_import = True
             elif cml.automatically_import:
@@ -89,6 +90,12 @@ class CMUMocapSubjectBrowser(bpy.types.Panel):
             props.remote_file = remote_fname
             props.local_file = local_fname
             props.do_import = do_import
+            layout.operator("mocap.prefetch_subject",
+                            text="Download All Motions",
+                            icon='FILE_REFRESH').subject = sidx
+            pending = mc.pending()
+            if pending:
+                layout.label("Downloading {0:d} files.".format(pending))
 
 
 class CMUMocapMotionBrowser(bpy.types.Panel):
@@ -102,13 +109,14 @@ class CMUMocapMotionBrowser(bpy.types.Panel):
     def draw(self, context):
         layout = self.layout
         cml = context.user_preferences.addons['cmu_mocap_browser'].preferences
+        layout.prop(cml, "search_text", icon='VIEWZOOM')
         layout.template_list("UI_UL_list", "MB", cml, "motion_list",
             cml, "motion_active")
         if cml.motion_active == -1:
             return
-        sidx = cml.subject_list[cml.subject_active].idx
+        sidx = cml.motion_list[cml.motion_active].sidx
         midx = cml.motion_list[cml.motion_active].idx
-        motion = library.subjects[sidx]['motions'][midx]
+        motion = library.subjects()[sidx]['motions'][midx]
         fps = motion['fps']
         ifps = fps // cml.frame_skip
         row = layout.row()
@@ -117,10 +125,8 @@ class CMUMocapMotionBrowser(bpy.types.Panel):
         layout.prop(cml, "frame_skip")
         layout.prop(cml, "cloud_scale")
         remote_fname = library.motion_url.format(sidx, midx)
-        tid = "{0:02d}".format(sidx)
-        local_path = os.path.expanduser(cml.local_storage)
-        if cml.follow_structure:
-            local_path = os.path.join(local_path, tid)
+        local_path = subject_path(cml, sidx)
+        mc = mocap_cache(cml)
         for target, icon, ext in (
                 ('Motion Data', 'POSE_DATA', 'amc'),
                 ('Marker Cloud', 'EMPTY_DATA', 'c3d'),
@@ -129,7 +135,7 @@ class CMUMocapMotionBrowser(bpy.types.Panel):
             fname = "{0:02d}_{1:02d}.{2}".format(sidx, midx, ext)
             local_fname = os.path.join(local_path, fname)
             do_import = False
-            if os.path.exists(local_fname):
+            if mc.is_cached(local_fname):
                 label = "{0} {1}".format(action, target)
                 do_import = True
             elif cml.automatically_import:
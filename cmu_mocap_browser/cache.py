@@ -0,0 +1,293 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 3
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# <pep8-80 compliant>
+
+# Local cache of the downloaded library files.
+# Every complete file is recorded in a manifest with its size and hash, so
+# truncated or damaged files are not taken for cached ones. Downloads run in
+# a bounded pool of worker threads, resume from partial files with range
+# requests, and the least recently used files are evicted above a size cap.
+
+import os
+import json
+import time
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.request import Request, urlopen
+from urllib.error import HTTPError
+
+MANIFEST = "manifest.json"
+PART = ".part"
+CHUNK_SIZE = 64 * 2 ** 10
+
+
+def file_hash(path):
+    h = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for data in iter(lambda: f.read(CHUNK_SIZE), b''):
+            h.update(data)
+    return h.hexdigest()
+
+
+def _content_range(headers):
+    """
+        Returns (first byte, total size) of a Content-Range header,
+        with None for unknown values
+    """
+    value = headers.get("Content-Range", "")
+    if not value.startswith("bytes "):
+        return None, None
+    span, total = value[6:].split("/")
+    first = None if span == "*" else int(span.split("-")[0])
+    return first, None if total == "*" else int(total)
+
+
+class Download:
+    """
+        Progress of one download, shared with the worker thread
+    """
+
+    def __init__(self, url, path):
+        self.url = url
+        self.path = path
+        self.size = 0  # expected size, 0 while unknown
+        self.received = 0
+        self.error = None
+        self.cancelled = False
+        self.future = None
+
+    def done(self):
+        return self.future.done()
+
+    def succeeded(self):
+        return self.done() and self.error is None and not self.cancelled
+
+    def cancel(self):
+        """
+            Stops the download, the partial file is kept to be resumed
+        """
+        self.cancelled = True
+
+
+class MocapCache:
+    def __init__(self, root, max_size, workers=4, timeout=30):
+        self.root = root
+        self.max_size = max_size
+        self.timeout = timeout
+        self.lock = threading.Lock()
+        self.pool = ThreadPoolExecutor(max_workers=max(1, workers))
+        self.workers = workers
+        self.downloads = {}
+        self.manifest = {}
+        try:
+            with open(os.path.join(root, MANIFEST), 'rt') as f:
+                self.manifest = json.load(f)
+        except (OSError, ValueError):
+            pass
+
+    def key(self, path):
+        return os.path.relpath(os.path.abspath(path), self.root)
+
+    def save(self):
+        """
+            Writes the manifest, call with the lock held
+        """
+        os.makedirs(self.root, exist_ok=True)
+        manifest_path = os.path.join(self.root, MANIFEST)
+        with open(manifest_path + PART, 'wt') as f:
+            json.dump(self.manifest, f, indent=0, sort_keys=True)
+        os.replace(manifest_path + PART, manifest_path)
+
+    def is_cached(self, path):
+        """
+            A file is cached if it is in the manifest with its current size
+        """
+        entry = self.manifest.get(self.key(path))
+        try:
+            return entry is not None and \
+                os.path.getsize(path) == entry["size"]
+        except OSError:
+            return False
+
+    def verify(self, path):
+        """
+            Checks the hash of a cached file, damaged files are dropped
+        """
+        key = self.key(path)
+        entry = self.manifest.get(key)
+        if entry is None or not self.is_cached(path):
+            return False
+        if file_hash(path) == entry["sha1"]:
+            return True
+        with self.lock:
+            self.manifest.pop(key, None)
+            self.save()
+        os.unlink(path)
+        return False
+
+    def touch(self, path):
+        """
+            Marks a cached file as used, for the eviction order
+        """
+        with self.lock:
+            entry = self.manifest.get(self.key(path))
+            if entry is not None:
+                entry["used"] = time.time()
+                self.save()
+
+    def pending(self):
+        """
+            Returns the number of queued or running downloads
+        """
+        with self.lock:
+            return sum(1 for d in self.downloads.values() if not d.done())
+
+    def fetch(self, url, path):
+        """
+            Starts downloading url to path, unless it is already running.
+            Returns the Download.
+        """
+        path = os.path.abspath(path)
+        with self.lock:
+            download = self.downloads.get(path)
+            if download is not None and not download.done():
+                return download
+            download = Download(url, path)
+            self.downloads[path] = download
+            download.future = self.pool.submit(self._run, download)
+        return download
+
+    def prefetch(self, files):
+        """
+            Queues all (url, path) of files that are not cached yet.
+            Returns the list of Download.
+        """
+        return [self.fetch(url, path) for url, path in files
+                if not self.is_cached(path)]
+
+    def _run(self, download):
+        try:
+            self._download(download)
+        except Exception as ex:
+            download.error = ex
+
+    def _download(self, download):
+        path = download.path
+        part = path + PART
+        key = self.key(path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        if os.path.exists(path) and not self.is_cached(path):
+            # unknown or truncated file, resume from it
+            with self.lock:
+                self.manifest.pop(key, None)
+            os.replace(path, part)
+
+        offset = os.path.getsize(part) if os.path.exists(part) else 0
+        request = Request(download.url)
+        if offset:
+            request.add_header("Range", "bytes={:d}-".format(offset))
+        try:
+            src = urlopen(request, timeout=self.timeout)
+        except HTTPError as ex:
+            first, total = _content_range(ex.headers)
+            if ex.code != 416 or not offset:
+                raise
+            if total == offset:
+                # the partial file is already complete
+                src = None
+            else:
+                os.unlink(part)
+                return self._download(download)
+
+        if src is not None:
+            with src:
+                first, total = _content_range(src.headers)
+                if offset and src.getcode() == 206 and first == offset:
+                    mode = 'ab'
+                else:
+                    offset = 0
+                    mode = 'wb'
+                    length = src.headers.get("Content-Length")
+                    total = int(length) if length else None
+                download.size = total or 0
+                download.received = offset
+                with open(part, mode) as out:
+                    while not download.cancelled:
+                        data = src.read(CHUNK_SIZE)
+                        if not data:
+                            break
+                        out.write(data)
+                        download.received += len(data)
+            if download.cancelled:
+                return
+            if total is not None and download.received != total:
+                raise IOError("Download of {} ended after {:d} of {:d} "
+                              "bytes".format(download.url,
+                                             download.received, total))
+        size = os.path.getsize(part)
+        download.size = download.received = size
+        sha1 = file_hash(part)
+        os.replace(part, path)
+        with self.lock:
+            self.manifest[key] = {
+                "url": download.url, "size": size, "sha1": sha1,
+                "used": time.time()}
+            self.evict(keep=key)
+            self.save()
+
+    def evict(self, keep=None):
+        """
+            Removes the least recently used files above the size cap,
+            call with the lock held
+        """
+        total = sum(entry["size"] for entry in self.manifest.values())
+        if total <= self.max_size:
+            return
+        busy = set(self.key(d.path) for d in self.downloads.values()
+                   if not d.done())
+        for key, entry in sorted(self.manifest.items(),
+                                 key=lambda item: item[1]["used"]):
+            if total <= self.max_size:
+                break
+            if key == keep or key in busy:
+                continue
+            try:
+                os.unlink(os.path.join(self.root, key))
+            except OSError:
+                pass
+            del self.manifest[key]
+            total -= entry["size"]
+
+
+_caches = {}
+
+
+def get_cache(root, max_size, workers):
+    """
+        Returns the cache of the local storage at root, shared by all
+        operators and panels
+    """
+    root = os.path.abspath(root)
+    cache = _caches.get(root)
+    if cache is None or cache.workers != workers:
+        cache = MocapCache(root, max_size, workers)
+        _caches[root] = cache
+    cache.max_size = max_size
+    return cache
@@ -16,8 +16,10 @@
 #
 # ##### END GPL LICENSE BLOCK #####
 
+import os
 import bpy
 from . import library
+from . import cache
 
 
 def initialize_subjects(context):
@@ -28,34 +30,62 @@ def initialize_subjects(context):
     if hasattr(cml, 'initialized'):
         return
     cml.initialized = True
-    while cml.subject_list:
-        cml.subject_list.remove(0)
-    for k, v in library.subjects.items():
+    subjects = library.subjects()
+    keys = sorted(subjects)
+    cml.subject_list.clear()
+    for k in keys:
         n = cml.subject_list.add()
-        n.name = "{:d} - {}".format(k, v['desc'])
-        n.idx = k
+        n.name = "{:d} - {}".format(k, subjects[k]['desc'])
+    cml.subject_list.foreach_set("idx", keys)
 
 
 def update_motions(obj, context):
     """
-        Updates the motion list after a subject is selected
+        Updates the motion list after a subject is selected or the search
+        text changed
     """
-    sidx = -1
-    if obj.subject_active != -1:
+    subjects = library.subjects()
+    if obj.search_text:
+        motions = library.search(obj.search_text)
+        fmt = "{0:02d}_{1:02d} - {2}"
+    elif obj.subject_active != -1:
         sidx = obj.subject_list[obj.subject_active].idx
-    while obj.motion_list:
-        obj.motion_list.remove(0)
-    if sidx != -1:
-        for k, v in library.subjects[sidx]["motions"].items():
-            n = obj.motion_list.add()
-            n.name = "{:d} - {}".format(k, v["desc"])
-            n.idx = k
-        obj.motion_active = -1
+        motions = [(sidx, k) for k in sorted(subjects[sidx]["motions"])]
+        fmt = "{1:d} - {2}"
+    else:
+        motions = []
+    obj.motion_list.clear()
+    for sidx, midx in motions:
+        n = obj.motion_list.add()
+        n.name = fmt.format(sidx, midx,
+                            subjects[sidx]["motions"][midx]["desc"])
+    obj.motion_list.foreach_set("sidx", [sidx for sidx, midx in motions])
+    obj.motion_list.foreach_set("idx", [midx for sidx, midx in motions])
+    obj.motion_active = -1
+
+
+def subject_path(cml, sidx):
+    """
+        Returns the folder where the files of a subject are stored
+    """
+    local_path = os.path.expanduser(cml.local_storage)
+    if cml.follow_structure:
+        local_path = os.path.join(local_path, "{0:02d}".format(sidx))
+    return local_path
+
+
+def mocap_cache(cml):
+    """
+        Returns the download cache of the local storage
+    """
+    return cache.get_cache(os.path.expanduser(cml.local_storage),
+                           cml.cache_size * 2 ** 20, cml.download_workers)
 
 
 class ListItem(bpy.types.PropertyGroup):
     name = bpy.props.StringProperty()
     idx = bpy.props.IntProperty()
+    sidx = bpy.props.IntProperty()
 
 
 class CMUMocapLib(bpy.types.AddonPreferences):
@@ -77,6 +107,17 @@ class CMUMocapLib(bpy.types.AddonPreferences):
         description="Import the resource after the download is finished",
         default=True
         )
+    cache_size = bpy.props.IntProperty(
+        name="Cache Size (MB)",
+        description="Remove the least recently used downloads when the "
+                    "local storage grows beyond this size",
+        default=2048, min=1
+        )
+    download_workers = bpy.props.IntProperty(
+        name="Parallel Downloads",
+        description="Maximum number of files downloaded at the same time",
+        default=4, min=1, max=16
+        )
     subject_list = bpy.props.CollectionProperty(
         name="subjects", type=ListItem
         )
@@ -88,6 +129,11 @@ class CMUMocapLib(bpy.types.AddonPreferences):
         description="Identifier of the imported subject's armature",
         default="Skeleton"
         )
+    search_text = bpy.props.StringProperty(
+        name="Search",
+        description="List the motions of all subjects matching these words",
+        update=update_motions
+        )
     motion_list = bpy.props.CollectionProperty(
         name="motions", type=ListItem
         )
@@ -123,4 +169,6 @@ class CMUMocapLib(bpy.types.AddonPreferences):
         layout.prop(self, "local_storage")
         layout.prop(self, "follow_structure")
         layout.prop(self, "automatically_import")
+        layout.prop(self, "cache_size")
+        layout.prop(self, "download_workers")
 
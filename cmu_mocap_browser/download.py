@@ -21,16 +21,30 @@ import bpy
 import bgl
 import blf
 import math
+from . import library
+from .data import mocap_cache, subject_path
+
+
+def human_size(size):
+    m = int(math.log10(max(size, 1)) // 3)
+    return "{:.1f}{}".format(
+        size * math.pow(10, -m * 3),
+        ['b', 'Kb', 'Mb', 'Gb', 'Tb', 'Eb', 'Pb'][m])  # :-p
 
 
 def draw_callback(self, context):
-    mid = int(360 * self.recv / self.fsize)
+    recv = self.download.received
+    fsize = self.download.size
+    mid = int(360 * recv / fsize) if fsize else 0
     cx = 200
     cy = 30
     blf.position(0, 230, 23, 0)
     blf.size(0, 20, 72)
-    blf.draw(0, "{0:2d}% of {1}".format(
-        100 * self.recv // self.fsize, self.hfsize))
+    if fsize:
+        blf.draw(0, "{0:2d}% of {1}".format(
+            100 * recv // fsize, human_size(fsize)))
+    else:
+        blf.draw(0, human_size(recv))
 
     bgl.glEnable(bgl.GL_BLEND)
     bgl.glColor4f(.7, .7, .7, 0.8)
@@ -55,6 +69,34 @@ def draw_callback(self, context):
     bgl.glColor4f(0.0, 0.0, 0.0, 1.0)
 
 
+class CMUMocapPrefetchSubject(bpy.types.Operator):
+    bl_idname = "mocap.prefetch_subject"
+    bl_label = "Download the skeleton and all motions of a subject"
+
+    subject = bpy.props.IntProperty(
+        name="Subject",
+        description="Subject whose files are downloaded in the background")
+
+    def execute(self, context):
+        cml = context.user_preferences.addons['cmu_mocap_browser'].preferences
+        local_path = subject_path(cml, self.subject)
+        files = [(library.skeleton_url.format(self.subject),
+                  os.path.join(local_path,
+                               "{0:02d}.asf".format(self.subject)))]
+        motions = library.subjects()[self.subject]['motions']
+        for midx in sorted(motions):
+            if 'amc' not in motions[midx]['files']:
+                continue
+            files.append((
+                library.motion_url.format(self.subject, midx) + "amc",
+                os.path.join(local_path, "{0:02d}_{1:02d}.amc".format(
+                    self.subject, midx))))
+        queued = mocap_cache(cml).prefetch(files)
+        self.report({'INFO'}, "Downloading {0:d} of {1:d} files.".format(
+            len(queued), len(files)))
+        return {'FINISHED'}
+
+
 class CMUMocapDownloadImport(bpy.types.Operator):
     bl_idname = "mocap.download_import"
     bl_label = "Download and Import a file"
@@ -71,62 +113,43 @@ class CMUMocapDownloadImport(bpy.types.Operator):
         default=False)
 
     timer = None
-    fout = None
-    src = None
-    fsize = 0
-    recv = 0
+    download = None
     cloud_scale = 1
 
     def modal(self, context, event):
         context.area.tag_redraw()
         if event.type == 'ESC':
-            self.fout.close()
-            os.unlink(self.local_file)
+            # the partial file is kept and resumed by the next download
+            self.download.cancel()
+            return self.cancel(context)
+        if event.type == 'TIMER' and self.download.done():
             return self.cancel(context)
-        if event.type == 'TIMER':
-            to_read = min(self.fsize - self.recv, 100 * 2 ** 10)
-            data = self.src.read(to_read)
-            self.fout.write(data)
-            self.recv += to_read
-            if self.fsize == self.recv:
-                self.fout.close()
-                return self.cancel(context)
         return {'PASS_THROUGH'}
 
     def cancel(self, context):
         context.window_manager.event_timer_remove(self.timer)
         bpy.types.SpaceView3D.draw_handler_remove(self.handle, 'WINDOW')
         cml = context.user_preferences.addons['cmu_mocap_browser'].preferences
-        if os.path.exists(self.local_file):
+        if self.download.succeeded():
             return self.import_or_open(cml)
+        if self.download.error is not None:
+            self.report({'ERROR'}, "Download of {0} failed: {1}".format(
+                self.remote_file, self.download.error))
         return {'CANCELLED'}
 
     def execute(self, context):
         cml = context.user_preferences.addons['cmu_mocap_browser'].preferences
-        if not os.path.exists(self.local_file):
-            try:
-                os.makedirs(os.path.split(self.local_file)[0])
-            except:
-                pass
-            from urllib.request import urlopen
-            self.src = urlopen(self.remote_file)
-            info = self.src.info()
-            self.fsize = int(info["Content-Length"])
-            m = int(math.log10(self.fsize) // 3)
-            self.hfsize = "{:.1f}{}".format(
-                self.fsize * math.pow(10, -m * 3),
-                ['b', 'Kb', 'Mb', 'Gb', 'Tb', 'Eb', 'Pb'][m])  # :-p
-            self.fout = open(self.local_file, 'wb')
-            self.recv = 0
-            self.handle = bpy.types.SpaceView3D.draw_handler_add(
-                draw_callback, (self, context), 'WINDOW', 'POST_PIXEL')
-            self.timer = context.window_manager.\
-                event_timer_add(0.001, context.window)
-            context.window_manager.modal_handler_add(self)
-            return {'RUNNING_MODAL'}
-        else:
-            self.import_or_open(cml)
-        return {'FINISHED'}
+        mc = mocap_cache(cml)
+        if mc.verify(self.local_file):
+            mc.touch(self.local_file)
+            return self.import_or_open(cml)
+        self.download = mc.fetch(self.remote_file, self.local_file)
+        self.handle = bpy.types.SpaceView3D.draw_handler_add(
+            draw_callback, (self, context), 'WINDOW', 'POST_PIXEL')
+        self.timer = context.window_manager.\
+            event_timer_add(0.05, context.window)
+        context.window_manager.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
 
     def import_or_open(self, cml):
         if cml.automatically_import or self.do_import:
@@ -17,6 +17,7 @@
 # ##### END GPL LICENSE BLOCK #####
 
 import bpy
+import time
 from mathutils import Matrix, Quaternion
 from math import radians
 
@@ -31,6 +32,11 @@ lfoot LegIK_L
 """.splitlines()]
 
 
+# (property, index) of the keyed channels of the bound bones
+channels = [('location', i) for i in range(3)] + \
+    [('rotation_quaternion', i) for i in range(4)]
+
+
 T_pose_align = [d.split() for d in """\
 clavicle UpArmRot 
 humerus LoArm 
@@ -203,30 +209,161 @@ class CMUMocapTransferer(bpy.types.Operator):
             St = Sr.Translation(S.translation)
             self.inverses[db] = Sr.inverted() * St.inverted() * D
 
+        # parents are posed before their children
+        DPB = self.dst.pose.bones
+        self.bindings = sorted(
+            bindings, key=lambda b: len(DPB[b[1]].parent_recursive))
+        # rest matrices relative to the parent
+        self.rest = {}
+        for pb in DPB:
+            bone = pb.bone
+            if bone.parent:
+                self.rest[pb.name] = \
+                    bone.parent.matrix_local.inverted() * bone.matrix_local
+            else:
+                self.rest[pb.name] = bone.matrix_local.copy()
+        # like the pose operators used before, the transfer is done with
+        # the location and rotation of all other bones cleared
+        bound = set(db for sb, db in bindings)
+        self.unbound = [pb.name for pb in DPB if pb.name not in bound]
+        self.clear_unbound()
+        self.frames = []
+        self.keys = dict((db, []) for sb, db in bindings)
+
+    def find_constrained(self):
+        """
+            Finds the bound bones with a constrained parent chain, these
+            need the evaluated pose of their parent
+        """
+        DPB = self.dst.pose.bones
+        self.constrained = set(
+            db for sb, db in bindings
+            if any(not c.mute for p in DPB[db].parent_recursive
+                   for c in p.constraints))
+
+    def clear_unbound(self):
+        DPB = self.dst.pose.bones
+        for name in self.unbound:
+            pb = DPB[name]
+            pb.location = (0, 0, 0)
+            pb.rotation_quaternion = (1, 0, 0, 0)
+            pb.rotation_euler = (0, 0, 0)
+            pb.rotation_axis_angle = (0, 0, 1, 0)
+
+    def evaluated_parent(self, pb, values):
+        """
+            Returns the evaluated pose matrix of the parent of a
+            destination bone, with the bound bones posed so far set to
+            their values of this frame
+        """
+        DPB = self.dst.pose.bones
+        if not self.cleared:
+            # frame_set evaluated the animation of the other bones
+            self.clear_unbound()
+            self.cleared = True
+        for db, (loc, rot) in values.items():
+            DPB[db].location = loc
+            DPB[db].rotation_quaternion = rot
+        bpy.context.scene.update()  # recalculate constraints
+        return pb.parent.matrix
+
+    def parent_matrix(self, pb, poses):
+        """
+            Returns the pose matrix of the parent of a destination bone,
+            following the bound bones posed in this frame
+        """
+        parent = pb.parent
+        if parent is None:
+            return Matrix()
+        if parent.name in poses:
+            return poses[parent.name]
+        # unbound bones only keep their scale
+        scale = parent.scale
+        basis = Matrix.Scale(scale[0], 4, (1, 0, 0)) * \
+            Matrix.Scale(scale[1], 4, (0, 1, 0)) * \
+            Matrix.Scale(scale[2], 4, (0, 0, 1))
+        M = self.parent_matrix(parent, poses) * \
+            self.rest[parent.name] * basis
+        poses[parent.name] = M
+        return M
+
     def transfer_pose(self, frame):
-        bpy.ops.object.mode_set(mode='POSE')
-        bpy.ops.pose.select_all(action='SELECT')
-        bpy.ops.pose.rot_clear()
-        bpy.ops.pose.loc_clear()
-        for sb, db in bindings:
-            self.dst.data.bones.active = self.dst.data.bones[db]
-            S = self.src.pose.bones[sb].matrix
-            S = self.src.matrix_world * self.src.pose.bones[sb].matrix
-            self.dst.pose.bones[db].matrix = S * self.inverses[db]
-            self.dst.pose.bones[db].keyframe_insert('rotation_quaternion', -1, frame, db)
-            self.dst.pose.bones[db].keyframe_insert('location', -1, frame, db)
-            bpy.context.scene.update()  # recalculate constraints
+        """
+            Computes the channels of the bound bones from the evaluated
+            source pose, the keyframes are written by write_keyframes
+        """
+        SMW = self.src.matrix_world
+        SPB = self.src.pose.bones
+        DPB = self.dst.pose.bones
+        poses = {}
+        values = {}
+        self.cleared = False
+        for sb, db in self.bindings:
+            M = SMW * SPB[sb].matrix * self.inverses[db]
+            if db in self.constrained:
+                P = self.evaluated_parent(DPB[db], values)
+            else:
+                P = self.parent_matrix(DPB[db], poses)
+            P = P * self.rest[db]
+            poses[db] = M
+            loc, rot, scale = (P.inverted() * M).decompose()
+            values[db] = loc, rot
+            self.keys[db].extend(loc)
+            self.keys[db].extend(rot)
+        self.frames.append(frame)
         # get locrot of fk bones and locally set them
         # ... TODO
-#        bpy.ops.anim.keyframe_insert_menu(type='BUILTIN_KSI_LocRot')
+
+    def write_keyframes(self):
+        """
+            Adds the transferred frames to the F-curves of the destination,
+            replacing the keyframes they had in that range
+        """
+        if not self.frames:
+            return
+        dst = self.dst
+        if dst.animation_data is None:
+            dst.animation_data_create()
+        action = dst.animation_data.action
+        if action is None:
+            action = bpy.data.actions.new(dst.name + "Action")
+            dst.animation_data.action = action
+        fcurves = dict(((fc.data_path, fc.array_index), fc)
+                       for fc in action.fcurves)
+        first, last = self.frames[0], self.frames[-1]
+        count = len(self.frames)
+        for db, values in self.keys.items():
+            for c, (prop, index) in enumerate(channels):
+                data_path = 'pose.bones["{}"].{}'.format(db, prop)
+                fc = fcurves.get((data_path, index))
+                if fc is None:
+                    fc = action.fcurves.new(data_path, index, db)
+                points = fc.keyframe_points
+                co = [0.] * (2 * len(points))
+                points.foreach_get("co", co)
+                for i in reversed(range(len(points))):
+                    if first <= co[2 * i] <= last:
+                        points.remove(points[i], fast=True)
+                co = [0.] * (2 * len(points))
+                points.foreach_get("co", co)
+                new = [0.] * (2 * count)
+                new[0::2] = self.frames
+                new[1::2] = values[c::len(channels)]
+                points.add(count)
+                points.foreach_set("co", co + new)
+                fc.update()
 
     def modal(self, context, event):
         if event.type == 'ESC':
             return self.cancel(context)
         if event.type == 'TIMER':
-            context.scene.frame_set(self.frame)
-            self.transfer_pose(self.frame)
-            self.frame += 1
+            # transfer as many frames as fit in a tick, keeping the
+            # interface responsive
+            tick = time.time() + .1
+            while self.frame <= self.end_frame and time.time() < tick:
+                context.scene.frame_set(self.frame)
+                self.transfer_pose(self.frame)
+                self.frame += 1
             if self.frame > self.end_frame:
                 return self.cancel(context)
         return {'PASS_THROUGH'}
@@ -285,15 +422,26 @@ class CMUMocapTransferer(bpy.types.Operator):
         bpy.ops.mhx.toggle_fk_ik(toggle="MhaArmIk_R 1 18 19")
         bpy.ops.mhx.toggle_fk_ik(toggle="MhaLegIk_L 1 4 5")
         bpy.ops.mhx.toggle_fk_ik(toggle="MhaLegIk_R 1 20 21")
+        self.find_constrained()
 
-        self.frame, self.end_frame = self.src.animation_data.action.frame_range
+        frame_range = self.src.animation_data.action.frame_range
+        self.frame, self.end_frame = (int(f) for f in frame_range)
+        self.start_time = time.time()
         context.window_manager.modal_handler_add(self)
         self.timer = context.window_manager.\
             event_timer_add(0.001, context.window)
         return {'RUNNING_MODAL'}
 
     def cancel(self, context):
-        bpy.context.scene.frame_set(bpy.context.scene.frame_current)
         context.window_manager.event_timer_remove(self.timer)
+        self.write_keyframes()
+        bpy.context.scene.frame_set(bpy.context.scene.frame_current)
         bpy.ops.object.mode_set(mode='OBJECT')
+        if not self.frames:
+            return {'CANCELLED'}
+        elapsed = time.time() - self.start_time
+        self.report({'INFO'}, "Transferred {0:d} frames in {1:.1f}s "
+                    "({2:.1f} fps).".format(len(self.frames), elapsed,
+                                            len(self.frames) / elapsed))
+        return {'FINISHED'}
 
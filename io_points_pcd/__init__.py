@@ -32,8 +32,12 @@ bl_info = {
 
 if "bpy" in locals():
     import imp
+    imp.reload(pcdparser)
+    imp.reload(voxelgrid)
     imp.reload(pcd_utils)
 else:
+    from . import pcdparser
+    from . import voxelgrid
     from . import pcd_utils
 
 import itertools
@@ -61,17 +65,95 @@ class ImportPCD(bpy.types.Operator, ImportHelper):
 
     directory = StringProperty(subtype='DIR_PATH')
 
+    use_array_reader = BoolProperty(name="Fast Reader",
+                          description="Read points into packed arrays, "
+                                      "extra fields are imported as "
+                                      "vertex data layers",
+                          default=True)
+
+    use_stream = BoolProperty(name="Decimate",
+                          description="Stream the file in blocks and import "
+                                      "a voxel grid decimated preview",
+                          default=False)
+
+    point_budget = IntProperty(name="Point Budget",
+                          description="Maximum number of points of the preview",
+                          default=100000, min=1)
+
+    lod_tiers = IntProperty(name="Detail Tiers",
+                          description="Number of additional hidden tiers, "
+                                      "each with 4 times the points of the previous",
+                          default=0, min=0, max=4)
+
     def execute(self, context):
         paths = [os.path.join(self.directory, name.name) for name in self.files]
         if not paths:
             paths.append(self.filepath)
 
         for path in paths:
-            pcd_utils.import_pcd(path)
+            try:
+                if self.use_stream:
+                    pcd_utils.import_pcd_stream(path, point_budget=self.point_budget,
+                                                lod_tiers=self.lod_tiers)
+                elif self.use_array_reader:
+                    pcd_utils.import_pcd_array(path)
+                else:
+                    pcd_utils.import_pcd(path)
+            except pcdparser.PCDError as ex:
+                self.report({'ERROR'}, str(ex))
+                return {'CANCELLED'}
 
         return {'FINISHED'}
 
 
+class LoadFullPCD(bpy.types.Operator):
+    """Replace a decimated point cloud by the full resolution points"""
+    bl_idname = "import_points.pcd_full"
+    bl_label = "Load Full PCD"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.active_object
+        return obj and obj.type == 'MESH' and "pcd_filepath" in obj
+
+    def execute(self, context):
+        obj = context.active_object
+        try:
+            parser = pcd_utils.get_parser(obj["pcd_filepath"])
+            parser.parseFileArray()
+        except pcdparser.PCDError as ex:
+            self.report({'ERROR'}, str(ex))
+            return {'CANCELLED'}
+
+        old_mesh = obj.data
+        obj.data = pcd_utils.create_mesh_array(obj.name, parser.getArray())
+        if old_mesh.users == 0:
+            bpy.data.meshes.remove(old_mesh)
+        del obj["pcd_filepath"]
+
+        return {'FINISHED'}
+
+
+class PCDPanel(bpy.types.Panel):
+    """Full resolution loading of decimated point clouds"""
+    bl_label = "Point Cloud"
+    bl_space_type = 'PROPERTIES'
+    bl_region_type = 'WINDOW'
+    bl_context = "data"
+
+    @classmethod
+    def poll(cls, context):
+        return LoadFullPCD.poll(context)
+
+    def draw(self, context):
+        layout = self.layout
+        obj = context.active_object
+        layout.label(text=os.path.basename(obj["pcd_filepath"]))
+        layout.label(text="Decimated, voxel size %g" % obj.get("pcd_voxel_size", 0.0))
+        layout.operator(LoadFullPCD.bl_idname)
+
+
 
 
 def menu_func_import(self, context):
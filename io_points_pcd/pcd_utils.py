@@ -17,8 +17,28 @@
 # ##### END GPL LICENSE BLOCK #####
 
 import bpy
+import numpy
 
 from . import pcdparser
+from . import voxelgrid
+
+
+# fields which are stored in the vertex coordinates and normals
+COORD_FIELDS = ('x', 'y', 'z')
+NORMAL_FIELDS = ('normal_x', 'normal_y', 'normal_z')
+# packed color fields, stored as integer layers
+COLOR_FIELDS = ('rgb', 'rgba')
+
+
+def get_parser(filepath):
+    """
+    Return a parser for the PCD file at *filepath*,
+    raises PCDError if the file version is not supported.
+    """
+    parser = pcdparser.PCDParser.factory(filepath, pcdparser.PointXYZ)
+    if not parser:
+        raise pcdparser.PCDError("%s: PCD version is not supported" % filepath)
+    return parser
 
 
 def create_and_link_mesh(name, points):
@@ -42,7 +62,7 @@ def create_and_link_mesh(name, points):
 
 
 def import_pcd(filepath, name="new_pointcloud"):
-    parser = pcdparser.PCDParser.factory(filepath, pcdparser.PointXYZ)
+    parser = get_parser(filepath)
     parser.parseFile()
     points = parser.getPoints()
 
@@ -51,5 +71,150 @@ def import_pcd(filepath, name="new_pointcloud"):
         blender_points.append((point.x, point.y, point.z))
 
     create_and_link_mesh(name, blender_points)
-  
 
+
+
+def add_vertex_layer(mesh, name, values):
+    """
+    Store per-vertex *values* in a custom data layer of *mesh*,
+    using an int layer for integer data and a float layer otherwise.
+    """
+    if values.dtype.kind in 'iu':
+        layer = mesh.vertex_layers_int.new(name=name)
+        layer.data.foreach_set("value", values.astype(numpy.int32))
+    else:
+        layer = mesh.vertex_layers_float.new(name=name)
+        layer.data.foreach_set("value", values.astype(numpy.float32))
+
+
+def create_and_link_mesh_co(name, co):
+    """
+    Create a blender mesh and object called name from a (N, 3) array
+    of coordinates and link it in the current scene.
+    """
+
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(len(co))
+    mesh.vertices.foreach_set("co", numpy.ascontiguousarray(co, dtype=numpy.float32).ravel())
+
+    # update mesh to allow proper display
+    mesh.validate()
+    mesh.update()
+
+    scene = bpy.context.scene
+
+    obj = bpy.data.objects.new(name, mesh)
+    scene.objects.link(obj)
+    obj.select = True
+    return obj
+
+
+def create_mesh_array(name, array):
+    """
+    Create a blender mesh called name from a numpy structured *array*
+    of points. Normals are stored as vertex normals, other fields become
+    vertex custom data layers.
+    """
+
+    numPoints = len(array)
+    names = array.dtype.names
+
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(numPoints)
+
+    co = numpy.zeros((numPoints, 3), dtype=numpy.float32)
+    for i, field in enumerate(COORD_FIELDS):
+        if field in names:
+            co[:, i] = array[field]
+    mesh.vertices.foreach_set("co", co.ravel())
+
+    if all(field in names for field in NORMAL_FIELDS):
+        normals = numpy.empty((numPoints, 3), dtype=numpy.float32)
+        for i, field in enumerate(NORMAL_FIELDS):
+            normals[:, i] = array[field]
+        mesh.vertices.foreach_set("normal", normals.ravel())
+
+    for field in names:
+        if field in COORD_FIELDS or field in NORMAL_FIELDS:
+            continue
+        # padding fields
+        if field.startswith('_'):
+            continue
+
+        values = array[field]
+        if field in COLOR_FIELDS:
+            # packed 0xAARRGGBB color, usually stored as float bits
+            if values.dtype == numpy.float32:
+                values = values.view(numpy.int32)
+            elif values.dtype.kind == 'f':
+                values = values.astype(numpy.uint32)
+
+        if values.ndim == 1:
+            add_vertex_layer(mesh, field, values)
+        else:
+            for i in range(values.shape[1]):
+                add_vertex_layer(mesh, "%s_%d" % (field, i), values[:, i])
+
+    # update mesh to allow proper display
+    mesh.validate()
+    mesh.update()
+
+    return mesh
+
+
+def create_and_link_mesh_array(name, array):
+    """
+    Create a blender mesh and object called name from a numpy structured
+    *array* of points and link it in the current scene.
+    """
+
+    mesh = create_mesh_array(name, array)
+
+    scene = bpy.context.scene
+
+    obj = bpy.data.objects.new(name, mesh)
+    scene.objects.link(obj)
+    obj.select = True
+
+
+def import_pcd_array(filepath, name="new_pointcloud"):
+    parser = get_parser(filepath)
+    parser.parseFileArray()
+    array = parser.getArray()
+
+    create_and_link_mesh_array(name, array)
+
+
+def import_pcd_stream(filepath, name="new_pointcloud", point_budget=100000,
+                      lod_tiers=0, block_size=1000000):
+    """
+    Import a decimated point cloud by streaming the file in blocks of
+    *block_size* points through voxel grid downsamplers.
+
+    The preview object keeps at most *point_budget* points, each of the
+    optional *lod_tiers* has a budget 4 times larger than the previous
+    one and is imported as a hidden object. The file path is stored on
+    the objects so the full resolution can be loaded on demand.
+    """
+    parser = get_parser(filepath)
+
+    grids = [voxelgrid.VoxelGrid(point_budget * 4 ** tier) for tier in range(lod_tiers + 1)]
+    for block in parser.iterFileArray(block_size):
+        co = numpy.empty((len(block), 3), dtype=numpy.float64)
+        for i, field in enumerate(COORD_FIELDS):
+            co[:, i] = block[field]
+        for grid in grids:
+            grid.add(co)
+
+    objects = []
+    for tier, grid in enumerate(grids):
+        tier_name = name if tier == 0 else "%s_lod%d" % (name, tier)
+        obj = create_and_link_mesh_co(tier_name, grid.points())
+        obj["pcd_filepath"] = filepath
+        obj["pcd_voxel_size"] = grid.voxel_size
+        if tier > 0:
+            obj.hide = True
+            obj.select = False
+        objects.append(obj)
+
+    return objects
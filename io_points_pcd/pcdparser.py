@@ -18,6 +18,9 @@
 
 
 import struct
+import warnings
+
+import numpy
 
 
 def encodeASCIILine(line):
@@ -25,6 +28,11 @@ def encodeASCIILine(line):
 
 
 
+class PCDError(Exception):
+    pass
+
+
+
 class Point:
 
     def __init__(self):
@@ -65,6 +73,7 @@ class PCDParser:
     file = None
 
     points = []
+    array = None
     PointClass = None
 
     headerEnd = False
@@ -94,10 +103,15 @@ class PCDParser:
         self.file = None
         self.headerEnd = False
         self.points = []
+        self.array = None
 
 
     def parserWarning(self, msg):
         print("[WARNING] ", msg)
+
+
+    def parserError(self, msg):
+        raise PCDError("%s: %s" % (self.filepath, msg))
     
 
     def rmComment(self, line):
@@ -110,6 +124,26 @@ class PCDParser:
             self.parsePoints()
 
 
+    def parseFileArray(self):
+        """
+        Parse the file into a numpy structured array instead of a list
+        of *PointClass* objects. The result is available via getArray().
+        """
+        with open(self.filepath, 'rb') as self.file:
+            self.parseHeader()
+            self.parsePointsArray()
+
+
+    def iterFileArray(self, blockSize):
+        """
+        Stream the file as structured arrays of at most *blockSize*
+        points, without keeping the whole points section in memory.
+        """
+        with open(self.filepath, 'rb') as self.file:
+            self.parseHeader()
+            yield from self.iterPointsArray(blockSize)
+
+
     def parseHeader(self):
         for b in self.file:
             line = encodeASCIILine(b)
@@ -137,10 +171,22 @@ class PCDParser:
         pass
 
 
+    def parsePointsArray(self):
+        pass
+
+
+    def iterPointsArray(self, blockSize):
+        return iter(())
+
+
     def getPoints(self):
         return self.points
 
 
+    def getArray(self):
+        return self.array
+
+
     def version(self):
         return 'NO_VERSION_NUMBER'
 
@@ -154,6 +200,7 @@ class PCDParser_v0_7(PCDParser):
     def __init__(self, filepath, PointClass):
         super().__init__(filepath, PointClass)
         self.fields = []
+        self.datatype = None
 
 
     def version(self):
@@ -227,6 +274,8 @@ class PCDParser_v0_7(PCDParser):
             self.datatype = 'ASCII'
         elif split[0] == "binary":
             self.datatype = 'BINARY'
+        else:
+            self.datatype = split[0]
         self.headerEnd = True
 
 
@@ -240,6 +289,12 @@ class PCDParser_v0_7(PCDParser):
             self.parseASCII()
         elif self.datatype == 'BINARY':
             self.parseBINARY()
+        else:
+            self.unsupportedDATA()
+
+
+    def unsupportedDATA(self):
+        self.parserError("DATA type '%s' is not supported" % self.datatype)
 
 
     def parseASCII(self):
@@ -324,6 +379,195 @@ class PCDParser_v0_7(PCDParser):
             self.points.append(point)
 
 
+    # size in bytes of the ASCII blocks read by parseASCIIArray
+    ASCII_CHUNK_SIZE = 1 << 22
+
+    def getDtype(self):
+        """
+        Build a numpy structured dtype from the FIELDS/SIZE/TYPE/COUNT
+        header. Fields with COUNT > 1 become sub-arrays, duplicate names
+        (like the '_' padding fields written by pcl) are made unique.
+        """
+        names = []
+        descr = []
+        for fieldname, fieldsize, fieldtype, fieldcount in self.fields:
+            if fieldsize is None:
+                fieldsize = 4
+            if fieldtype is None:
+                fieldtype = 'F'
+            if fieldcount is None:
+                fieldcount = 1
+
+            name = fieldname
+            i = 1
+            while name in names:
+                name = "%s_%d" % (fieldname, i)
+                i += 1
+            names.append(name)
+
+            if fieldtype == 'F':
+                typestr = '<f%d' % fieldsize
+            elif fieldtype == 'U':
+                typestr = '<u%d' % fieldsize
+            else:
+                typestr = '<i%d' % fieldsize
+
+            if fieldcount == 1:
+                descr.append((name, typestr))
+            else:
+                descr.append((name, typestr, (fieldcount,)))
+
+        return numpy.dtype(descr)
+
+
+    def parsePointsArray(self):
+        dtype = self.getDtype()
+        if self.datatype == 'ASCII':
+            self.array = self.parseASCIIArray(dtype)
+        elif self.datatype == 'BINARY':
+            self.array = self.parseBINARYArray(dtype)
+        else:
+            self.unsupportedDATA()
+
+
+    def iterPointsArray(self, blockSize):
+        """
+        Generator yielding the points section as structured arrays of at
+        most *blockSize* points, so files larger than memory can be
+        processed. The header must have been parsed already.
+        """
+        dtype = self.getDtype()
+        if self.datatype == 'ASCII':
+            blocks = self.iterASCIIArray(dtype)
+        elif self.datatype == 'BINARY':
+            blocks = self.iterBINARYArray(dtype, blockSize)
+        else:
+            self.unsupportedDATA()
+
+        for block in blocks:
+            for start in range(0, len(block), blockSize):
+                yield block[start:start + blockSize]
+
+
+    def parseBINARYArray(self, dtype):
+        array = numpy.fromfile(self.file, dtype=dtype, count=self.numPoints)
+        if len(array) < self.numPoints:
+            self.parserWarning("Unexpected end of data")
+        return array
+
+
+    def iterBINARYArray(self, dtype, blockSize):
+        remaining = self.numPoints
+        while remaining > 0:
+            count = min(blockSize, remaining)
+            block = numpy.fromfile(self.file, dtype=dtype, count=count)
+            if len(block) > 0:
+                yield block
+            if len(block) < count:
+                self.parserWarning("Unexpected end of data")
+                return
+            remaining -= count
+
+
+    def parseASCIIArray(self, dtype):
+        array = numpy.empty(self.numPoints, dtype=dtype)
+        parsed = 0
+        for block in self.iterASCIIArray(dtype):
+            array[parsed:parsed + len(block)] = block
+            parsed += len(block)
+        return array[:parsed]
+
+
+    def iterASCIIArray(self, dtype):
+        """
+        Tokenize the ASCII points section in chunks of ASCII_CHUNK_SIZE
+        bytes, yielding one structured array per chunk.
+        """
+        numValues = self.numValues(dtype)
+
+        remaining = self.numPoints * numValues
+        # values of a point which is split between two chunks
+        carry = numpy.empty(0, dtype=numpy.float64)
+        rest = b''
+        while remaining > 0:
+            chunk = self.file.read(self.ASCII_CHUNK_SIZE)
+            if not chunk:
+                chunk, rest = rest, b''
+                if not chunk:
+                    break
+            else:
+                chunk = rest + chunk
+                end = chunk.rfind(b'\n') + 1
+                if end == 0:
+                    rest = chunk
+                    continue
+                chunk, rest = chunk[:end], chunk[end:]
+
+            if b'#' in chunk:
+                chunk = b'\n'.join(line.split(b'#', 1)[0]
+                                   for line in chunk.split(b'\n'))
+
+            values = self.parseASCIIValues(chunk)
+            values = values[:remaining]
+            remaining -= len(values)
+            if len(carry):
+                values = numpy.concatenate((carry, values))
+
+            end = len(values) - len(values) % numValues
+            carry = values[end:]
+            if end > 0:
+                yield self.valuesToArray(dtype, values[:end])
+
+        if remaining > 0:
+            self.parserWarning("Unexpected end of data")
+
+
+    def parseASCIIValues(self, chunk):
+        """
+        Parse a chunk of whitespace separated values into a flat float array,
+        without building a list of tokens first.
+        """
+        text = encodeASCIILine(chunk).strip()
+        if not text:
+            # fromstring returns garbage for whitespace only input
+            return numpy.empty(0, dtype=numpy.float64)
+
+        # older NumPy versions stop at invalid data with a warning only
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", DeprecationWarning)
+            try:
+                return numpy.fromstring(text, dtype=numpy.float64, sep=' ')
+            except (ValueError, DeprecationWarning) as ex:
+                self.parserError("Invalid ASCII point data (%s)" % ex)
+
+
+    def numValues(self, dtype):
+        """
+        Number of values per point, counting every sub-array element.
+        """
+        return sum(dtype[name].shape[0] if dtype[name].shape else 1
+                   for name in dtype.names)
+
+
+    def valuesToArray(self, dtype, values):
+        """
+        Convert a flat float array of whole points into a structured array.
+        """
+        numValues = self.numValues(dtype)
+        values = values.reshape(-1, numValues)
+        array = numpy.empty(len(values), dtype=dtype)
+        column = 0
+        for name in dtype.names:
+            count = dtype[name].shape[0] if dtype[name].shape else 1
+            if count == 1:
+                array[name] = values[:, column]
+            else:
+                array[name] = values[:, column:column + count]
+            column += count
+
+        return array
+
+
 
 
 def test():
@@ -0,0 +1,108 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+import numpy
+
+
+class VoxelGrid:
+    """
+    Incremental voxel grid downsampler.
+
+    Points are added in blocks, each occupied voxel keeps the sum and
+    count of its points so the result is the centroid per voxel.
+    Whenever the number of voxels exceeds *budget* the voxel size is
+    doubled and the existing voxels are merged, so memory is bounded by
+    the budget regardless of the number of points added.
+    """
+
+    def __init__(self, budget, voxel_size=0.0):
+        self.budget = budget
+        self.voxel_size = voxel_size
+
+        # (N, 3) integer voxel indices
+        self.keys = numpy.empty((0, 3), dtype=numpy.int64)
+        self.sums = numpy.empty((0, 3), dtype=numpy.float64)
+        self.counts = numpy.empty(0, dtype=numpy.int64)
+
+
+    def __len__(self):
+        return len(self.keys)
+
+
+    def make_keys(self, co):
+        return numpy.floor(co / self.voxel_size).astype(numpy.int64)
+
+
+    def merge(self, keys, sums, counts):
+        # compare the three indices of a voxel as one opaque value, so the
+        # keys never wrap around like packed integer keys do
+        keys = numpy.ascontiguousarray(keys)
+        rows = keys.view(numpy.dtype((numpy.void, keys.dtype.itemsize * 3))).ravel()
+        rows, index, inverse = numpy.unique(rows, return_index=True, return_inverse=True)
+        keys = keys[index]
+        inverse = inverse.ravel()
+        merged_sums = numpy.zeros((len(keys), 3), dtype=numpy.float64)
+        for i in range(3):
+            merged_sums[:, i] = numpy.bincount(inverse, weights=sums[:, i], minlength=len(keys))
+        merged_counts = numpy.bincount(inverse, weights=counts, minlength=len(keys)).astype(numpy.int64)
+
+        self.keys = keys
+        self.sums = merged_sums
+        self.counts = merged_counts
+
+
+    def coarsen(self):
+        """
+        Double the voxel size and re-bin the existing voxels by their centroids.
+        """
+        self.voxel_size *= 2.0
+        centroids = self.sums / self.counts[:, None]
+        self.merge(self.make_keys(centroids), self.sums, self.counts)
+
+
+    def add(self, co):
+        """
+        Add a (N, 3) array of point coordinates.
+        """
+        co = numpy.asarray(co, dtype=numpy.float64)
+        # points of non-dense files are NaN where there was no measurement
+        co = co[numpy.isfinite(co).all(axis=1)]
+        if len(co) == 0:
+            return
+
+        if self.voxel_size <= 0.0:
+            # initial estimate from the first block, assuming a surface-like
+            # distribution of points spread over its bounding box
+            extent = co.max(axis=0) - co.min(axis=0)
+            area = max(extent[0] * extent[1], extent[0] * extent[2], extent[1] * extent[2])
+            self.voxel_size = max((area / max(self.budget, 1)) ** 0.5, float(extent.max()) * 1.0e-6, 1.0e-6)
+
+        keys = numpy.concatenate((self.keys, self.make_keys(co)))
+        sums = numpy.concatenate((self.sums, co))
+        counts = numpy.concatenate((self.counts, numpy.ones(len(co), dtype=numpy.int64)))
+        self.merge(keys, sums, counts)
+
+        while len(self.keys) > self.budget:
+            self.coarsen()
+
+
+    def points(self):
+        """
+        Centroids of all occupied voxels as a (N, 3) float32 array.
+        """
+        return (self.sums / self.counts[:, None]).astype(numpy.float32)
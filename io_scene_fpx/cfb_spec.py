@@ -36,11 +36,20 @@
 
 from struct import (
         unpack,
+        unpack_from,
         )
 from io import (
         SEEK_SET,
         SEEK_CUR,
         SEEK_END,
+        UnsupportedOperation,
+        )
+from mmap import (
+        mmap,
+        ACCESS_READ,
+        )
+from bisect import (
+        bisect_right,
         )
 from time import (
         strftime,
@@ -83,24 +92,77 @@ class Cfb_RawIO_Reader:
 
     __slots__ = (
             '__raw_io',
+            '__buffer',
+            '__position',
             '__compound_file_header'
             )
 
-    def __init__(self, raw_io):
+    def __init__(self, raw_io, use_mmap=True):
+        """
+        raw_io: file like object of the compound file
+        use_mmap: map the file into memory, if raw_io is a real file.
+                  streams then read from the mapping, without any seek or
+                  read of raw_io, and can return memoryviews on it.
+        """
         self.__raw_io = raw_io
+        self.__buffer = None
+        self.__position = 0
+        if use_mmap:
+            self.__buffer = Cfb_RawIO_Reader.map_file(raw_io)
         self.__compound_file_header = Cfb_File_Header(self)
         self.__compound_file_header.read()
 
+    @staticmethod
+    def map_file(raw_io):
+        """ returns: read only memoryview of the whole file or None """
+        try:
+            fileno = raw_io.fileno()
+        except (AttributeError, OSError, UnsupportedOperation):
+            return None
+        try:
+            return memoryview(mmap(fileno, 0, access=ACCESS_READ))
+        except (OSError, ValueError):
+            # e.g. empty file or file without mmap support
+            return None
+
+    def buffer(self):
+        """ returns: memoryview of the mapped file or None """
+        return self.__buffer
+
     def tell(self):
-        self.__raw_io.tell()
+        if self.__buffer is not None:
+            return self.__position
+        return self.__raw_io.tell()
 
     def seek(self, offset, whence=SEEK_SET):
+        if self.__buffer is not None:
+            if whence == SEEK_CUR:
+                offset += self.__position
+            elif whence == SEEK_END:
+                offset += len(self.__buffer)
+            self.__position = offset
+            return offset
         return self.__raw_io.seek(offset, whence)
 
     def read(self, n=-1):
         """ read raw byte(s) buffer """
+        if self.__buffer is not None:
+            position = self.__position
+            if n < 0:
+                n = len(self.__buffer) - position
+            n = max(0, min(n, len(self.__buffer) - position))
+            self.__position = position + n
+            return self.__buffer[position:position + n].tobytes()
         return self.__raw_io.read(n)
 
+    def read_unpack(self, format, size):
+        """ read a tuple of values of struct format, taking size bytes """
+        if self.__buffer is not None:
+            position = self.__position
+            self.__position = position + size
+            return unpack_from(format, self.__buffer, position)
+        return unpack(format, self.__raw_io.read(size))
+
     def get_stream_directory_names(self):
         return self.__compound_file_header.get_stream_directory_names()
 
@@ -126,19 +188,19 @@ class Cfb_RawIO_Reader:
 
     def read_byte(self):
         """ read a single byte value """
-        return unpack('<B', self.__raw_io.read(Cfb_Size_Type.BYTE))[0]
+        return self.read_unpack('<B', Cfb_Size_Type.BYTE)[0]
 
     def read_word(self):
         """ read a single word value """
-        return unpack('<H', self.__raw_io.read(Cfb_Size_Type.WORD))[0]
+        return self.read_unpack('<H', Cfb_Size_Type.WORD)[0]
 
     def read_dword(self):
         """ read a single double word value """
-        return unpack('<I', self.__raw_io.read(Cfb_Size_Type.DWORD))[0]
+        return self.read_unpack('<I', Cfb_Size_Type.DWORD)[0]
 
     def read_qword(self):
         """ read a single quad word value """
-        return unpack('<Q', self.__raw_io.read(Cfb_Size_Type.QWORD))[0]
+        return self.read_unpack('<Q', Cfb_Size_Type.QWORD)[0]
 
     CLSID_NULL = b'\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00'
     #CLSID_NULL = (0x00000000, 0x0000, 0x0000, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, 0x00, )
@@ -149,7 +211,7 @@ class Cfb_RawIO_Reader:
         (0xF3F2F1F0, 0xE1E0, 0xD1D0, 0x07, 0x06, 0x05, 0x04, 0x03, 0x02, 0x01, 0x00, )
         """
         #return unpack('<L2H8B', self.__raw_io.read(Cfb_Size_Type.CLSID))
-        return self.__raw_io.read(Cfb_Size_Type.CLSID)
+        return self.read(Cfb_Size_Type.CLSID)
 
 
 ###############################################################################
@@ -171,6 +233,10 @@ class Cfb_Stream_Reader:
         '__stream_sector_index',
         '__stream_sector_position',
         '__stream_position',
+        '__buffer',
+        '__span_starts',
+        '__spans',
+        '__span',
         )
 
     def __init__(self, compound_raw_io, sector_list, sector_shift, path_name, directory_entry):
@@ -191,6 +257,56 @@ class Cfb_Stream_Reader:
         self.__stream_sector_size = 1 << self.__stream_sector_shift
         self.__stream_sector_mask = self.__stream_sector_size - 1
 
+        self.__buffer = compound_raw_io.buffer()
+        if self.__buffer is not None:
+            self.build_spans()
+
+    def build_spans(self):
+        """
+        merges the sector chain into spans of contiguous sectors
+        span = (stream position, buffer offset, size)
+        """
+        spans = []
+        stream_size = self.__directory_entry.Stream_Size
+        buffer_size = len(self.__buffer)
+        stream_position = 0
+        start = offset = None
+        for sector_offset in self.__stream_sector_list:
+            if offset is None or sector_offset != offset:
+                if start is not None:
+                    spans.append((start, start_offset, stream_position - start))
+                start = stream_position
+                start_offset = sector_offset
+            stream_position += self.__stream_sector_size
+            offset = sector_offset + self.__stream_sector_size
+        if start is not None:
+            spans.append((start, start_offset, stream_position - start))
+
+        # clip spans to the stream and to the mapped file
+        self.__spans = []
+        for start, offset, size in spans:
+            size = min(size, stream_size - start, buffer_size - offset)
+            if size <= 0:
+                break
+            self.__spans.append((start, offset, size))
+        self.__span_starts = [span[0] for span in self.__spans]
+        self.__span = self.__spans[0] if self.__spans else (0, 0, 0)
+
+    def find_span(self, stream_position):
+        """ returns: span containing stream_position or None """
+        start, offset, size = self.__span
+        if start <= stream_position < start + size:
+            return self.__span
+        index = bisect_right(self.__span_starts, stream_position) - 1
+        if index < 0:
+            return None
+        span = self.__spans[index]
+        start, offset, size = span
+        if stream_position >= start + size:
+            return None
+        self.__span = span
+        return span
+
     def size(self):
         return self.__directory_entry.Stream_Size
 
@@ -210,6 +326,10 @@ class Cfb_Stream_Reader:
         if stream_position < 0 or stream_position > self.__directory_entry.Stream_Size:
             raise IndexError("Cfb_Stream_Reader.seek(offset)")
 
+        if self.__buffer is not None:
+            self.__stream_position = stream_position
+            return stream_position
+
         ## mit -1
         stream_sector_index = stream_position >> self.__stream_sector_shift
         stream_sector_position = stream_position & self.__stream_sector_mask
@@ -230,7 +350,49 @@ class Cfb_Stream_Reader:
         self.__compound_raw_io.seek(stream_sector_offset)
         return stream_position
 
+    def read_view(self, n=-1):
+        """
+        read n bytes as memoryview
+        a read within a span of contiguous sectors does not copy,
+        the view points into the mapped file.
+        """
+        if self.__buffer is None:
+            return memoryview(self.read(n))
+
+        stream_position = self.__stream_position
+        max_stream_position = self.__directory_entry.Stream_Size
+        if n >= 0 and stream_position + n < max_stream_position:
+            max_stream_position = stream_position + n
+        if max_stream_position <= stream_position:
+            return memoryview(b'')
+
+        span = self.find_span(stream_position)
+        if span is None:
+            return memoryview(b'')
+        start, offset, size = span
+        if max_stream_position <= start + size:
+            self.__stream_position = max_stream_position
+            offset += stream_position - start
+            return self.__buffer[offset:offset + max_stream_position - stream_position]
+
+        # crosses the end of a span
+        blocks = []
+        while stream_position < max_stream_position:
+            span = self.find_span(stream_position)
+            if span is None:
+                break
+            start, offset, size = span
+            end = min(start + size, max_stream_position)
+            offset += stream_position - start
+            blocks.append(self.__buffer[offset:offset + end - stream_position])
+            stream_position = end
+        self.__stream_position = stream_position
+        return memoryview(b''.join(blocks))
+
     def read(self, n=-1):
+        if self.__buffer is not None:
+            return self.read_view(n).tobytes()
+
         blocks = []
 
         if n >= 0:
@@ -264,21 +426,31 @@ class Cfb_Stream_Reader:
 
         return b''.join(blocks)
 
+    def read_unpack(self, format, size):
+        """ read a tuple of values of struct format, taking size bytes """
+        if self.__buffer is not None:
+            stream_position = self.__stream_position
+            start, offset, span_size = self.__span
+            if start <= stream_position and stream_position + size <= start + span_size:
+                self.__stream_position = stream_position + size
+                return unpack_from(format, self.__buffer, offset + stream_position - start)
+        return unpack(format, self.read(size))
+
     def read_byte(self):
         """ read a single byte value """
-        return unpack('<B', self.read(Cfb_Size_Type.BYTE))[0]
+        return self.read_unpack('<B', Cfb_Size_Type.BYTE)[0]
 
     def read_word(self):
         """ read a single word value """
-        return unpack('<H', self.read(Cfb_Size_Type.WORD))[0]
+        return self.read_unpack('<H', Cfb_Size_Type.WORD)[0]
 
     def read_dword(self):
         """ read a single double word value """
-        return unpack('<I', self.read(Cfb_Size_Type.DWORD))[0]
+        return self.read_unpack('<I', Cfb_Size_Type.DWORD)[0]
 
     def read_qword(self):
         """ read a single quad word value """
-        return unpack('<Q', self.read(Cfb_Size_Type.QWORD))[0]
+        return self.read_unpack('<Q', Cfb_Size_Type.QWORD)[0]
 
     def path_name(self):
         return self.__path_name
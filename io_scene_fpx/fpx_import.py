@@ -35,6 +35,7 @@ DEV_MODE__APPEND_TO_EXISTING = False # do not enable - only for developing purpo
 
 #import python stuff
 import io
+import os
 from mathutils import (
         Euler,
         Vector,
@@ -47,8 +48,6 @@ from math import (
 from os import (
         path,
         listdir,
-        rmdir,
-        remove,
         )
 from sys import (
         exc_info,
@@ -56,6 +55,16 @@ from sys import (
 from time import (
         time,
         )
+from itertools import (
+        repeat,
+        )
+from multiprocessing import (
+        cpu_count,
+        get_context,
+        )
+from concurrent.futures import (
+        ProcessPoolExecutor,
+        )
 
 
 # import io_scene_fpx stuff
@@ -67,6 +76,7 @@ if repr(globals()).find("bpy") != -1:
             Fpm_File_Reader,
             Fpl_File_Reader,
             Fpt_File_Reader,
+            Fpx_Resource_Provider,
             Fpm_Model_Type,
             Fpl_Library_Type,
             FptElementType,
@@ -86,6 +96,7 @@ else:
             Fpm_File_Reader,
             Fpl_File_Reader,
             Fpt_File_Reader,
+            Fpx_Resource_Provider,
             Fpm_Model_Type,
             Fpl_Library_Type,
             FptElementType,
@@ -189,6 +200,7 @@ class FpmImporter():
             verbose=FpxUI.PROP_DEFAULT_VERBOSE,
             keep_temp=FpxUI.PROP_DEFAULT_KEEP_TEMP,
             use_all_models_of_folder=FpxUI.PROP_DEFAULT_ALL_MODELS,
+            processes=FpxUI.PROP_DEFAULT_PROCESSES,
             use_scene_per_model=FpxUI.PROP_DEFAULT_SCENE,
             name_extra=FpxUI.PROP_DEFAULT_NAME_EXTRA,
             use_model_filter=FpxUI.PROP_DEFAULT_USE_MODEL_FILTER,
@@ -199,19 +211,19 @@ class FpmImporter():
         self.verbose = verbose
         self.keep_temp = keep_temp
         self.use_all_models_of_folder = use_all_models_of_folder
+        self.processes = processes
         self.use_scene_per_model = use_scene_per_model
         self.name_extra = name_extra
         self.use_model_filter = use_model_filter
         self.use_model_adjustment = use_model_adjustment
         self.keep_name = keep_name
 
-    def read(self, blender_context, filepath):
-        """ read fpm file and convert fpm content to bender content """
+    def read(self, blender_context, filepath, resources=None):
+        """ read fpm file and convert fpm content to bender content
+        resources: optional Fpx_Resource_Provider, to read filepath from instead of disk """
         t1 = time()
         t2 = None
 
-        fpx_reader = None
-
         self.__context = blender_context
         self.__data = blender_context.blend_data
         self.__scene = blender_context.scene
@@ -232,48 +244,41 @@ class FpmImporter():
             else:
                 files = [filepath, ]
 
-            for file in files:
-                self.folder_name, file_name = path.split(filepath)
-                try:
-                    with io.FileIO(file, 'rb') as raw_io:
-                        # read and inject fpm data from disk to internal structure
-                        fpx_reader = Fpm_File_Reader(raw_io)
-                        fpx_reader.read_model()
-                        raw_io.close()
-                finally:
-                    pass
+            provider = Fpx_Resource_Provider(path.join(app.tempdir, "__grab__fpm__"))
 
+            if len(files) > 1 and resources is None:
+                models = self.read_models_parallel(files, provider)
+            else:
+                models = self.read_models(files, provider, resources)
+
+            for file, model_name, dst_sub_path_names, t_io in models:
                 # if option is set, this time will enlarges the io time
                 #if self.verbose and reader:
                 #    fpx_reader.print_internal()
                 t2 = time()
 
-                if fpx_reader:
-                    temp_name = path.join(app.tempdir, "__grab__fpm__")
-                    dst_path, dst_sub_path_names = fpx_reader.grab_content(temp_name)
+                model_name = FpxUtilities.toGoodName(model_name) ####
+                #model_name = path.split(file)[1]
+                #model_name = model_name.lower()
+                #if model_name.endswith(".fpm"):
+                #    model_name = model_name[:-4]
 
-                    model_name = fpx_reader.PinModel.get_value("name")
-                    model_name = FpxUtilities.toGoodName(model_name) ####
-                    #model_name = path.split(file)[1]
-                    #model_name = model_name.lower()
-                    #if model_name.endswith(".fpm"):
-                    #    model_name = model_name[:-4]
+                if self.name_extra:
+                    model_name = FORMAT_RESOURCE.format(self.name_extra, model_name)
 
-                    if self.name_extra:
-                        model_name = FORMAT_RESOURCE.format(self.name_extra, model_name)
 
+                model_filepath = dst_sub_path_names.get("modeldata")
+                debug_data.append("type={}, model_filepath='{}'".format(dst_sub_path_names.get("type"), model_filepath))
+                if model_filepath:
+                    self.read_ex(blender_context, provider, dst_sub_path_names, model_name, debug_data)
 
-                    model_filepath = dst_sub_path_names.get("modeldata")
-                    debug_data.append("type={}, model_filepath='{}'".format(dst_sub_path_names.get("type"), model_filepath))
-                    if model_filepath:
-                        self.read_ex(blender_context, dst_sub_path_names, model_name, debug_data)
+                if len(files) > 1 and self.verbose in FpxUI.VERBOSE_NORMAL:
+                    t_converter = time() - t2
+                    print(fpx_str['SUMMARY_IMPORT_FILE'].format(
+                            path.split(file)[1], (t_io + t_converter), t_io, t_converter))
 
-                    # cleanup
-                    if not self.keep_temp:
-                        try:
-                            rmdir(dst_path)
-                        except:
-                            pass
+            if t2 is None:
+                t2 = time()
 
             if self.verbose in FpxUI.VERBOSE_NORMAL:
                 print()
@@ -310,9 +315,72 @@ class FpmImporter():
         return {"FINISHED"}
 
     ###########################################################################
-    def read_ex(self, blender_context, dst_sub_path_names, model_name, debug_data):
+    def read_models(self, files, provider, resources=None):
+        """ reads the fpm files one after the other
+        yields: file, model name, resource names at provider, io time """
+        for file in files:
+            t1 = time()
+            if resources is not None:
+                raw_io = resources.open(file)
+            else:
+                raw_io = io.FileIO(file, 'rb')
+            try:
+                with raw_io:
+                    # read and inject fpm data from disk to internal structure
+                    fpx_reader = Fpm_File_Reader(raw_io)
+                    fpx_reader.read_model()
+                    raw_io.close()
+            finally:
+                pass
+
+            if fpx_reader and fpx_reader.PinModel:
+                dst_sub_path_names = fpx_reader.get_content(provider)
+                model_name = fpx_reader.PinModel.get_value("name")
+                yield file, model_name, dst_sub_path_names, time() - t1
+
+    def read_models_parallel(self, files, provider):
+        """ reads and decompresses the fpm files in worker processes,
+        while the models that are already done get converted to blender
+        yields: file, model name, resource names at provider, io time """
+        data_keys = ["primary_model", ]
+        if FpxUI.USE_MODEL_FILTER_SECONDARY in self.use_model_filter:
+            data_keys.append("secondary_model")
+        if FpxUI.USE_MODEL_FILTER_MASK in self.use_model_filter:
+            data_keys.append("mask_model")
+        if FpxUI.USE_MODEL_FILTER_REFLECTION in self.use_model_filter:
+            data_keys.append("reflection_model")
+
+        processes = self.processes
+        if processes <= 0:
+            # forking is needed, spawned processes can't import the add-on
+            # outside of blender
+            processes = cpu_count() if hasattr(os, "fork") else 1
+        processes = min(processes, len(files))
+        if processes <= 1:
+            payloads = (read_fpm_payload(file, data_keys) for file in files)
+            executor = None
+        else:
+            executor = new_process_pool(processes)
+            payloads = executor.map(read_fpm_payload, files, repeat(data_keys))
+
+        try:
+            for file, payload in zip(files, payloads):
+                if payload is None:
+                    continue
+                model_name, dst_sub_path_names, buffers, t_io = payload
+                for name, buffer in buffers.items():
+                    provider.add(name, buffer)
+                yield file, model_name, dst_sub_path_names, t_io
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+    ###########################################################################
+    def read_ex(self, blender_context, resources, dst_sub_path_names, model_name, debug_data):
+        """ resources: Fpx_Resource_Provider, the resource names of dst_sub_path_names belong to """
         model_filepath = dst_sub_path_names.get("primary_model_data")
         if model_filepath:
+            model_filepath = resources.get_file(model_filepath)
             if self.use_scene_per_model:
                 if DEV_MODE__APPEND_TO_EXISTING:
                     blender_scene = blender_context.blend_data.scenes.get(FpxUtilities.toGoodName(FORMAT_SCENE.format(model_name)))
@@ -344,6 +412,7 @@ class FpmImporter():
                 if FpxUI.USE_MODEL_FILTER_SECONDARY in self.use_model_filter:
                     model_filepath = dst_sub_path_names.get("secondary_model_data")
                     if model_filepath:
+                        model_filepath = resources.get_file(model_filepath)
                         blender_scene.layers = self.LAYERS_SECONDARY_MODEL
                         if 'FINISHED' in ops.import_scene.ms3d(filepath=model_filepath, use_animation=False):
                             remove_material(blender_context)
@@ -354,6 +423,7 @@ class FpmImporter():
                 if FpxUI.USE_MODEL_FILTER_MASK in self.use_model_filter:
                     model_filepath = dst_sub_path_names.get("mask_model_data")
                     if model_filepath:
+                        model_filepath = resources.get_file(model_filepath)
                         blender_scene.layers = self.LAYERS_MASK_MODEL
                         if 'FINISHED' in ops.import_scene.ms3d(filepath=model_filepath, use_animation=False):
                             remove_material(blender_context)
@@ -364,6 +434,7 @@ class FpmImporter():
                 if FpxUI.USE_MODEL_FILTER_REFLECTION in self.use_model_filter:
                     model_filepath = dst_sub_path_names.get("reflection_model_data")
                     if model_filepath:
+                        model_filepath = resources.get_file(model_filepath)
                         blender_scene.layers = self.LAYERS_REFLECTION_MODEL
                         if 'FINISHED' in ops.import_scene.ms3d(filepath=model_filepath, use_animation=False):
                             remove_material(blender_context)
@@ -382,20 +453,7 @@ class FpmImporter():
 
         # cleanup
         if not self.keep_temp:
-            for key, file in dst_sub_path_names.items():
-                if key in {'type', 'sub_dir', }:
-                    continue
-                try:
-                    remove(file)
-                except:
-                    pass
-
-            sub_dir_path = dst_sub_path_names.get('sub_dir')
-            if sub_dir_path:
-                try:
-                    rmdir(sub_dir_path)
-                except:
-                    pass
+            resources.remove_files()
 
 
 ###############################################################################
@@ -460,8 +518,8 @@ class FplImporter():
                 t2 = time()
 
                 if fpx_reader:
-                    temp_name = path.join(app.tempdir, "__grab__fpl__")
-                    dst_path, dst_sub_path_names = fpx_reader.grab_content(temp_name)
+                    provider = Fpx_Resource_Provider(path.join(app.tempdir, "__grab__fpl__"))
+                    dst_sub_path_names = fpx_reader.get_content(provider)
 
                     for key, item in dst_sub_path_names.items():
                         if key is not None and key.startswith('type_'):
@@ -487,6 +545,7 @@ class FplImporter():
                                     ).read(
                                             blender_context=self.__context,
                                             filepath=item_path,
+                                            resources=provider,
                                         )
                                 if not self.keep_name:
                                     rename_active_fpm(self.__context, FORMAT_RESOURCE.format(file_name, key_name))
@@ -494,6 +553,7 @@ class FplImporter():
                             elif type == Fpl_Library_Type.TYPE_GRAPHIC:
                                 #print("#DEBUG fpl images.load", item_path)
                                 #print("#DEBUG", type, key_name, item_path)
+                                item_path = provider.get_file(item_path)
                                 blend_image = self.__data.images.load(item_path)
                                 if blend_image:
                                     blend_image.name = FpxUtilities.toGoodName(FORMAT_RESOURCE.format(file_name, FORMAT_IMAGE.format(key_name)))
@@ -512,38 +572,7 @@ class FplImporter():
 
                     # cleanup
                     if not self.keep_temp:
-                        cleanup_sub_dirs = []
-
-                        for key, file in dst_sub_path_names.items():
-                            if key is not None and key.startswith('sub_dir'):
-                                cleanup_sub_dirs.append(file)
-                                continue
-
-                            if key in {'type', None, } or key.startswith('type'):
-                                continue
-
-                            try:
-                                remove(file)
-                            except:
-                                pass
-
-                        sub_dir_path = dst_sub_path_names.get('sub_dir')
-                        if sub_dir_path:
-                            try:
-                                rmdir(sub_dir_path)
-                            except:
-                                pass
-
-                        for sub_dir_path in cleanup_sub_dirs:
-                            try:
-                                rmdir(sub_dir_path)
-                            except:
-                                pass
-
-                        try:
-                            rmdir(dst_path)
-                        except:
-                            pass
+                        provider.remove_files()
 
             if self.verbose in FpxUI.VERBOSE_NORMAL:
                 print()
@@ -678,8 +707,8 @@ class FptImporter():
 
             t2 = time()
             if fpx_reader:
-                temp_name = path.join(app.tempdir, "__grab__fpt__")
-                dst_path, dst_sub_path_names = fpx_reader.grab_content(temp_name)
+                provider = Fpx_Resource_Provider(path.join(app.tempdir, "__grab__fpt__"))
+                dst_sub_path_names = fpx_reader.get_content(provider)
 
                 # setup current Scene to default units
                 ##FpxUtilities.set_scene_to_default(self.__scene)
@@ -688,7 +717,7 @@ class FptImporter():
 
                 # search linked libraries
                 self.fpx_images = {}
-                self.GetLinked(fpx_reader.Image, self.fpx_images, Fpt_PackedLibrary_Type.TYPE_IMAGE, dst_sub_path_names)
+                self.GetLinked(fpx_reader.Image, self.fpx_images, Fpt_PackedLibrary_Type.TYPE_IMAGE, provider, dst_sub_path_names)
 
                 self.fpx_image_lists = {}
                 for image_list in fpx_reader.ImageList.values():
@@ -701,7 +730,7 @@ class FptImporter():
                 self.fpx_images[DEFAULT_LAMP_TEXTURE] = [blender_image_name, ]
 
                 self.fpx_pinmodels = {}
-                self.GetLinked(fpx_reader.PinModel, self.fpx_pinmodels, Fpt_PackedLibrary_Type.TYPE_MODEL, dst_sub_path_names)
+                self.GetLinked(fpx_reader.PinModel, self.fpx_pinmodels, Fpt_PackedLibrary_Type.TYPE_MODEL, provider, dst_sub_path_names)
 
                 """
                 for key, item in self.fpx_images.items():
@@ -898,38 +927,7 @@ class FptImporter():
 
                     # cleanup
                     if not self.keep_temp:
-                        cleanup_sub_dirs = []
-
-                        for key, file in dst_sub_path_names.items():
-                            if key is not None and key.startswith('sub_dir'):
-                                cleanup_sub_dirs.append(file)
-                                continue
-
-                            if key in {'type', 'data', None, } or key.startswith('type') or key.startswith('data'):
-                                continue
-
-                            try:
-                                remove(file)
-                            except:
-                                pass
-
-                        sub_dir_path = dst_sub_path_names.get('sub_dir')
-                        if sub_dir_path:
-                            try:
-                                rmdir(sub_dir_path)
-                            except:
-                                pass
-
-                        for sub_dir_path in cleanup_sub_dirs:
-                            try:
-                                rmdir(sub_dir_path)
-                            except:
-                                pass
-
-                        try:
-                            rmdir(dst_path)
-                        except:
-                            pass
+                        provider.remove_files()
 
 
                 self.add_table_camera(fpx_reader.Table_Data)
@@ -2872,7 +2870,7 @@ class FptImporter():
 
         return None
 
-    def GetLinked(self, dictIn, dictOut, type, dst_sub_path_names):
+    def GetLinked(self, dictIn, dictOut, type, resources, dst_sub_path_names):
         """
         loads external resources
         """
@@ -2930,6 +2928,7 @@ class FptImporter():
                 if item_type == Fpt_PackedLibrary_Type.TYPE_IMAGE:
                     item_path = dst_sub_path_names.get(fpx_item_name)
                     if item_path:
+                        item_path = resources.get_file(item_path)
                         #print("#DEBUG fpt images.load", item_path)
                         blend_image = self.__data.images.load(item_path)
                         if blend_image:
@@ -2945,7 +2944,7 @@ class FptImporter():
                 elif item_type == Fpt_PackedLibrary_Type.TYPE_MODEL:
                     item_data = dst_sub_path_names.get("data_{}".format(fpx_item_name))
                     if item_data:
-                        #print("#DEBUG", fpx_item_name, item_data[1]["sub_dir"])
+                        #print("#DEBUG", fpx_item_name, item_data["sub_dir"])
                         active_scene = self.__context.screen.scene
                         FpmImporter(
                                 report=self.report,
@@ -2958,7 +2957,8 @@ class FptImporter():
                                 keep_name=False,
                             ).read_ex(
                                     blender_context=self.__context,
-                                    dst_sub_path_names=item_data[1],
+                                    resources=resources,
+                                    dst_sub_path_names=item_data,
                                     model_name=FpxUtilities.toGoodName(FORMAT_RESOURCE.format(PREFIX_EMBEDDED, fpx_item_name)),
                                     debug_data=[],
                                     )
@@ -2971,6 +2971,39 @@ class FptImporter():
 
     ###########################################################################
 
+###############################################################################
+def read_fpm_payload(filepath, data_keys):
+    """
+    worker of FpmImporter.read_models_parallel
+    reads a fpm file and decompresses the model data of data_keys
+    returns: model name, resource names, {resource name: data}, io time
+    """
+    t1 = time()
+    with io.FileIO(filepath, 'rb') as raw_io:
+        fpx_reader = Fpm_File_Reader(raw_io)
+        fpx_reader.read_model()
+        raw_io.close()
+    if not fpx_reader.PinModel:
+        return None
+
+    provider = Fpx_Resource_Provider()
+    dst_sub_path_names = fpx_reader.get_content(provider)
+    buffers = {}
+    for data_key in data_keys:
+        name = dst_sub_path_names.get("{}_data".format(data_key))
+        if name:
+            buffers[name] = provider.get_buffer(name).tobytes()
+    model_name = fpx_reader.PinModel.get_value("name")
+    return model_name, dst_sub_path_names, buffers, time() - t1
+
+def new_process_pool(processes):
+    try:
+        return ProcessPoolExecutor(processes, mp_context=get_context("fork"))
+    except TypeError:
+        # python before 3.7, where posix systems fork by default
+        return ProcessPoolExecutor(processes)
+
+
 ###############################################################################
 def get_min_max(blender_object):
     min_x = max_x = min_y = max_y = min_z = max_z = None
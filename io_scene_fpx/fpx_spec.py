@@ -81,14 +81,20 @@ from os import (
         fstat,
         path,
         makedirs,
+        remove,
+        rmdir,
         )
 from collections import (
         OrderedDict,
         )
 from io import (
         SEEK_CUR,
+        BytesIO,
         FileIO,
         )
+from hashlib import (
+        sha1,
+        )
 from codecs import (
         register_error,
         )
@@ -626,22 +632,162 @@ class Fpx_zLZO_RawData_Stream:
         else:
             self.signature = None
             stream.seek(-4, SEEK_CUR)
-        self.src_buffer = stream.read(n)
+        self.src_buffer = stream.read_view(n)
+
+    def decompress_into(self, dst):
+        """ dst = writable buffer of at least uncompressed_size bytes
+        returns: error, number of bytes written """
+        if not self.signature:
+            n = len(self.src_buffer)
+            memoryview(dst)[:n] = self.src_buffer
+            return Lzo_Codec.LZO_E_OK, n
+        return Lzo_Codec.Lzo1x_Decompress_Into(self.src_buffer, dst)
+
+    def decompress(self):
+        """ returns: buffer of the uncompressed data """
+        if not self.signature:
+            return self.src_buffer
+        dst_buffer = bytearray(self.uncompressed_size)
+        self.decompress_into(dst_buffer)
+        return dst_buffer
+
+    def content_key(self):
+        """ returns: a key, that is equal for equal contents """
+        return (self.signature, self.uncompressed_size if self.signature else None, sha1(self.src_buffer).digest())
 
     def grab_to_file(self, filename):
         with FileIO(filename, "wb") as raw_io:
-            if not self.signature:
-                raw_io.write(self.src_buffer)
-            else:
-                dst_buffer = bytearray(self.uncompressed_size)
-                src_size = len(self.src_buffer)
-                Lzo_Codec.Lzo1x_Decompress(self.src_buffer, 0, src_size, dst_buffer, 0)
-                raw_io.write(dst_buffer)
+            raw_io.write(self.decompress())
 
             raw_io.flush()
             raw_io.close()
 
 
+###############################################################################
+class Fpx_Resource_Provider:
+    """
+    in-memory access to the embedded resources of fpt, fpl and fpm files.
+    resources are registered by a relative file name and decompressed on
+    first access only. the decompressed data is kept in a session wide cache,
+    keyed by content, so a resource shared by several files or imported again
+    is decompressed once. a real file is only written, if asked for by
+    get_file (e.g. for blender operators, that only load from files).
+    """
+    ## upper limit of the session wide cache in bytes
+    CACHE_SIZE = 256 * 1024 * 1024
+
+    ## content key -> decompressed data, in order of last access
+    __cache = OrderedDict()
+    __cache_size = [0, ]
+
+    __slots__ = (
+            '__dst_path',
+            '__items',
+            '__files',
+            )
+
+    def __init__(self, dst_path=None):
+        if not dst_path:
+            dst_path = "fpx_grab"
+        self.__dst_path = path.normpath(dst_path)
+        self.__items = {}
+        self.__files = {}
+
+    def __contains__(self, name):
+        return name in self.__items
+
+    def add(self, name, raw_data):
+        """ raw_data = Fpx_zLZO_RawData_Stream or already decompressed buffer
+        returns: name of the registered resource """
+        name = path.normpath(name)
+        self.__items[name] = raw_data
+        # a file written for a former resource of that name is outdated
+        self.__files.pop(name, None)
+        return name
+
+    def names(self):
+        return self.__items.keys()
+
+    def get_buffer(self, name):
+        """ returns: read-only memoryview of the decompressed resource """
+        raw_data = self.__items[name]
+        if not isinstance(raw_data, Fpx_zLZO_RawData_Stream):
+            return memoryview(raw_data)
+        if not raw_data.signature:
+            return memoryview(raw_data.src_buffer)
+
+        cache = Fpx_Resource_Provider.__cache
+        key = raw_data.content_key()
+        buffer = cache.get(key)
+        if buffer is None:
+            buffer = bytes(raw_data.decompress())
+            cache[key] = buffer
+            Fpx_Resource_Provider.__cache_size[0] += len(buffer)
+            while Fpx_Resource_Provider.__cache_size[0] > Fpx_Resource_Provider.CACHE_SIZE and len(cache) > 1:
+                old_key, old_buffer = cache.popitem(last=False)
+                Fpx_Resource_Provider.__cache_size[0] -= len(old_buffer)
+        else:
+            cache.move_to_end(key)
+        return memoryview(buffer)
+
+    def open(self, name):
+        """ returns: file like object to read the decompressed resource """
+        return BytesIO(self.get_buffer(name))
+
+    def get_file(self, name):
+        """ writes the resource to a file below dst_path, on first call only
+        returns: path of the file """
+        full_path = self.__files.get(name)
+        if full_path is None:
+            full_path = path.join(self.__dst_path, name)
+            makedirs(path.dirname(full_path), mode=0o777, exist_ok=True)
+            with FileIO(full_path, "wb") as raw_io:
+                raw_io.write(self.get_buffer(name))
+            self.__files[name] = full_path
+        return full_path
+
+    def get_dir(self, name):
+        """ creates a sub directory below dst_path
+        returns: path of the directory """
+        full_path = path.normpath(path.join(self.__dst_path, name))
+        makedirs(full_path, mode=0o777, exist_ok=True)
+        return full_path
+
+    def grab_files(self, sub_names):
+        """ writes all resources of sub_names to files
+        returns: copy of sub_names with resource names replaced by paths """
+        dst_sub_path_names = {}
+        for key, value in sub_names.items():
+            if key == "type" or key.startswith("type_") or not isinstance(value, str):
+                pass
+            elif value in self:
+                value = self.get_file(value)
+            else:
+                value = self.get_dir(value)
+            dst_sub_path_names[key] = value
+        return dst_sub_path_names
+
+    def remove_files(self):
+        """ removes all files written by get_file and their empty directories """
+        dirs = set()
+        for full_path in self.__files.values():
+            try:
+                remove(full_path)
+            except OSError:
+                pass
+            dir = path.dirname(full_path)
+            while len(dir) > len(self.__dst_path):
+                dirs.add(dir)
+                dir = path.dirname(dir)
+        dirs.add(self.__dst_path)
+        for dir in sorted(dirs, key=len, reverse=True):
+            try:
+                rmdir(dir)
+            except OSError:
+                pass
+        self.__files.clear()
+
+
 ###############################################################################
 class Fpt_ChunkDescription:
     def __init__(self, id=0, type=Fpt_Chunk_Type.RAWDATA, name='', offset=0):
@@ -714,9 +860,8 @@ class Fpt_Data_Reader:
 
         stream_size = stream.size()
         while stream.tell() < stream_size:
-            chunk_size = stream.read_dword()
-            stream_pos = stream.tell()
-            chunk_id = stream.read_dword()
+            stream_pos = stream.tell() + Fp_Size_Type.DWORD
+            chunk_size, chunk_id = stream.read_unpack("<II", 2 * Fp_Size_Type.DWORD)
             descriptor = self.obj__chunks.get(chunk_id)
             if descriptor is None:
                 # try the alternative chunk_id
@@ -735,16 +880,16 @@ class Fpt_Data_Reader:
         pass
 
     def read_int(self, stream):
-        return unpack("<i", stream.read(4))[0]
+        return stream.read_unpack("<i", 4)[0]
 
     def read_float(self, stream):
-        return unpack("<f", stream.read(4))[0]
+        return stream.read_unpack("<f", 4)[0]
 
     def read_color(self, stream):
-        return unpack("<BBBB", stream.read(4))
+        return stream.read_unpack("<BBBB", 4)
 
     def read_vector2d(self, stream):
-        return unpack("<ff", stream.read(8))
+        return stream.read_unpack("<ff", 8)
 
     def read_string(self, stream):
         size = stream.read_dword()
@@ -2799,9 +2944,12 @@ class Fpm_File_Reader(Cfb_RawIO_Reader):
 
         #print("#DEBUG", reader)
 
-    def grab_content(self, dst_path=None):
-        dst_sub_path_names = {}
+    def get_content(self, provider):
+        """ registers the model data at provider
+        returns: dict of resource names """
+        return Fpm_File_Reader.get_content_ex(provider, { "modeldata": self.PinModel, }, {})
 
+    def grab_content(self, dst_path=None):
         if not dst_path:
             dst_path = "fpm_grab"
             dst_path = path.normpath(dst_path)
@@ -2815,76 +2963,47 @@ class Fpm_File_Reader(Cfb_RawIO_Reader):
         makedirs(dst_path, mode=0o777, exist_ok=True)
         self.__dst_path = dst_path
 
-        return Fpm_File_Reader.grab_content_ex(dst_path, { "modeldata": self.PinModel, }, dst_sub_path_names)
+        return Fpm_File_Reader.grab_content_ex(dst_path, { "modeldata": self.PinModel, }, {})
+
+    ## <key>_path, <key>_data of the model data, that get grabbed
+    MODEL_DATA_KEYS = (
+            "preview",
+            "primary_model",
+            "secondary_model",
+            "mask_model",
+            "reflection_model",
+            )
 
     @staticmethod
-    def grab_content_ex(dst_path, pinmodel_dict, dst_sub_path_names):
+    def get_content_ex(provider, pinmodel_dict, sub_names):
         for key, reader in pinmodel_dict.items():
             item_name = reader.get_value("name")
             item_name = FpxUtilities.toGoodName(item_name) ###
             if item_name:
-                dst_sub_path = path.join(dst_path, item_name)
-                makedirs(dst_sub_path, mode=0o777, exist_ok=True)
-                #print("#DEBUG", item_name, dst_path, dst_sub_path)
-                dst_sub_path_names["sub_dir"] = dst_sub_path
+                sub_path = item_name
+                sub_names["sub_dir"] = sub_path
             else:
-                dst_sub_path = dst_path
+                sub_path = ""
 
-            dst_sub_path_names[key] = dst_sub_path
+            sub_names[key] = path.normpath(sub_path)
 
             item_type = reader.get_value("type")
-            dst_sub_path_names["type"] = item_type
+            sub_names["type"] = item_type
 
-            # grab preview
-            win_item_path = reader.get_value("preview_path")
-            item_path = FpxUtilities.toGoodFilePath(win_item_path)
-            item_data_len = reader.get_value("preview_data_len")
-            item_data = reader.get_value("preview_data")
-            if item_path and item_data:
-                full_path = path.normpath(path.join(dst_sub_path, item_path))
-                item_data.grab_to_file(full_path)
-                dst_sub_path_names["preview_data"] = full_path
-
-            # grab primary_model
-            win_item_path = reader.get_value("primary_model_path")
-            item_path = FpxUtilities.toGoodFilePath(win_item_path)
-            item_data_len = reader.get_value("primary_model_data_len")
-            item_data = reader.get_value("primary_model_data")
-            if item_path and item_data:
-                full_path = path.normpath(path.join(dst_sub_path, item_path))
-                item_data.grab_to_file(full_path)
-                dst_sub_path_names["primary_model_data"] = full_path
-
-            # grab secondary_model
-            win_item_path = reader.get_value("secondary_model_path")
-            item_path = FpxUtilities.toGoodFilePath(win_item_path)
-            item_data_len = reader.get_value("secondary_model_data_len")
-            item_data = reader.get_value("secondary_model_data")
-            if item_path and item_data:
-                full_path = path.normpath(path.join(dst_sub_path, item_path))
-                item_data.grab_to_file(full_path)
-                dst_sub_path_names["secondary_model_data"] = full_path
-
-            # grab mask_model
-            win_item_path = reader.get_value("mask_model_path")
-            item_path = FpxUtilities.toGoodFilePath(win_item_path)
-            item_data_len = reader.get_value("mask_model_data_len")
-            item_data = reader.get_value("mask_model_data")
-            if item_path and item_data:
-                full_path = path.normpath(path.join(dst_sub_path, item_path))
-                item_data.grab_to_file(full_path)
-                dst_sub_path_names["mask_model_data"] = full_path
-
-            # grab reflection_model
-            win_item_path = reader.get_value("reflection_model_path")
-            item_path = FpxUtilities.toGoodFilePath(win_item_path)
-            item_data_len = reader.get_value("reflection_model_data_len")
-            item_data = reader.get_value("reflection_model_data")
-            if item_path and item_data:
-                full_path = path.normpath(path.join(dst_sub_path, item_path))
-                item_data.grab_to_file(full_path)
-                dst_sub_path_names["reflection_model_data"] = full_path
+            for data_key in Fpm_File_Reader.MODEL_DATA_KEYS:
+                win_item_path = reader.get_value("{}_path".format(data_key))
+                item_path = FpxUtilities.toGoodFilePath(win_item_path)
+                item_data = reader.get_value("{}_data".format(data_key))
+                if item_path and item_data:
+                    sub_names["{}_data".format(data_key)] = provider.add(path.join(sub_path, item_path), item_data)
 
+        return sub_names
+
+    @staticmethod
+    def grab_content_ex(dst_path, pinmodel_dict, dst_sub_path_names):
+        provider = Fpx_Resource_Provider(dst_path)
+        sub_names = Fpm_File_Reader.get_content_ex(provider, pinmodel_dict, {})
+        dst_sub_path_names.update(provider.grab_files(sub_names))
         return dst_path, dst_sub_path_names
 
 
@@ -2945,23 +3064,10 @@ class Fpl_File_Reader(Cfb_RawIO_Reader):
             data.FDAT = Fpx_zLZO_RawData_Stream(stream)
         pass
 
-    def grab_content(self, dst_path=None, filter={}, name=None):
-        if not dst_path:
-            dst_path = "fpl_grab"
-            dst_path = path.normpath(dst_path)
-            #while path.exists(dst_path):
-            #    u_time = unpack("<Q", pack("<d", time()))[0]
-            #    dst_path = "fpl_grab_{:016X}".format(u_time)
-            #    dst_path = path.normpath(dst_path)
-        else:
-            #BUG in makedirs. does not create a folder ending with a blank
-            #dst_path = path.normpath(dst_path)
-            dst_path = path.normpath(dst_path.rstrip('. '))
-
-        makedirs(dst_path, mode=0o777, exist_ok=True)
-        self.__dst_path = dst_path
-
-        dst_sub_path_names = {}
+    def get_content(self, provider, filter={}, name=None):
+        """ registers the library items at provider
+        returns: dict of resource names """
+        sub_names = {}
 
         if name:
             items = [[name, self.__data.get(name)], ]
@@ -2975,11 +3081,8 @@ class Fpl_File_Reader(Cfb_RawIO_Reader):
             if value._FTYP not in filter:
                 continue
 
-            dst_sub_path = path.join(dst_path, item_name)
-            makedirs(dst_sub_path, mode=0o777, exist_ok=True)
-
-            dst_sub_path_names["sub_dir_{}".format(item_name)] = dst_sub_path
-            dst_sub_path_names["type_{}".format(item_name)] = value._FTYP
+            sub_names["sub_dir_{}".format(item_name)] = item_name
+            sub_names["type_{}".format(item_name)] = value._FTYP
 
             # grab item
             win_file_path = value.FPAT
@@ -2987,11 +3090,29 @@ class Fpl_File_Reader(Cfb_RawIO_Reader):
             item_path=path.split(file_path)[1]
             item_data=value.FDAT
             if item_path and item_data:
-                full_path = path.normpath(path.join(dst_sub_path, item_path))
-                item_data.grab_to_file(full_path)
-                dst_sub_path_names[item_name] = full_path
+                sub_names[item_name] = provider.add(path.join(item_name, item_path), item_data)
 
-        return dst_path, dst_sub_path_names
+        return sub_names
+
+    def grab_content(self, dst_path=None, filter={}, name=None):
+        if not dst_path:
+            dst_path = "fpl_grab"
+            dst_path = path.normpath(dst_path)
+            #while path.exists(dst_path):
+            #    u_time = unpack("<Q", pack("<d", time()))[0]
+            #    dst_path = "fpl_grab_{:016X}".format(u_time)
+            #    dst_path = path.normpath(dst_path)
+        else:
+            #BUG in makedirs. does not create a folder ending with a blank
+            #dst_path = path.normpath(dst_path)
+            dst_path = path.normpath(dst_path.rstrip('. '))
+
+        makedirs(dst_path, mode=0o777, exist_ok=True)
+        self.__dst_path = dst_path
+
+        provider = Fpx_Resource_Provider(dst_path)
+        sub_names = self.get_content(provider, filter, name)
+        return dst_path, provider.grab_files(sub_names)
 
 
 ###############################################################################
@@ -3095,21 +3216,10 @@ class Fpt_File_Reader(Cfb_RawIO_Reader):
         makedirs(dst_path, mode=0o777, exist_ok=False)
         self.__dst_path = dst_path
 
-    def grab_content(self, dst_path=None, name=None, filter=None):
-        if not dst_path:
-            dst_path = "fpt_grab"
-            dst_path = path.normpath(dst_path)
-            #while path.exists(dst_path):
-            #    u_time = unpack("<Q", pack("<d", time()))[0]
-            #    dst_path = "fpl_grab_{:016X}".format(u_time)
-            #    dst_path = path.normpath(dst_path)
-        else:
-            dst_path = path.normpath(dst_path)
-
-        makedirs(dst_path, mode=0o777, exist_ok=True)
-        self.__dst_path = dst_path
-
-        dst_sub_path_names = {}
+    def get_content(self, provider, name=None, filter=None):
+        """ registers the embedded resources at provider
+        returns: dict of resource names """
+        sub_names = {}
 
         if name:
             items = [[name, self.__data.get(name)], ]
@@ -3125,8 +3235,6 @@ class Fpt_File_Reader(Cfb_RawIO_Reader):
             if not item_name:
                 continue
 
-            dst_sub_path = dst_path.rstrip('. ')
-
             item_data_dict = {}
 
             if isinstance(reader, Fpt_Image_Reader):
@@ -3157,9 +3265,8 @@ class Fpt_File_Reader(Cfb_RawIO_Reader):
             elif isinstance(reader, Fpt_PinModel_Reader):
                 type = Fpt_PackedLibrary_Type.TYPE_MODEL
 
-                fpm_sub_path_names = {}
-                dst_sub_path_names["data_{}".format(item_name)] = Fpm_File_Reader.grab_content_ex(dst_path, { item_name: reader, }, fpm_sub_path_names)
-                dst_sub_path_names["type_{}".format(item_name)] = type
+                sub_names["data_{}".format(item_name)] = Fpm_File_Reader.get_content_ex(provider, { item_name: reader, }, {})
+                sub_names["type_{}".format(item_name)] = type
 
             elif isinstance(reader, Fpt_ImageList_Reader):
                 ##TODO
@@ -3183,10 +3290,35 @@ class Fpt_File_Reader(Cfb_RawIO_Reader):
             for sub_item_name, sub_item_data in item_data_dict.items():
                 if not sub_item_data:
                     continue
-                full_path = path.normpath(path.join(dst_sub_path, "{}.{}".format(sub_item_name, item_ext))).lower()
-                sub_item_data.grab_to_file(full_path)
-                dst_sub_path_names[sub_item_name] = full_path
-                dst_sub_path_names["type_{}".format(sub_item_name)] = type
+                sub_names[sub_item_name] = provider.add("{}.{}".format(sub_item_name, item_ext).lower(), sub_item_data)
+                sub_names["type_{}".format(sub_item_name)] = type
+
+        return sub_names
+
+    def grab_content(self, dst_path=None, name=None, filter=None):
+        if not dst_path:
+            dst_path = "fpt_grab"
+            dst_path = path.normpath(dst_path)
+            #while path.exists(dst_path):
+            #    u_time = unpack("<Q", pack("<d", time()))[0]
+            #    dst_path = "fpl_grab_{:016X}".format(u_time)
+            #    dst_path = path.normpath(dst_path)
+        else:
+            dst_path = path.normpath(dst_path)
+
+        makedirs(dst_path, mode=0o777, exist_ok=True)
+        self.__dst_path = dst_path
+
+        provider = Fpx_Resource_Provider(dst_path.rstrip('. '))
+        sub_names = self.get_content(provider, name, filter)
+
+        dst_sub_path_names = {}
+        for key, value in sub_names.items():
+            if key.startswith("data_"):
+                value = (dst_path, provider.grab_files(value))
+            elif value in provider:
+                value = provider.get_file(value)
+            dst_sub_path_names[key] = value
 
         return dst_path, dst_sub_path_names
 
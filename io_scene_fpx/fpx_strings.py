@@ -43,6 +43,8 @@ fpx_str = {
         # strings to be used with 'str().format()'
         'SUMMARY_IMPORT': "elapsed time: {0:.4}s (media io:"\
                 " ~{1:.4}s, converter: ~{2:.4}s)",
+        'SUMMARY_IMPORT_FILE': "{0}: elapsed time: {1:.4}s (media io:"\
+                " ~{2:.4}s, converter: ~{3:.4}s)",
 
         ###############################
         'TEXT_OPERATOR_FPT': "Future Pinball Table (.fpt)",
@@ -103,6 +105,8 @@ fpx_str = {
         'PROP_DESC_SCENE': "Model To New Scene",
         'PROP_NAME_ALL_MODELS': "Import All Models Of Folder",
         'PROP_DESC_ALL_MODELS': "Import All Models Of Folder",
+        'PROP_NAME_PROCESSES': "Processes",
+        'PROP_DESC_PROCESSES': "Number of processes to read the models of the folder with (0 = one per CPU)",
         'PROP_NAME_MODEL_ADJUST': "Adjust Model Position",
         'PROP_DESC_MODEL_ADJUST': "Adjust Model Position According Its Type",
 
@@ -110,6 +110,7 @@ class FpxUI:
 
     PROP_DEFAULT_SCENE = False
     PROP_DEFAULT_ALL_MODELS = False
+    PROP_DEFAULT_PROCESSES = 0
     PROP_DEFAULT_MODEL_ADJUST_FPM = False
     PROP_DEFAULT_MODEL_ADJUST_FPL = True
     PROP_DEFAULT_MODEL_ADJUST_FPT = True
@@ -286,6 +287,14 @@ class FpmImportOperator(Operator, ImportHelper):
             default=FpxUI.PROP_DEFAULT_ALL_MODELS,
             )
 
+    processes = IntProperty(
+            name=fpx_str['PROP_NAME_PROCESSES'],
+            description=fpx_str['PROP_DESC_PROCESSES'],
+            default=FpxUI.PROP_DEFAULT_PROCESSES,
+            min=0,
+            max=64,
+            )
+
     use_scene_per_model = BoolProperty(
             name=fpx_str['PROP_NAME_SCENE'],
             description=fpx_str['PROP_DESC_SCENE'],
@@ -361,6 +370,8 @@ class FpmImportOperator(Operator, ImportHelper):
         flow = box.column_flow()
         flow.prop(self, 'keep_temp', icon='GHOST')
         flow.prop(self, 'use_all_models_of_folder', icon='FILE_FOLDER')
+        if self.use_all_models_of_folder:
+            flow.prop(self, 'processes')
         flow.prop(self, 'use_scene_per_model', icon='SCENE_DATA')
         flow.prop(self, 'name_extra', icon='TEXT', text="")
 
@@ -378,6 +389,7 @@ class FpmImportOperator(Operator, ImportHelper):
                 verbose=self.verbose,
                 keep_temp=self.keep_temp,
                 use_all_models_of_folder=self.use_all_models_of_folder,
+                processes=self.processes,
                 use_scene_per_model=self.use_scene_per_model,
                 name_extra=self.name_extra,
                 use_model_filter=self.use_model_filter,
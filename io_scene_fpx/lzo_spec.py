@@ -41,172 +41,294 @@ class Lzo_Codec:
     LZO_E_OK                  =  0
     LZO_E_ERROR               = -1
     LZO_E_INPUT_OVERRUN       = -4
+    LZO_E_OUTPUT_OVERRUN      = -5
     LZO_E_LOOKBEHIND_OVERRUN  = -6
     LZO_E_INPUT_NOT_CONSUMED  = -8
 
+    ## where the decoder continues, named after the labels in lzo1x_d.ch
+    _LOOP = 0      ## read the next instruction
+    _LITERAL = 1   ## copy t literals, then a match follows
+    _MATCH = 2     ## decode the match instruction t
+
     @staticmethod
     def Lzo1x_Decompress(src, src_offset, src_length, dst, dst_offset):
         """
-        src = bytes
-        dst = bytearray
+        src = bytes (or anything indexable and sliceable to bytes)
+        dst = bytearray or writable memoryview, large enough for the
+              decompressed data (it is never resized)
+
+        literal runs and matches are copied with slice assignments,
+        matches that overlap their own output (runs of a repeated
+        pattern) are copied in chunks that double in size.
 
-        returns: error, result_index
+        returns: error, result_index (number of bytes written to dst)
         """
-        src_index = src_offset
-        dst_index = dst_offset
-        value = 0
-        pos = 0
+        LOOP = Lzo_Codec._LOOP
+        LITERAL = Lzo_Codec._LITERAL
+        MATCH = Lzo_Codec._MATCH
+
+        ip = src_offset
+        ip_end = src_offset + src_length
+        op = dst_offset
+        op_end = len(dst)
         error = Lzo_Codec.LZO_E_OK
-        result_index = dst_index
-
-        value = src[src_index]
-        src_index += 1
-        if value > 17:
-            value -= 17
-            while True: ## do while value > 0
-                dst[dst_index] = src[src_index]
-                value -= 1
-                if value <= 0:
-                    break ## do while value > 0
-            dst_index += 1
-            src_index += 1
-            value = src[src_index]
-            src_index += 1
-            if value < 16:
-                error = Lzo_Codec.LZO_E_ERROR
-                return error, result_index
-
-        ## loop:
-        loop = False
-        src_index -= 1 ## 1 for (;;value = src[src_index++])
-        while not loop: ## 1 for (;;value = src[src_index++])
-            value = src[src_index] ## 1 for (;;value = src[src_index++])
-            src_index += 1 ## 1 for (;;value = src[src_index++])
-            if value < 16:
-                if value == 0:
-                    while src[src_index] == 0:
-                        value += 255
-                        src_index += 1
-                    value += 15 + src[src_index]
-                    src_index += 1
-                value += 3
-                while True: ## do while value > 0
-                    dst[dst_index] = src[src_index]
-                    dst_index += 1
-                    src_index += 1
-                    value -= 1
-                    if value <= 0:
-                        break ## do while value > 0
-                value = src[src_index]
-                src_index += 1
-                if value < 16:
-                    pos = dst_index - 0x801 - (value >> 2) - (src[src_index] << 2)
-                    src_index += 1
+        eof = False
+        t = 0
+
+        try:
+            state = LOOP
+            if src[ip] > 17:
+                t = src[ip] - 17
+                ip += 1
+                if t < 4:
+                    ## goto match_next
+                    if ip + t > ip_end:
+                        return Lzo_Codec.LZO_E_INPUT_OVERRUN, 0
+                    if op + t > op_end:
+                        return Lzo_Codec.LZO_E_OUTPUT_OVERRUN, 0
+                    dst[op:op + t] = src[ip:ip + t]
+                    op += t
+                    ip += t
+                    t = src[ip]
+                    ip += 1
+                    state = MATCH
+                else:
+                    state = LITERAL
+
+            while not eof:
+                if state == LOOP:
+                    t = src[ip]
+                    ip += 1
+                    if t >= 16:
+                        state = MATCH
+                    else:
+                        if t == 0:
+                            while src[ip] == 0:
+                                t += 255
+                                ip += 1
+                            t += 15 + src[ip]
+                            ip += 1
+                        t += 3
+                        state = LITERAL
+
+                if state == LITERAL:
+                    if ip + t > ip_end:
+                        error = Lzo_Codec.LZO_E_INPUT_OVERRUN
+                        break
+                    if op + t > op_end:
+                        error = Lzo_Codec.LZO_E_OUTPUT_OVERRUN
+                        break
+                    dst[op:op + t] = src[ip:ip + t]
+                    op += t
+                    ip += t
+                    ## first_literal_run:
+                    t = src[ip]
+                    ip += 1
+                    state = MATCH
+                    if t < 16:
+                        ## a 3 byte match right after a literal run,
+                        ## its offset is > 0x800, so it never overlaps
+                        pos = op - 0x801 - (t >> 2) - (src[ip] << 2)
+                        ip += 1
+                        if pos < dst_offset:
+                            error = Lzo_Codec.LZO_E_LOOKBEHIND_OVERRUN
+                            break
+                        if op + 3 > op_end:
+                            error = Lzo_Codec.LZO_E_OUTPUT_OVERRUN
+                            break
+                        dst[op:op + 3] = dst[pos:pos + 3]
+                        op += 3
+                        t = src[ip - 2] & 3
+                        if t == 0:
+                            state = LOOP
+                            continue
+                        if ip + t > ip_end:
+                            error = Lzo_Codec.LZO_E_INPUT_OVERRUN
+                            break
+                        if op + t > op_end:
+                            error = Lzo_Codec.LZO_E_OUTPUT_OVERRUN
+                            break
+                        dst[op:op + t] = src[ip:ip + t]
+                        op += t
+                        ip += t
+                        t = src[ip]
+                        ip += 1
+
+                ## state == MATCH: matches, each followed by up to 3
+                ## literals, until one is followed by none
+                while True:
+                    if t >= 64:
+                        pos = op - 1 - ((t >> 2) & 7) - (src[ip] << 3)
+                        ip += 1
+                        t = (t >> 5) - 1
+                    elif t >= 32:
+                        t &= 31
+                        if t == 0:
+                            while src[ip] == 0:
+                                t += 255
+                                ip += 1
+                            t += 31 + src[ip]
+                            ip += 1
+                        pos = op - 1 - (src[ip] >> 2) - (src[ip + 1] << 6)
+                        ip += 2
+                    elif t >= 16:
+                        pos = op - ((t & 8) << 11)
+                        t &= 7
+                        if t == 0:
+                            while src[ip] == 0:
+                                t += 255
+                                ip += 1
+                            t += 7 + src[ip]
+                            ip += 1
+                        pos -= (src[ip] >> 2) + (src[ip + 1] << 6)
+                        ip += 2
+                        if pos == op:
+                            ## end of stream marker
+                            eof = True
+                            break
+                        pos -= 0x4000
+                    else:
+                        ## a 2 byte match
+                        pos = op - 1 - (t >> 2) - (src[ip] << 2)
+                        ip += 1
+                        t = 0
                     if pos < dst_offset:
                         error = Lzo_Codec.LZO_E_LOOKBEHIND_OVERRUN
-                        loop = True
-                        break ## loop
-                    value = 3
-                    while True: ## do while value > 0
-                        dst[dst_index] = dst[pos]
-                        dst_index += 1
-                        pos += 1
-                        value -= 1
-                        if value <= 0:
-                            break ## do while value > 0
-                    value = src[src_index-2] & 3
-                    if value == 0:
-                        continue ## 1 for (;;value = src[src_index++])
-                    while True: ## do while value > 0
-                        dst[dst_index] = src[src_index]
-                        dst_index += 1
-                        src_index += 1
-                        value -= 1
-                        if value <= 0:
-                            break ## do while value > 0
-                    value = src[src_index]
-                    src_index += 1
-
-            src_index -= 1 ## 2 for (;;value = src[src_index++])
-            while not loop: ## 2 for (;;value = src[src_index++])
-                value = src[src_index] ## 2 for (;;value = src[src_index++])
-                src_index += 1 ## 2 for (;;value = src[src_index++])
-                if value >= 64:
-                    pos = dst_index - 1 - ((value >> 2) & 7) - (src[src_index] << 3)
-                    src_index += 1
-                    value = (value >> 5) - 1
-                elif value >= 32:
-                    value &= 31
-                    if value == 0:
-                        while src[src_index] == 0:
-                            value += 255
-                            src_index += 1
-                        value += 31 + src[src_index]
-                        src_index += 1
-                    pos = dst_index - 1 - (src[src_index] >> 2)
-                    src_index += 1
-                    pos -= (src[src_index] << 6)
-                    src_index += 1
-                elif value >= 16:
-                    pos = dst_index - ((value & 8) << 11)
-                    value &= 7
-                    if value == 0:
-                        while src[src_index] == 0:
-                            value += 255
-                            src_index += 1
-                        value += 7 + src[src_index]
-                        src_index += 1
-                    pos -= (src[src_index] >> 2)
-                    src_index += 1
-                    pos -= (src[src_index] << 6)
-                    src_index += 1
-                    if pos == dst_index:
-                        loop = True
-                        break ## loop
-                    pos -= 0x4000
-                else:
-                    pos = dst_index - 1 - (value >> 2) - (src[src_index] << 2)
-                    src_index += 1
-                    value = 0
-                if pos < dst_offset:
-                    error = Lzo_Codec.LZO_E_LOOKBEHIND_OVERRUN
-                    loop = True
-                    break ## loop
-                value += 2
-                while True: ## do while value > 0
-                    dst[dst_index] = dst[pos]
-                    dst_index += 1
-                    pos += 1
-                    value -= 1
-                    if value <= 0:
-                        break ## do while value > 0
-                value = src[src_index - 2] & 3
-                if value == 0:
+                        break
+                    t += 2
+                    end = op + t
+                    if end > op_end:
+                        error = Lzo_Codec.LZO_E_OUTPUT_OVERRUN
+                        break
+                    if pos + t <= op:
+                        dst[op:end] = dst[pos:pos + t]
+                        op = end
+                    else:
+                        ## the match overlaps its own output, it repeats
+                        ## the last op - pos bytes; each copied chunk
+                        ## doubles the repeated part that can be copied
+                        while op < end:
+                            n = min(op - pos, end - op)
+                            dst[op:op + n] = dst[pos:pos + n]
+                            op += n
+                    ## match_done:
+                    t = src[ip - 2] & 3
+                    if t == 0:
+                        break
+                    ## match_next:
+                    if ip + t > ip_end:
+                        error = Lzo_Codec.LZO_E_INPUT_OVERRUN
+                        break
+                    if op + t > op_end:
+                        error = Lzo_Codec.LZO_E_OUTPUT_OVERRUN
+                        break
+                    dst[op:op + t] = src[ip:ip + t]
+                    op += t
+                    ip += t
+                    t = src[ip]
+                    ip += 1
+                if error < Lzo_Codec.LZO_E_OK:
                     break
-                while True: ## do while value > 0
-                    dst[dst_index] = src[src_index]
-                    dst_index += 1
-                    src_index += 1
-                    value -= 1
-                    if value <= 0:
-                        break ## do while value > 0
-
-        src_index -= src_offset
-        dst_index -= dst_offset
-        result_index = dst_index
+                state = LOOP
+        except IndexError:
+            ## ran past the end of src
+            return Lzo_Codec.LZO_E_INPUT_OVERRUN, op - dst_offset
+
+        result_index = op - dst_offset
         if error < Lzo_Codec.LZO_E_OK:
             return error, result_index
-        if src_index < src_length:
+        if ip < ip_end:
             error = Lzo_Codec.LZO_E_INPUT_NOT_CONSUMED
             return error, result_index
-        if src_index > src_length:
+        if ip > ip_end:
             error = Lzo_Codec.LZO_E_INPUT_OVERRUN
             return error, result_index
-        if value != 1:
+        if t != 1:
             error = Lzo_Codec.LZO_E_ERROR
             return error, result_index
         return error, result_index
 
+    @staticmethod
+    def Lzo1x_Decompress_Into(src, dst):
+        """
+        src = bytes, a complete LZO1X compressed block
+        dst = bytearray, memoryview or any other writable buffer,
+              it receives the decompressed data from its start
+              (e.g. a slice of a larger memoryview)
+
+        returns: error, result_index (number of bytes written to dst)
+        """
+        if not isinstance(dst, memoryview):
+            dst = memoryview(dst)
+        if dst.format != 'B':
+            dst = dst.cast('B')
+        return Lzo_Codec.Lzo1x_Decompress(src, 0, len(src), dst, 0)
+
+###############################################################################
+
+
+if __name__ == "__main__":
+    ## round-trip benchmark:
+    ##   python lzo_spec.py [chunk files]
+    ## a chunk file holds a zLZO chunk as it is stored in fpt/fpm/fpl files
+    ## ('zLZO', dword uncompressed size, LZO1X data). without chunk files,
+    ## generated sample data is used. recompressing (and the sample data)
+    ## needs the python-lzo module.
+    from struct import unpack
+    from sys import argv
+    from time import time
+    try:
+        import lzo
+    except ImportError:
+        lzo = None
+
+    samples = []
+    for filename in argv[1:]:
+        with open(filename, "rb") as f:
+            data = f.read()
+        if data[:4] != b'zLZO':
+            print("{}: not a zLZO chunk".format(filename))
+            continue
+        size = unpack("<I", data[4:8])[0]
+        samples.append((filename, data[8:], size))
+
+    if not samples:
+        if not lzo:
+            raise SystemExit("sample data needs the python-lzo module")
+        from random import Random
+        rng = Random(0)
+        ## texture like: rows of slowly changing pixels
+        texture = bytearray()
+        for y in range(512):
+            pixel = [rng.randrange(256) for i in range(4)]
+            for x in range(512):
+                if rng.random() < 0.2:
+                    pixel[rng.randrange(4)] = rng.randrange(256)
+                texture.extend(pixel)
+        ## model like: vertices on a grid and repeating index patterns
+        model = bytearray()
+        for i in range(100000):
+            model.extend((i % 317).to_bytes(2, "little") * 3)
+            model.extend(bytes(rng.randrange(4) for j in range(4)))
+        for (name, raw) in (("texture", bytes(texture)), ("model", bytes(model)),
+                ("zeros", bytes(1 << 20))):
+            samples.append((name, lzo.compress(raw, 1, False), len(raw)))
+
+    for (name, src, size) in samples:
+        dst = bytearray(size)
+        start = time()
+        error, result_index = Lzo_Codec.Lzo1x_Decompress(src, 0, len(src), dst, 0)
+        duration = time() - start
+        status = "ok" if error == Lzo_Codec.LZO_E_OK and result_index == size else "error {}".format(error)
+        if lzo and error == Lzo_Codec.LZO_E_OK:
+            again = lzo.compress(bytes(dst), 1, False)
+            view = memoryview(bytearray(size))
+            error, result_index = Lzo_Codec.Lzo1x_Decompress_Into(again, view)
+            if error != Lzo_Codec.LZO_E_OK or view.tobytes() != bytes(dst):
+                status = "round-trip mismatch"
+        print("{:<30} {:>10} -> {:>10} bytes {:>8.3f} s {:>8.1f} MB/s {}".format(
+                name, len(src), size, duration, size / max(duration, 1e-9) / 1e6, status))
+
 ###############################################################################
 
 
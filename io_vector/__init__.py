@@ -118,6 +118,20 @@ class VectorImporter(bpy.types.Operator, ImportHelper):
     cap_back = BoolProperty(name="Cap back",
       description="Cap the back if extruding",
       default=False)
+    triangulator = EnumProperty(name="Triangulation",
+      description="Method for triangulating faces before making quads",
+      items=[ \
+        ('EARCHOP', "Ear Chopping",
+            "Chop ears off the faces, slow on big faces with many holes"),
+        ('SWEEP', "Sweep Line",
+            "Split faces into monotone pieces with a sweep line," \
+            " much faster on big faces with many holes"),
+        ],
+      default='EARCHOP')
+    pages = StringProperty(name="Pages",
+      description="Pages to import from PDF files, such as 1-3,7 or all;" \
+        " empty for the first page",
+      default="")
     true_scale = BoolProperty(name="True Scale",
       description="Use true scale, with 1 meter = 1 blender unit",
       default=False)
@@ -143,6 +157,8 @@ class VectorImporter(bpy.types.Operator, ImportHelper):
         box.prop(self, "bevel_amount")
         box.prop(self, "bevel_pitch")
         box.prop(self, "cap_back")
+        box.prop(self, "triangulator")
+        box.prop(self, "pages")
         if self.num_verts > 0:
             layout.label(text="Ve:" + str(self.num_verts) + \
               " | Fa:" + str(self.num_faces))
@@ -164,6 +180,8 @@ class VectorImporter(bpy.types.Operator, ImportHelper):
         options.bevel_amount = self.bevel_amount
         options.bevel_pitch = self.bevel_pitch
         options.cap_back = self.cap_back
+        options.triangulator = self.triangulator
+        options.pages = self.pages
         options.convert_options.subdiv_kind = self.subdiv_kind
         options.convert_options.smoothness = self.smoothness
         options.convert_options.filled_only = self.filled_only
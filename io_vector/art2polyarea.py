@@ -149,17 +149,22 @@ def CombineSimplePolyAreas(subpolyareas):
     n = len(subpolyareas)
     areas = [geom.SignedArea(pa.poly, pa.points) for pa in subpolyareas]
     lens = list(map(lambda x: len(x.poly), subpolyareas))
-    cls = dict()
-    for i in range(n):
-        for j in range(n):
-            cls[(i, j)] = _ClassifyPathPairs(subpolyareas[i], subpolyareas[j])
+    boxes = [_PolyBounds(pa) for pa in subpolyareas]
+    cls = _LazyClassification(subpolyareas, boxes)
     # calculate set cont where (i,j) is in cont if
-    # subpolyareas[i] contains subpolyareas[j]
+    # subpolyareas[i] contains subpolyareas[j].
+    # Only paths with overlapping bounding boxes can contain each other.
     cont = set()
-    for i in range(n):
-        for j in range(n):
-            if i != j and _Contains(i, j, areas, lens, cls):
-                cont.add((i, j))
+    for (i, j) in _OverlappingBoxPairs(boxes):
+        if _Contains(i, j, areas, lens, cls):
+            cont.add((i, j))
+        if _Contains(j, i, areas, lens, cls):
+            cont.add((j, i))
+    inside = [[] for i in range(n)]
+    outside = [[] for i in range(n)]
+    for (i, j) in sorted(cont):
+        inside[i].append(j)
+        outside[j].append(i)
     # now make real PolyAreas, with holes assigned
     polyareas = []
     assigned = set()
@@ -168,10 +173,10 @@ def CombineSimplePolyAreas(subpolyareas):
         for i in range(n):
             if i in assigned:
                 continue
-            if _IsBoundary(i, n, cont, assigned):
+            if _IsBoundary(i, outside, assigned):
                 # have a new boundary area, i
                 assigned.add(i)
-                holes = _GetHoles(i, n, cont, assigned)
+                holes = _GetHoles(i, inside, cont, assigned)
                 pa = subpolyareas[i]
                 for j in holes:
                     pa.AddHole(subpolyareas[j])
@@ -622,12 +627,14 @@ def _Angle(u, v):
     return theta
 
 
-def _ClassifyPathPairs(a, b):
+def _ClassifyPathPairs(a, b, abox=None):
     """Classify vertices of path b with respect to path a.
 
     Args:
       a: geom.PolyArea - the test outer face (ignoring holes)
       b: geom.PolyArea - the test inner face (ignoring holes)
+      abox: (float, float, float, float) - optional bounding box of a;
+          vertices of b outside of it are outside a without testing
     Returns:
       (int, int) - first is #verts of b inside a, second is #verts of b on a
     """
@@ -636,6 +643,9 @@ def _ClassifyPathPairs(a, b):
     num_on = 0
     for v in b.poly:
         vp = b.points.pos[v]
+        if abox and (vp[0] < abox[0] or vp[1] < abox[1] or
+                     vp[0] > abox[2] or vp[1] > abox[3]):
+            continue
         k = geom.PointInside(vp, a.poly, a.points)
         if k > 0:
             num_in += 1
@@ -644,6 +654,67 @@ def _ClassifyPathPairs(a, b):
     return (num_in, num_on)
 
 
+class _LazyClassification(object):
+    """Maps pairs (i,j) to _ClassifyPathPairs results, computed on demand.
+
+    Attributes:
+      polyareas: list of geom.PolyArea
+      boxes: list of (float, float, float, float) - their bounding boxes
+      cache: dict - already computed classifications
+    """
+
+    def __init__(self, polyareas, boxes):
+        self.polyareas = polyareas
+        self.boxes = boxes
+        self.cache = dict()
+
+    def __getitem__(self, pair):
+        if pair not in self.cache:
+            (i, j) = pair
+            self.cache[pair] = _ClassifyPathPairs(self.polyareas[i],
+                self.polyareas[j], self.boxes[i])
+        return self.cache[pair]
+
+
+def _PolyBounds(pa):
+    """Return the bounding box of the outer boundary of a PolyArea.
+
+    Args:
+      pa: geom.PolyArea
+    Returns:
+      (float, float, float, float) - (xmin, ymin, xmax, ymax)
+    """
+
+    pos = pa.points.pos
+    xs = [pos[v][0] for v in pa.poly]
+    ys = [pos[v][1] for v in pa.poly]
+    return (min(xs), min(ys), max(xs), max(ys))
+
+
+def _OverlappingBoxPairs(boxes):
+    """Find all pairs of overlapping bounding boxes.
+
+    Sweeps a line over x, keeping the boxes that the sweep line
+    currently crosses, so only boxes that overlap in x are compared.
+
+    Args:
+      boxes: list of (float, float, float, float) - (xmin, ymin, xmax, ymax)
+    Returns:
+      list of (int, int) - pairs (i,j), i < j, of overlapping boxes
+    """
+
+    pairs = []
+    active = []
+    for i in sorted(range(len(boxes)), key=lambda i: boxes[i][0]):
+        (xmin, ymin, xmax, ymax) = boxes[i]
+        active = [j for j in active if boxes[j][2] >= xmin]
+        for j in active:
+            if boxes[j][1] <= ymax and boxes[j][3] >= ymin:
+                pairs.append((min(i, j), max(i, j)))
+        active.append(i)
+    return pairs
+
+
 def _Contains(i, j, areas, lens, cls):
     """Return True if path i contains majority of vertices of path j.
 
@@ -671,28 +742,25 @@ def _Contains(i, j, areas, lens, cls):
             return True
 
 
-def _IsBoundary(i, n, cont, assigned):
+def _IsBoundary(i, outside, assigned):
     """Is path i a boundary, given current assignment?
 
     Args:
       i: int - index of a path to test for boundary possiblity
-      n: int - total number of paths
-      cont: dict - maps path pairs (i,j) to _Contains(i,j,...) result
+      outside: list of list of int - for each path, the paths containing it
       assigned: set  of int - which paths are already assigned
     Returns:
       bool - True if there is no unassigned j, j!=i, such that
              path j contains path i
     """
 
-    for j in range(0, n):
-        if j == i or j in assigned:
-            continue
-        if (j, i) in cont:
+    for j in outside[i]:
+        if j not in assigned:
             return False
     return True
 
 
-def _GetHoles(i, n, cont, assigned):
+def _GetHoles(i, inside, cont, assigned):
     """Find holes for path i: i.e., unassigned paths directly inside it.
 
     Directly inside means there is not some other unassigned path k
@@ -701,8 +769,9 @@ def _GetHoles(i, n, cont, assigned):
 
     Args:
       i: int - index of a boundary path
-      n: int - total number of paths
-      cont: dict - maps path pairs (i,j) to _Contains(i,j,...) result
+      inside: list of list of int - for each path, the paths it contains,
+          in increasing order
+      cont: set - path pairs (i,j) where path i contains path j
       assigned: set  of int - which paths are already assigned
     Returns:
       list of int - indices of paths that are islands
@@ -711,20 +780,19 @@ def _GetHoles(i, n, cont, assigned):
     """
 
     isls = []
-    for j in range(0, n):
+    for j in inside[i]:
         if j in assigned:
             continue   # catches i==j too, since i is assigned by now
-        if (i, j) in cont:
-            directly = True
-            for k in range(0, n):
-                if k == j or k in assigned:
-                    continue
-                if (i, k) in cont and (k, j) in cont:
-                    directly = False
-                    break
-            if directly:
-                isls.append(j)
-                assigned.add(j)
+        directly = True
+        for k in inside[i]:
+            if k == j or k in assigned:
+                continue
+            if (k, j) in cont:
+                directly = False
+                break
+        if directly:
+            isls.append(j)
+            assigned.add(j)
     return isls
 
 
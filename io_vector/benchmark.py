@@ -0,0 +1,120 @@
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# <pep8 compliant>
+
+"""Generated SVG artwork for timing the conversion to PolyAreas.
+
+Run from the Blender python console or with
+  blender -b --python-expr "from io_vector import benchmark; benchmark.run()"
+"""
+
+import math
+import os
+import random
+import time
+
+from . import svg
+from . import art2polyarea
+
+
+def _RingPath(cx, cy, r, sides, ccw=True):
+    """Return svg path data for a closed regular polygon.
+
+    Args:
+      cx, cy: float - center
+      r: float - radius
+      sides: int - number of vertices
+      ccw: bool - orientation
+    Returns:
+      string
+    """
+
+    step = 2.0 * math.pi / sides
+    if not ccw:
+        step = -step
+    pts = [(cx + r * math.cos(i * step), cy + r * math.sin(i * step))
+        for i in range(sides)]
+    return "M " + " L ".join("%.4f,%.4f" % p for p in pts) + " Z"
+
+
+def NestedRingsSVG(cols, rows, depth=3, sides=24, seed=0):
+    """Return an svg string with a grid of glyph-like nested rings.
+
+    Every cell of the grid has a ring with a hole, an island inside the
+    hole, and so on, depth levels deep, all as subpaths of one path
+    so that all of them have to be classified against each other.
+
+    Args:
+      cols, rows: int - size of the grid
+      depth: int - number of nested rings per cell
+      sides: int - vertices per ring
+      seed: int - random seed for jittering the cells
+    Returns:
+      string
+    """
+
+    rng = random.Random(seed)
+    subpaths = []
+    for i in range(cols):
+        for j in range(rows):
+            cx = 10.0 * i + 5.0 + rng.uniform(-0.5, 0.5)
+            cy = 10.0 * j + 5.0 + rng.uniform(-0.5, 0.5)
+            for k in range(depth):
+                r = 4.5 * (depth - k) / depth
+                subpaths.append(_RingPath(cx, cy, r, sides, k % 2 == 0))
+    return ('<svg xmlns="http://www.w3.org/2000/svg" '
+        'width="%d" height="%d">\n'
+        '<path fill="black" fill-rule="evenodd" d="%s"/>\n'
+        '</svg>\n') % (10 * cols, 10 * rows, " ".join(subpaths))
+
+
+def Corpus():
+    """Return a list of (name, svg string) pairs of increasing size."""
+
+    return [("rings_%dx%d_d%d" % (n, n, depth), NestedRingsSVG(n, n, depth))
+        for (n, depth) in ((5, 2), (10, 3), (20, 3), (40, 2))]
+
+
+def WriteCorpus(directory):
+    """Write the corpus as .svg files into directory."""
+
+    for (name, s) in Corpus():
+        with open(os.path.join(directory, name + ".svg"), "w") as f:
+            f.write(s)
+
+
+def TimeConversion(name, s):
+    """Parse svg string s and time its conversion to PolyAreas."""
+
+    art = svg.ParseSVGString(s)
+    options = art2polyarea.ConvertOptions()
+    options.combine_paths = True
+    start = time.time()
+    pareas = art2polyarea.ArtToPolyAreas(art, options)
+    duration = time.time() - start
+    numpaths = sum(len(p.subpaths) for p in art.paths)
+    numholes = sum(len(pa.holes) for pa in pareas.polyareas)
+    print("{:<20} {:>6} paths {:>6} areas {:>6} holes {:>10.3f} s".format(
+        name, numpaths, len(pareas.polyareas), numholes, duration))
+    return duration
+
+
+def run():
+    for (name, s) in Corpus():
+        TimeConversion(name, s)
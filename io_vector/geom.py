@@ -172,8 +172,12 @@ class PolyArea(object):
           holepa: PolyArea
         """
 
-        vmap = self.points.AddPoints(holepa.points)
-        holepoly = [vmap[i] for i in holepa.poly]
+        if holepa.points is self.points:
+            # shared Points, e.g. all areas made from one Path
+            holepoly = list(holepa.poly)
+        else:
+            vmap = self.points.AddPoints(holepa.points)
+            holepoly = [vmap[i] for i in holepa.poly]
         holepoly.reverse()
         self.holes.append(holepoly)
 
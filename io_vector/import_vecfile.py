@@ -46,6 +46,10 @@ class ImportOptions(object):
       bevel_amount: float - if > 0, inset polygons by this amount
       bevel_pitch: float - if > 0, angle in radians of bevel
       cap_back: bool - should we cap the back, if extruding?
+      triangulator: string - 'EARCHOP' or 'SWEEP', the triangulation
+        method used for quadrangulating (see triquad.TriangulateFace)
+      pages: string - the pages of PDF files to import, laid out left
+        to right (see pdf.ParsePageRange); '' means the first page
     """
 
     def __init__(self):
@@ -56,6 +60,8 @@ class ImportOptions(object):
         self.bevel_amount = 0.0
         self.bevel_pitch = 45.0 * math.pi / 180.0
         self.cap_back = False
+        self.triangulator = 'EARCHOP'
+        self.pages = ""
 
 
 def ReadVecFileToModel(fname, options):
@@ -69,7 +75,7 @@ def ReadVecFileToModel(fname, options):
         The string will be errors and warnings.
     """
 
-    art = vecfile.ParseVecFile(fname)
+    art = vecfile.ParseVecFile(fname, options.pages)
     if art is None:
         return (None, "Problem reading file or unhandled type")
     return ArtToModel(art, options)
@@ -92,8 +98,8 @@ def ArtToModel(art, options):
     if options.scaled_side_target > 0:
         pareas.scale_and_center(options.scaled_side_target)
     m = model.PolyAreasToModel(pareas, options.bevel_amount,
-      options.bevel_pitch, options.quadrangulate)
+      options.bevel_pitch, options.quadrangulate, options.triangulator)
     if options.extrude_depth > 0:
         model.ExtrudePolyAreasInModel(m, pareas, options.extrude_depth,
-          options.cap_back)
+          options.cap_back, options.triangulator)
     return (m, "")
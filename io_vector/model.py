@@ -29,7 +29,8 @@ from . import offset
 import math
 
 
-def PolyAreasToModel(polyareas, bevel_amount, bevel_pitch, quadrangulate):
+def PolyAreasToModel(polyareas, bevel_amount, bevel_pitch, quadrangulate,
+        triangulator='EARCHOP'):
     """Convert a PolyAreas into a Model object.
 
     Assumes polyareas are in xy plane.
@@ -39,6 +40,8 @@ def PolyAreasToModel(polyareas, bevel_amount, bevel_pitch, quadrangulate):
       bevel_amount: float - if > 0, amount of bevel
       bevel_pitch: float - if > 0, angle in radians of bevel
       quadrangulate: bool - should n-gons be quadrangulated?
+      triangulator: string - triangulation method used for
+        quadrangulating, see triquad.TriangulateFace
     Returns:
       geom.Model
     """
@@ -49,18 +52,21 @@ def PolyAreasToModel(polyareas, bevel_amount, bevel_pitch, quadrangulate):
     polyareas.points.AddZCoord(0.0)
     m.points = polyareas.points
     for pa in polyareas.polyareas:
-        PolyAreaToModel(m, pa, bevel_amount, bevel_pitch, quadrangulate)
+        PolyAreaToModel(m, pa, bevel_amount, bevel_pitch, quadrangulate,
+            triangulator)
     return m
 
 
-def PolyAreaToModel(m, pa, bevel_amount, bevel_pitch, quadrangulate):
+def PolyAreaToModel(m, pa, bevel_amount, bevel_pitch, quadrangulate,
+        triangulator='EARCHOP'):
     if bevel_amount > 0.0:
         BevelPolyAreaInModel(m, pa, bevel_amount, bevel_pitch, quadrangulate,
-            False)
+            False, triangulator)
     elif quadrangulate:
         if len(pa.poly) == 0:
             return
-        qpa = triquad.QuadrangulateFaceWithHoles(pa.poly, pa.holes, pa.points)
+        qpa = triquad.QuadrangulateFaceWithHoles(pa.poly, pa.holes, pa.points,
+            triangulator)
         m.faces.extend(qpa)
         m.face_data.extend([pa.data] * len(qpa))
     else:
@@ -70,7 +76,8 @@ def PolyAreaToModel(m, pa, bevel_amount, bevel_pitch, quadrangulate):
         m.face_data.append(pa.data)
 
 
-def ExtrudePolyAreasInModel(mdl, polyareas, depth, cap_back):
+def ExtrudePolyAreasInModel(mdl, polyareas, depth, cap_back,
+        triangulator='EARCHOP'):
     """Extrude the boundaries given by polyareas by -depth in z.
 
     Assumes polyareas are in xy plane.
@@ -80,6 +87,8 @@ def ExtrudePolyAreasInModel(mdl, polyareas, depth, cap_back):
       polyareas: geom.Polyareas
       depth: float
       cap_back: bool - if True, cap off the back
+      triangulator: string - triangulation method used for the back cap,
+        see triquad.TriangulateFace
     Side Effects:
       For all edges in polys in polyareas, make quads in Model
       extending those edges by depth in the negative z direction.
@@ -94,7 +103,7 @@ def ExtrudePolyAreasInModel(mdl, polyareas, depth, cap_back):
             back_holes.append(_ExtrudePoly(mdl, p, depth, pa.data, False))
         if cap_back:
             qpa = triquad.QuadrangulateFaceWithHoles(back_poly, back_holes,
-              polyareas.points)
+              polyareas.points, triangulator)
             # need to reverse each poly to get normals pointing down
             for i, p in enumerate(qpa):
                 t = list(p)
@@ -147,7 +156,8 @@ def _ExtrudePoly(mdl, poly, depth, data, isccw):
 
 
 def BevelPolyAreaInModel(mdl, polyarea,
-    bevel_amount, bevel_pitch, quadrangulate, as_percent):
+    bevel_amount, bevel_pitch, quadrangulate, as_percent,
+    triangulator='EARCHOP'):
     """Bevel the interior of polyarea in model.
 
     This does smart beveling: advancing edges are merged
@@ -164,6 +174,8 @@ def BevelPolyAreaInModel(mdl, polyarea,
       bevel_pitch: float - if > 0, angle in radians of bevel
       quadrangulate: bool - should n-gons be quadrangulated?
       as_percent: bool - if True, interpret amount as percent of max
+      triangulator: string - triangulation method used for quadrangulating,
+        see triquad.TriangulateFace
     Side Effects:
       Faces and points are added to model to model the
       bevel and the interior of the polyareas.
@@ -189,7 +201,7 @@ def BevelPolyAreaInModel(mdl, polyarea,
             if len(pa.poly) == 0:
                 continue
             qpa = triquad.QuadrangulateFaceWithHoles(pa.poly, pa.holes,
-                pa.points)
+                pa.points, triangulator)
             m.faces.extend(qpa)
             m.face_data.extend([pa.data] * len(qpa))
         else:
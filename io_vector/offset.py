@@ -23,6 +23,8 @@
 __author__ = "howard.trickey@gmail.com"
 
 import math
+import heapq
+import itertools
 from . import triquad
 from . import geom
 from .triquad import Sub2, Add2, Angle, Ccw, Normalized2, Perp2, Length2, \
@@ -30,6 +32,13 @@ from .triquad import Sub2, Add2, Angle, Ccw, Normalized2, Perp2, Length2, \
 from .geom import Points
 
 AREATOL = 1e-4
+# how close a spoke has to be to the line of a spoke in the containing
+# Offset to count as its continuation (points snap to the DISTTOL grid,
+# and then the spoke is really a new one)
+TRACKTOL = 1e-9
+
+# tie breaker for events at the same time in an event heap
+_eventseq = itertools.count()
 
 
 class Spoke(object):
@@ -48,6 +57,9 @@ class Spoke(object):
       face: int - index of face containing this Spoke, in Offset
       index: int - index of this Spoke in its face
       destindex: int - index of Spoke dest in its face
+      track: Spoke - the first of the spokes, in successive Offsets, that
+          grow along the same line as this one (events found for one
+          of them hold for all of them)
     """
 
     def __init__(self, v, prev, next, face, index, points):
@@ -73,6 +85,7 @@ class Spoke(object):
         self.face = face
         self.index = index
         self.destindex = -1
+        self.track = self
         vmap = points.pos
         vp = vmap[v]
         prevp = vmap[prev]
@@ -315,6 +328,11 @@ class Offset(object):
       vspeed: float - speed that edges move perpendicular to offset plane
       inneroffsets: list of Offset - the offsets that take over after this
           (inside it)
+      events: list - heap of (absolute time, seq, is vertex event,
+          spoke track, other track, other's next track, event vertex)
+          for the events that may still happen (see Build)
+      tracks: dict - maps Spoke.track to the spoke in this Offset
+      targettime: float - absolute time at which Build stops
     """
 
     def __init__(self, polyarea, time, vspeed):
@@ -331,6 +349,9 @@ class Offset(object):
         self.timesofar = time
         self.vspeed = vspeed
         self.inneroffsets = []
+        self.events = []
+        self.tracks = {}
+        self.targettime = 2e100
         self.InitFaceSpokes(polyarea.poly)
         for f in polyarea.holes:
             self.InitFaceSpokes(f)
@@ -423,30 +444,55 @@ class Offset(object):
         """Build the complete Offset structure or up until target time.
 
         Find the next event(s), makes the appropriate inner Offsets
-        that are inside this one, and calls Build on those Offsets to continue
-        the process until only a single point is left or time reaches target.
+        that are inside this one, and continues with those Offsets
+        until only a single point is left or time reaches target.
+
+        The events of all spokes are computed once, up front, and kept in
+        a heap ordered by time.  The heap is handed down to the inner
+        Offsets, where only the spokes and edges that are new (next to
+        the vertex and edge events that made the inner Offset) need
+        their events computed.  Events whose spokes or edges no longer
+        exist are dropped when they come up.
         """
 
-        bestt = 1e100
-        bestevs = [[], []]
+        self.events = []
+        self.targettime = self.timesofar + target
         for f in self.facespokes:
-            for s in f:
-                (t, ve, ee) = self.NextSpokeEvents(s)
-                if t < bestt - TOL:
-                    bestevs = [[], []]
-                    bestt = t
-                if abs(t - bestt) < TOL:
-                    bestevs[0].extend(ve)
-                    bestevs[1].extend(ee)
+            for spoke in f:
+                spoke.track = spoke
+        self._IndexTracks()
+        allspokes = [spoke for f in self.facespokes for spoke in f]
+        self._AddEvents(allspokes, [])
+        # depth first, in the order the inner offsets are made
+        stack = [(self, target)]
+        while stack:
+            (off, target) = stack.pop()
+            nexttarget = off._Step(target)
+            if nexttarget > TOL:
+                for o in reversed(off.inneroffsets):
+                    stack.append((o, nexttarget))
+
+    def _Step(self, target):
+        """Process the next event(s) of this Offset.
+
+        Sets endtime and makes the inner Offsets, if any.
+
+        Args:
+          target: float - time (relative to this offset) to stop at
+        Returns:
+          float - the target time for the inner Offsets, or 0.0
+              if they are not to be built
+        """
+
+        (bestt, ve, ee) = self._NextEvents()
         if bestt == 1e100:
             # could happen if polygon is oriented wrong
             # or in other special cases
-            return
+            return 0.0
         if abs(bestt) < TOL:
             # seems to be in a loop, so quit
-            return
+            return 0.0
         self.endtime = bestt
-        (ve, ee) = bestevs
         newfaces = []
         splitjoin = None
         if target < self.endtime:
@@ -462,7 +508,7 @@ class Offset(object):
             # First make the new faces (handles all vertex events)
             newfaces = self.MakeNewFaces(self.endtime)
             # Only do one edge event (handle other simultaneous edge
-            # events in subsequent recursive Build calls)
+            # events in the inner offsets)
             if newfaces:
                 splitjoin = self.SplitJoinFaces(newfaces, ee[0])
         nexttarget = target - self.endtime
@@ -496,8 +542,6 @@ class Offset(object):
                                 pa2.holes.append(hf)
                             else:
                                 print("whoops, hole in neither poly!")
-                    self.inneroffsets = [Offset(pa, newt, self.vspeed), \
-                        Offset(pa2, newt, self.vspeed)]
                 else:
                     # A hole was split. New faces just replace the split one.
                     pa.poly = newfaces[0]
@@ -519,8 +563,248 @@ class Offset(object):
             if pa2:
                 self.inneroffsets.append(Offset(pa2, newt, self.vspeed))
             if nexttarget > TOL:
+                edges = set([(spoke.track, self._Next(spoke).track)
+                    for f in self.facespokes for spoke in f])
                 for o in self.inneroffsets:
-                    o.Build(nexttarget)
+                    o._InheritEvents(self, edges,
+                        len(self.inneroffsets) == 1)
+                return nexttarget
+        return 0.0
+
+    def _Next(self, spoke):
+        """Return the spoke after spoke in its face."""
+
+        f = self.facespokes[spoke.face]
+        return f[(spoke.index + 1) % len(f)]
+
+    def _Prev(self, spoke):
+        """Return the spoke before spoke in its face."""
+
+        f = self.facespokes[spoke.face]
+        return f[(spoke.index - 1) % len(f)]
+
+    def _IndexTracks(self):
+        self.tracks = dict()
+        for f in self.facespokes:
+            for spoke in f:
+                self.tracks[spoke.track] = spoke
+
+    def _PushEvent(self, ev):
+        """Push OffsetEvent ev (or nothing, if it is None) on the heap."""
+
+        if ev is None:
+            return
+        if ev.is_vertex_event:
+            othernext = None
+        else:
+            othernext = self._Next(ev.other).track
+        heapq.heappush(self.events, (self.timesofar + ev.time,
+            next(_eventseq), ev.is_vertex_event, ev.spoke.track,
+            ev.other.track, othernext, ev.event_vertex))
+
+    def _AddEvents(self, edgespokes, reflexspokes):
+        """Compute the events for new edges and new reflex spokes.
+
+        Edge events after targettime are not needed, so only pairs
+        of reflex spokes and edges that can get near each other before
+        then are tried.
+
+        Args:
+          edgespokes: list of Spoke - spokes whose edge to the next spoke
+              is new: the vertex event with the next spoke and the edge
+              events of all reflex spokes with the edge are computed
+          reflexspokes: list of Spoke - new reflex spokes, whose edge
+              events with all edges are computed
+        Side Effects:
+          The events are pushed on self.events
+        """
+
+        points = self.polyarea.points
+        for other in edgespokes:
+            self._PushEvent(other.VertexEvent(self._Next(other), points))
+        reflex = [spoke for f in self.facespokes for spoke in f
+            if spoke.is_reflex]
+        if not reflex:
+            return
+        newreflex = set(reflexspokes)
+        oldreflex = [spoke for spoke in reflex if spoke not in newreflex]
+        alledges = [spoke for f in self.facespokes for spoke in f]
+        reach = self.targettime - self.timesofar + TOL
+        # new reflex spokes against all edges, other reflex spokes
+        # against the new edges only
+        for (spokes, edges) in ((reflexspokes, alledges),
+                                (oldreflex, edgespokes)):
+            if not spokes or not edges:
+                continue
+            pairs = _OverlappingBoxes(
+                [self._SpokeBox(spoke, reach) for spoke in spokes],
+                [self._EdgeBox(other, reach) for other in edges])
+            for (i, j) in pairs:
+                spoke = spokes[i]
+                other = edges[j]
+                if other is spoke or self._Prev(spoke) is other:
+                    continue
+                self._PushEvent(spoke.EdgeEvent(other, self))
+
+    def _SpokeBox(self, spoke, t):
+        """Return the bounding box of spoke grown to time t."""
+
+        p = self.polyarea.points.pos[spoke.origin]
+        q = (p[0] + spoke.dir[0] * spoke.speed * t,
+             p[1] + spoke.dir[1] * spoke.speed * t)
+        return (min(p[0], q[0]), min(p[1], q[1]),
+                max(p[0], q[0]), max(p[1], q[1]))
+
+    def _EdgeBox(self, spoke, t):
+        """Return a box containing the edge from spoke to the next spoke
+        while it advances until time t."""
+
+        next_spoke = self._Next(spoke)
+        p = self.polyarea.points.pos[spoke.origin]
+        q = self.polyarea.points.pos[next_spoke.origin]
+        d = max(spoke.speed, next_spoke.speed) * t
+        return (min(p[0], q[0]) - d, min(p[1], q[1]) - d,
+                max(p[0], q[0]) + d, max(p[1], q[1]) + d)
+
+    def _LiveEvent(self, entry):
+        """Return the OffsetEvent for a heap entry, relative to this Offset,
+        or None if the spokes or edge involved are gone."""
+
+        (t, _, isv, track, othertrack, othernext, evertex) = entry
+        spoke = self.tracks.get(track)
+        other = self.tracks.get(othertrack)
+        if spoke is None or other is None:
+            return None
+        if isv:
+            if self._Next(spoke) is not other:
+                return None
+        else:
+            if self._Next(other).track is not othernext or \
+                    self._Prev(spoke) is other:
+                return None
+        return OffsetEvent(isv, t - self.timesofar, evertex, spoke, other)
+
+    def _Continues(self, spoke, outer_spoke, t):
+        """Return True if spoke grows along the same line as outer_spoke
+        (a spoke of the containing Offset, which ends at time t)."""
+
+        if spoke.is_reflex != outer_spoke.is_reflex:
+            return False
+        if abs(spoke.speed - outer_spoke.speed) > TRACKTOL * spoke.speed:
+            return False
+        p = outer_spoke.EndPoint(t, self.polyarea.points, self.vspeed)
+        q = self.polyarea.points.pos[spoke.origin]
+        return abs(p[0] - q[0]) < TRACKTOL and abs(p[1] - q[1]) < TRACKTOL \
+            and abs(spoke.dir[0] - outer_spoke.dir[0]) < TRACKTOL \
+            and abs(spoke.dir[1] - outer_spoke.dir[1]) < TRACKTOL
+
+    def _NextEvents(self):
+        """Find the events that will happen next in this Offset.
+
+        The earliest events on the heap tell which spokes are involved;
+        the events of those spokes are then computed again from their
+        current origins, so that simultaneous and degenerate events
+        come out exactly as from a scan of all the spokes.
+
+        Returns:
+          (float, list of OffsetEvent, list of OffsetEvent) -
+              time of next event (1e100 if none),
+              next Vertex event list and next Edge event list
+              (like NextSpokeEvents, but for all spokes)
+        """
+
+        events = self.events
+        while True:
+            heapt = 1e100
+            live = []
+            while events and events[0][0] - self.timesofar < heapt + TOL:
+                entry = heapq.heappop(events)
+                ev = self._LiveEvent(entry)
+                if ev is None or ev.time < -TOL:
+                    continue
+                heapt = min(heapt, ev.time)
+                live.append((entry, ev))
+            if not live:
+                return (1e100, [], [])
+            spokes = set()
+            for (_, ev) in live:
+                spokes.add(ev.spoke)
+                spokes.add(ev.other)
+            spokes = sorted(spokes, key=lambda s: (s.face, s.index))
+            (bestt, ve, ee) = self._ScanEvents(spokes)
+            if bestt < heapt + TOL:
+                # events that don't get handled here may still happen
+                # in an inner offset
+                for (entry, _) in live:
+                    heapq.heappush(events, entry)
+                return (bestt, ve, ee)
+            # the events on the heap turned out not to happen (they were
+            # computed from the origins of an outer Offset), so drop them
+
+    def _ScanEvents(self, spokes):
+        """Return (time, vertex events, edge events) of the next events
+        of the given spokes (see NextSpokeEvents)."""
+
+        bestt = 1e100
+        bestevs = [[], []]
+        for s in spokes:
+            (t, ve, ee) = self.NextSpokeEvents(s)
+            if t < bestt - TOL:
+                bestevs = [[], []]
+                bestt = t
+            if abs(t - bestt) < TOL:
+                bestevs[0].extend(ve)
+                bestevs[1].extend(ee)
+        return (bestt, bestevs[0], bestevs[1])
+
+    def _InheritEvents(self, outer, edges, share):
+        """Take over the events of outer, the Offset this one is inside of.
+
+        A spoke continues the track of the spoke of outer that ends at its
+        origin, unless the end is shared with other spokes (merged
+        vertices, or the vertex of an edge event) or the spoke doesn't
+        grow along the same line (snapped points).
+
+        Args:
+          outer: Offset - the containing Offset, just after its Build step
+          edges: set of (Spoke, Spoke) - track pairs for the edges of outer
+          share: bool - if True, this is the only inner Offset of outer,
+              and it can use outer's heap directly
+        """
+
+        ends = dict()
+        for f in outer.facespokes:
+            for spoke in f:
+                if spoke.dest in ends:
+                    ends[spoke.dest] = None
+                else:
+                    ends[spoke.dest] = spoke
+        count = dict()
+        for f in self.facespokes:
+            for spoke in f:
+                count[spoke.origin] = count.get(spoke.origin, 0) + 1
+        for f in self.facespokes:
+            for spoke in f:
+                o = ends.get(spoke.origin)
+                if o is not None and count[spoke.origin] == 1 and \
+                        self._Continues(spoke, o, outer.endtime):
+                    spoke.track = o.track
+        self._IndexTracks()
+        self.targettime = outer.targettime
+        if share:
+            self.events = outer.events
+        else:
+            self.events = [e for e in outer.events if e[3] in self.tracks]
+            heapq.heapify(self.events)
+        newedges = []
+        newreflex = []
+        for f in self.facespokes:
+            for spoke in f:
+                if (spoke.track, self._Next(spoke).track) not in edges:
+                    newedges.append(spoke)
+                if spoke.is_reflex and spoke.track is spoke:
+                    newreflex.append(spoke)
+        self._AddEvents(newedges, newreflex)
 
     def FaceAtSpokeEnds(self, f, t):
         """Return a new face that is at the spoke ends of face f at time t.
@@ -715,10 +999,15 @@ class Offset(object):
         return max_amount
 
     def _MaxTime(self):
-        if self.inneroffsets:
-            return max([o._MaxTime() for o in self.inneroffsets])
-        else:
-            return self.timesofar + self.endtime
+        ans = 0.0
+        ostack = [self]
+        while ostack:
+            o = ostack.pop()
+            if o.inneroffsets:
+                ostack.extend(o.inneroffsets)
+            else:
+                ans = max(ans, o.timesofar + o.endtime)
+        return ans
 
 
 def _AddInnerAreas(off, polyareas):
@@ -734,23 +1023,66 @@ def _AddInnerAreas(off, polyareas):
       added to polyareas.
     """
 
-    if off.inneroffsets:
-        for o in off.inneroffsets:
-            _AddInnerAreas(o, polyareas)
-    else:
-        newpa = geom.PolyArea(polyareas.points)
-        for i, f in enumerate(off.facespokes):
-            newface = off.FaceAtSpokeEnds(f, off.endtime)
-            area = abs(geom.SignedArea(newface, polyareas.points))
-            if area < AREATOL:
-                if i == 0:
-                    break
-                else:
-                    continue
+    ostack = [off]
+    while ostack:
+        o = ostack.pop()
+        if o.inneroffsets:
+            ostack.extend(reversed(o.inneroffsets))
+        else:
+            _AddInnermostArea(o, polyareas)
+
+
+def _AddInnermostArea(off, polyareas):
+    """Add the area at the end of offset off, which has no inner
+    offsets, to polyareas."""
+
+    newpa = geom.PolyArea(polyareas.points)
+    for i, f in enumerate(off.facespokes):
+        newface = off.FaceAtSpokeEnds(f, off.endtime)
+        area = abs(geom.SignedArea(newface, polyareas.points))
+        if area < AREATOL:
             if i == 0:
-                newpa.poly = newface
-                newpa.data = off.polyarea.data
+                break
             else:
-                newpa.holes.append(newface)
-        if newpa.poly:
-            polyareas.polyareas.append(newpa)
+                continue
+        if i == 0:
+            newpa.poly = newface
+            newpa.data = off.polyarea.data
+        else:
+            newpa.holes.append(newface)
+    if newpa.poly:
+        polyareas.polyareas.append(newpa)
+
+
+def _OverlappingBoxes(aboxes, bboxes):
+    """Find all pairs of a box in aboxes and a box in bboxes that overlap.
+
+    Sweeps a line over x, keeping the boxes that the sweep line
+    currently crosses, so only boxes that overlap in x are compared.
+
+    Args:
+      aboxes: list of (float, float, float, float) - (xmin, ymin, xmax, ymax)
+      bboxes: list of (float, float, float, float) - (xmin, ymin, xmax, ymax)
+    Returns:
+      list of (int, int) - pairs (i,j) where aboxes[i] overlaps bboxes[j]
+    """
+
+    starts = [(box[0], 0, i) for (i, box) in enumerate(aboxes)] + \
+             [(box[0], 1, j) for (j, box) in enumerate(bboxes)]
+    starts.sort()
+    pairs = []
+    active = ([], [])
+    boxes = (aboxes, bboxes)
+    for (xmin, k, i) in starts:
+        (_, ymin, _, ymax) = boxes[k][i]
+        others = boxes[1 - k]
+        active_others = [j for j in active[1 - k] if others[j][2] >= xmin]
+        active[1 - k][:] = active_others
+        for j in active_others:
+            if others[j][1] <= ymax and others[j][3] >= ymin:
+                if k == 0:
+                    pairs.append((i, j))
+                else:
+                    pairs.append((j, i))
+        active[k].append(i)
+    return pairs
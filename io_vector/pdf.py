@@ -23,6 +23,8 @@
 
 __author__ = "howard.trickey@gmail.com"
 
+import collections
+import mmap
 import re
 import sys
 try:
@@ -42,6 +44,9 @@ else:
 
 WARN = True  # print Warnings about strange things?
 
+# default number of resolved objects a PDFFile keeps
+CACHESIZE = 4096
+
 # PDF objects
 OBOOL = 0
 ONUM = 1
@@ -413,17 +418,41 @@ def GetPDFTrailerAndCrossrefs(s):
     """Find and return the (last) PDF trailer dictionary and cross reference
     dict.
 
+    Objects stored in object streams (see _ReadCrossrefs) are not
+    in the returned cross reference dict.
+
     Args:
       s: PDF file (as bytes)
     Returns:
       (trailer dict, crossref dict)
     """
 
+    (trailerdict, crossrefs, _) = _ReadCrossrefs(s)
+    return (trailerdict, crossrefs)
+
+
+def _ReadCrossrefs(s):
+    """Read all cross reference sections of a PDF file.
+
+    Follows the chain of Prev links from the last section, which
+    can be a text xref table (possibly with an XRefStm for hybrid
+    files) or a cross reference stream (PDF 1.5).
+    Entries in later sections take precedence over earlier ones.
+
+    Args:
+      s: PDF file (as bytes or mmap)
+    Returns:
+      (trailer dict, crossref dict, compressed dict) - crossref dict maps
+          (obj_number, gen_number) to byte offset in s,
+          compressed dict maps (obj_number, 0) to
+          (object stream obj_number, index in object stream)
+    """
+
     startxrefi = s.rfind(b'startxref')
     if startxrefi == -1:
         if WARN:
             print('cannot find startxref')
-        return (None, None)
+        return (None, None, None)
     crossrefi = -1
     m = _re_pseol.match(s, startxrefi + 9)
     if m:
@@ -433,62 +462,506 @@ def GetPDFTrailerAndCrossrefs(s):
     if crossrefi <= 0:
         if WARN:
             print('cannot find crossref index')
-        return (None, None)
+        return (None, None, None)
     crossrefs = {}
+    compressed = {}
     last_trailerdict = None
-    while crossrefi > 0:
-        i = crossrefi
-        if s[i:i + 4] != b'xref':
-            if WARN:
-                print('cannot find xref')
+    seen = set()
+    while crossrefi > 0 and crossrefi not in seen:
+        seen.add(crossrefi)
+        if s[crossrefi:crossrefi + 4] == b'xref':
+            trailerdict = _ReadXrefTable(s, crossrefi, crossrefs)
+            if trailerdict is not None and 'XRefStm' in trailerdict:
+                _ReadXrefStream(s, trailerdict['XRefStm'][1], crossrefs,
+                    compressed)
+        else:
+            trailerdict = _ReadXrefStream(s, crossrefi, crossrefs, compressed)
+        if trailerdict is None:
+            break
+        if last_trailerdict is None:
+            last_trailerdict = trailerdict
+        if PDFObjHasType(trailerdict.get('Prev'), ONUM):
+            crossrefi = int(trailerdict['Prev'][1])
+        else:
+            crossrefi = -1
+    return (last_trailerdict, crossrefs, compressed)
+
+
+def _ReadXrefTable(s, i, crossrefs):
+    """Read a text cross reference table starting at s[i] ('xref').
+
+    Args:
+      s: PDF file (as bytes or mmap)
+      i: int - index of the 'xref' keyword in s
+      crossrefs: dict - entries not yet in it are added
+    Returns:
+      dict - the trailer dictionary following the table, or None
+    """
+
+    m = _re_pseol.match(s, i + 4)
+    if m:
+        i = m.end()
+    while i < len(s):
+        # Get start of subsection
+        (v, i) = GetPDFTwoInts(s, i)
+        if v is None:
             break
-        m = _re_pseol.match(s, i + 4)
+        (idstart, nentries) = v
+        m = _re_pswhitespaceandcomments.match(s, i)
         if m:
             i = m.end()
-        while i < startxrefi:
-            # Get start of subsection
-            (v, i) = GetPDFTwoInts(s, i)
+        for k in range(idstart, idstart + nentries):
+            byteoffset = int(s[i:i + 10])
+            gen = int(s[i + 11:i + 16])
+            inuse = (ordat(s, i + 17) == ord('n'))
+            if inuse:
+                crossrefs.setdefault((k, gen), byteoffset)
+            i += 20
+    # Should be at 'trailer' now
+    (w, i) = GetPDFKeyword(s, i)
+    if w != b'trailer':
+        if WARN:
+            print('cannot find trailer')
+        return None
+    (trailero, i) = GetPDFObject(s, i)
+    if trailero is None or trailero[0] != ODICT:
+        if WARN:
+            print('cannot find trailer dict')
+        return None
+    return trailero[1]
+
+
+def _ReadXrefStream(s, i, crossrefs, compressed):
+    """Read a cross reference stream object starting at s[i].
+
+    Args:
+      s: PDF file (as bytes or mmap)
+      i: int - byte offset of the xref stream object
+      crossrefs: dict - entries for objects not yet in it or compressed
+          are added
+      compressed: dict - entries for objects not yet in it or crossrefs
+          are added
+    Returns:
+      dict - the stream dictionary, which doubles as trailer, or None
+    """
+
+    (o, _) = GetPDFObject(s, i)
+    if not PDFObjHasType(o, OINDIRECTDEF) or \
+            not PDFObjHasType(o[1][2], OSTREAM):
+        if WARN:
+            print('cannot find xref stream')
+        return None
+    streamobj = o[1][2]
+    d = streamobj[1][0]
+    data = _DecodePDFStream(streamobj, s, d.get('Length'))
+    if data is None:
+        return None
+    widths = [int(w[1]) for w in d.get('W', (OARRAY, []))[1]]
+    if len(widths) != 3:
+        if WARN:
+            print('bad W in xref stream')
+        return None
+    size = int(d['Size'][1]) if 'Size' in d else 0
+    index = [int(x[1]) for x in d.get('Index', (OARRAY, [(ONUM, 0),
+        (ONUM, size)]))[1]]
+    entrylen = sum(widths)
+    j = 0
+    for sub in range(0, len(index) - 1, 2):
+        for k in range(index[sub], index[sub] + index[sub + 1]):
+            if j + entrylen > len(data):
+                break
+            fields = []
+            for w in widths:
+                v = 0
+                for b in bytearray(data[j:j + w]):
+                    v = (v << 8) | b
+                fields.append(v)
+                j += w
+            if widths[0] == 0:
+                fields[0] = 1
+            (ty, f2, f3) = fields
+            if ty == 1:
+                key = (k, f3)
+                if key not in crossrefs and (k, 0) not in compressed:
+                    crossrefs[key] = f2
+            elif ty == 2:
+                key = (k, 0)
+                if key not in crossrefs and key not in compressed:
+                    compressed[key] = (f2, f3)
+    return d
+
+
+def _DecodePDFStream(streamobj, s, lengthobj):
+    """Return the bytes of a stream object, with its filters undone.
+
+    Only FlateDecode is handled, with or without a PNG predictor.
+
+    Args:
+      streamobj: (OSTREAM, (dict, istart, iend))
+      s: bytes or mmap - PDF file contents
+      lengthobj: (ONUM, int) or None - the resolved Length entry;
+          if missing, the stream ends at the following 'endstream'
+    Returns:
+      bytes or None - None for an unhandled filter
+    """
+
+    (d, istart, iend) = streamobj[1]
+    if PDFObjHasType(lengthobj, ONUM):
+        ans = s[istart:istart + int(lengthobj[1])]
+    else:
+        ans = s[istart:iend]
+    filterobj = d.get('Filter')
+    parmsobj = d.get('DecodeParms')
+    filters = []
+    parms = []
+    if PDFObjHasType(filterobj, ONAME):
+        filters = [filterobj[1]]
+        parms = [parmsobj]
+    elif PDFObjHasType(filterobj, OARRAY):
+        filters = [o[1] for o in filterobj[1] if PDFObjHasType(o, ONAME)]
+        if PDFObjHasType(parmsobj, OARRAY):
+            parms = parmsobj[1]
+    for (k, fname) in enumerate(filters):
+        if fname != 'FlateDecode':
+            if WARN:
+                print('unhandled stream filter', fname)
+            return None
+        if not zlib:
+            raise RuntimeError("pdf decoding requires missing zlib module")
+        ans = zlib.decompress(ans)
+        p = parms[k] if k < len(parms) else None
+        if PDFObjHasType(p, ODICT) and 'Predictor' in p[1]:
+            ans = _UndoPNGPredictor(ans, p[1])
+    return ans
+
+
+def _UndoPNGPredictor(data, parms):
+    """Undo the PNG predictor of decompressed stream data.
+
+    Args:
+      data: bytes - rows, each with a leading PNG filter type byte
+      parms: dict - the DecodeParms of the stream
+    Returns:
+      bytes
+    """
+
+    predictor = int(parms['Predictor'][1])
+    if predictor < 10:
+        if predictor != 1 and WARN:
+            print('unhandled predictor', predictor)
+        return data
+    colors = int(parms['Colors'][1]) if 'Colors' in parms else 1
+    bpc = int(parms['BitsPerComponent'][1]) \
+        if 'BitsPerComponent' in parms else 8
+    columns = int(parms['Columns'][1]) if 'Columns' in parms else 1
+    bpp = max(1, (colors * bpc) // 8)
+    rowlen = (colors * bpc * columns + 7) // 8
+    ans = bytearray()
+    prev = bytearray(rowlen)
+    for i in range(0, len(data) - rowlen, rowlen + 1):
+        ty = ordat(data, i)
+        row = bytearray(data[i + 1:i + 1 + rowlen])
+        if ty == 1:
+            for j in range(bpp, rowlen):
+                row[j] = (row[j] + row[j - bpp]) & 0xFF
+        elif ty == 2:
+            for j in range(rowlen):
+                row[j] = (row[j] + prev[j]) & 0xFF
+        elif ty == 3:
+            for j in range(rowlen):
+                left = row[j - bpp] if j >= bpp else 0
+                row[j] = (row[j] + ((left + prev[j]) >> 1)) & 0xFF
+        elif ty == 4:
+            for j in range(rowlen):
+                a = row[j - bpp] if j >= bpp else 0
+                b = prev[j]
+                c = prev[j - bpp] if j >= bpp else 0
+                p = a + b - c
+                pa = abs(p - a)
+                pb = abs(p - b)
+                pc = abs(p - c)
+                if pa <= pb and pa <= pc:
+                    pred = a
+                elif pb <= pc:
+                    pred = b
+                else:
+                    pred = c
+                row[j] = (row[j] + pred) & 0xFF
+        ans.extend(row)
+        prev = row
+    return bytes(ans)
+
+
+class PDFFile(object):
+    """A PDF file whose objects are read when needed.
+
+    The file is memory-mapped, so only the parts that are used are
+    ever read. Resolved indirect objects are kept in a cache, with
+    the least recently used ones evicted when it holds more than
+    cachesize objects. Streams are only decoded when asked for.
+
+    Attributes:
+      s: mmap.mmap or bytes - contents of the PDF file
+      trailer: dict - the last trailer dictionary, None if not found
+      crossrefs: dict - maps (obj_number, gen_number) to byte offset in s
+      compressed: dict - maps (obj_number, 0) to
+          (object stream obj_number, index in object stream)
+      cache: collections.OrderedDict - maps (obj_number, gen_number)
+          to the resolved object, most recently used last
+      cachesize: int - maximum number of objects in cache
+      pages: list of dict or None - the Page dicts, once found by Pages
+    """
+
+    def __init__(self, s, cachesize=CACHESIZE):
+        self.s = s
+        self.cachesize = cachesize
+        self.cache = collections.OrderedDict()
+        self.pages = None
+        (self.trailer, self.crossrefs, self.compressed) = _ReadCrossrefs(s)
+        if self.crossrefs is None:
+            self.crossrefs = {}
+            self.compressed = {}
+
+    def Close(self):
+        """Release the memory map, if any."""
+
+        if isinstance(self.s, mmap.mmap):
+            self.s.close()
+        self.s = b''
+        self.cache.clear()
+
+    def GetObject(self, key):
+        """Return the object with the given object and generation number.
+
+        Args:
+          key: (int, int) - (obj_number, gen_number)
+        Returns:
+          (objectid, value) or None if there is no such object
+        """
+
+        cache = self.cache
+        if key in cache:
+            o = cache.pop(key)
+            cache[key] = o
+            return o
+        o = None
+        if key in self.crossrefs:
+            i = self.crossrefs[key]
+            if 0 <= i < len(self.s):
+                (o, _) = GetPDFObject(self.s, i)
+                if PDFObjHasType(o, OINDIRECTDEF):
+                    o = o[1][2]
+                else:
+                    o = None
+        elif key in self.compressed:
+            o = self._GetCompressedObject(key)
+        self._CacheObject(key, o)
+        return o
+
+    def _CacheObject(self, key, o):
+        self.cache[key] = o
+        if len(self.cache) > self.cachesize:
+            self.cache.popitem(last=False)
+
+    def _GetCompressedObject(self, key):
+        """Decode the object stream holding key and return its object.
+
+        All objects of the object stream are put in the cache.
+        """
+
+        (streamnum, index) = self.compressed[key]
+        streamobj = self.GetObject((streamnum, 0))
+        if not PDFObjHasType(streamobj, OSTREAM):
+            return None
+        d = streamobj[1][0]
+        n = self.GetTypedVal(d, 'N', ONUM)
+        first = self.GetTypedVal(d, 'First', ONUM)
+        data = self.StreamBytes(streamobj)
+        if n is None or first is None or data is None:
+            return None
+        first = int(first)
+        ans = None
+        i = 0
+        for k in range(int(n)):
+            (v, i) = GetPDFTwoInts(data, i)
             if v is None:
                 break
-            (idstart, nentries) = v
-            m = _re_pswhitespaceandcomments.match(s, i)
-            if m:
-                i = m.end()
-            for k in range(idstart, idstart + nentries):
-                byteoffset = int(s[i:i + 10])
-                gen = int(s[i + 11:i + 16])
-                inuse = (ordat(s, i + 17) == ord('n'))
-                if inuse:
-                    crossrefs[(k, gen)] = byteoffset
-                i += 20
-        # Should be at 'trailer' now
-        (w, i) = GetPDFKeyword(s, i)
-        if w != b'trailer':
+            (objnum, offset) = v
+            (o, _) = GetPDFObject(data, first + offset)
+            if objnum == key[0]:
+                ans = o
+            elif self.compressed.get((objnum, 0)) == (streamnum, k):
+                self._CacheObject((objnum, 0), o)
+        return ans
+
+    def Resolve(self, o):
+        """Follow indirect references from o until getting a real object.
+
+        Args:
+          o: (objectid, value) or None
+        Returns:
+          (objectid, value) or None
+        """
+
+        seen = 0
+        while PDFObjHasType(o, OINDIRECTREF) and seen < 32:
+            o = self.GetObject(o[1])
+            seen += 1
+        return o
+
+    def GetTypedVal(self, d, entryname, ty):
+        """Return the value of entry entryname in dict d if it has type ty.
+
+        Indirect references are followed. Returns None if no such entry.
+        """
+
+        o = self.Resolve(d.get(entryname))
+        if PDFObjHasType(o, ty):
+            return o[1]
+        return None
+
+    def StreamBytes(self, streamobj):
+        """Return the decoded bytes of stream object streamobj, or None."""
+
+        if not PDFObjHasType(streamobj, OSTREAM):
+            return None
+        return _DecodePDFStream(streamobj, self.s,
+            self.Resolve(streamobj[1][0].get('Length')))
+
+    def Pages(self):
+        """Return the list of Page dictionaries, in page order.
+
+        Entries that Page dicts can inherit from their ancestors in the
+        page tree (such as MediaBox) are copied into them.
+        """
+
+        if self.pages is None:
+            self.pages = list(self._IterPages())
+        return self.pages
+
+    def FirstPage(self):
+        """Return the first Page dictionary, like Pages()[0], or None.
+
+        Only the first Kids of the page tree nodes down to the first page
+        are resolved, not the whole page tree.
+        """
+
+        if self.pages is not None:
+            return self.pages[0] if self.pages else None
+        return next(self._IterPages(), None)
+
+    def _IterPages(self):
+        """Generate the Page dictionaries, in page order, see Pages.
+
+        Kids are resolved when they are reached, so stopping early
+        leaves the rest of the page tree alone.
+        """
+
+        if not self.trailer:
             if WARN:
-                print('cannot find trailer')
-            break
-        (trailero, i) = GetPDFObject(s, i)
-        if trailero is None or trailero[0] != ODICT:
+                print('problem finding trailer or crossrefs')
+            return
+        root = self.GetTypedVal(self.trailer, 'Root', ODICT)
+        if root is None:
             if WARN:
-                print('cannot find trailer dict')
-                break
-        trailerdict = trailero[1]
-        if last_trailerdict is None:
-            last_trailerdict = trailerdict
-        if 'Prev' in trailerdict:
-            crossrefi = trailerdict['Prev']
+                print('cannot find root dictionary')
+            return
+        pagesdict = self.GetTypedVal(root, 'Pages', ODICT)
+        if pagesdict is None:
+            if WARN:
+                print('cannot find Pages dictionary')
+            return
+        seen = set()
+        stack = [((ODICT, pagesdict), {})]
+        while stack:
+            (kid, inherited) = stack.pop()
+            kidobj = self.Resolve(kid)
+            if not PDFObjHasType(kidobj, ODICT):
+                if WARN:
+                    print('Kids element has unexpected type')
+                continue
+            pnode = kidobj[1]
+            if id(pnode) in seen:
+                continue
+            seen.add(id(pnode))
+            here = dict(inherited)
+            for name in _InheritablePageAttrs:
+                if name in pnode:
+                    here[name] = pnode[name]
+            pnodetype = PDFDictType(pnode)
+            if pnodetype == 'Pages':
+                kidsarray = self.GetTypedVal(pnode, 'Kids', OARRAY)
+                if kidsarray is None:
+                    if WARN:
+                        print('cannot find Kids in Pages')
+                    continue
+                stack.extend((kid, here) for kid in reversed(kidsarray))
+            elif pnodetype == 'Page':
+                page = dict(pnode)
+                for (name, v) in here.items():
+                    page.setdefault(name, v)
+                yield page
+            elif WARN:
+                print('Page tree node has unexpected type', pnodetype)
+
+    def PageContents(self, page):
+        """Return the decoded Content string of a Page dict.
+
+        Args:
+          page: dict - a Page dictionary, from Pages
+        Returns:
+          string - the concatenated content streams, '' if none
+        """
+
+        contentsobj = self.Resolve(page.get('Contents'))
+        if contentsobj is None:
+            # it is legal for there to be no contents object:
+            # means empty page
+            return ''
+        if contentsobj[0] == OSTREAM:
+            streams = [contentsobj]
+        elif contentsobj[0] == OARRAY:
+            streams = [self.Resolve(c) for c in contentsobj[1]]
         else:
-            crossrefi = -1
-    return (last_trailerdict, crossrefs)
+            if WARN:
+                print('Contents object has unexpected type', contentsobj[0])
+            return ''
+        pieces = []
+        for o in streams:
+            data = self.StreamBytes(o)
+            if data is None:
+                if WARN:
+                    print('Contents obj child not a decodable stream')
+                return ''
+            # content streams are mostly ascii, but strings in them
+            # can have any byte value
+            pieces.append(data.decode('latin-1'))
+        return '\n'.join(pieces)
 
+    def PageWidth(self, page):
+        """Return the width of the MediaBox of a Page dict (0.0 if none)."""
 
-def ReadPDFPageOneContents(filename):
-    """Read a PDF file and return Content string for its first page.
+        box = self.GetTypedVal(page, 'MediaBox', OARRAY)
+        if box is None or len(box) != 4:
+            return 0.0
+        coords = [self.Resolve(c) for c in box]
+        if not all(PDFObjHasType(c, ONUM) for c in coords):
+            return 0.0
+        return abs(coords[2][1] - coords[0][1])
+
+
+# Page attributes that are inherited from the page tree
+_InheritablePageAttrs = ('Resources', 'MediaBox', 'CropBox', 'Rotate')
+
+
+def OpenPDFFile(filename, cachesize=CACHESIZE):
+    """Memory-map a PDF file and read its cross references.
 
     Args:
       filename: name of file
+      cachesize: int - number of resolved objects to keep
     Returns:
-      string: Content string for first page
+      PDFFile or None if the file can't be opened
     """
 
     try:
@@ -496,10 +969,64 @@ def ReadPDFPageOneContents(filename):
     except IOError:
         if WARN:
             print("Can't open file", filename)
-        return ''
-    contents = f.read()
+        return None
+    try:
+        s = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (ValueError, mmap.error):
+        # empty file, or a file system that can't map
+        s = f.read()
     f.close()
-    return GetPDFPageOneContents(contents)
+    return PDFFile(s, cachesize)
+
+
+def ParsePageRange(spec, npages):
+    """Parse a page range like '1-3,7,10-' into a list of page indices.
+
+    Page numbers start at 1 in spec, indices at 0. An empty spec means
+    the first page, 'all' means every page.
+
+    Args:
+      spec: string - comma separated page numbers and ranges
+      npages: int - number of pages in the file
+    Returns:
+      list of int - sorted indices of existing pages
+    """
+
+    spec = spec.strip()
+    if not spec:
+        return [0] if npages > 0 else []
+    if spec == 'all':
+        return list(range(npages))
+    ans = set()
+    for part in spec.split(','):
+        (lo, dash, hi) = part.strip().partition('-')
+        try:
+            first = int(lo) if lo.strip() else 1
+            last = (int(hi) if hi.strip() else npages) if dash else first
+        except ValueError:
+            if WARN:
+                print('bad page range', part)
+            continue
+        ans.update(range(max(first, 1) - 1, min(last, npages)))
+    return sorted(ans)
+
+
+def ReadPDFPageOneContents(filename):
+    """Read a PDF file and return Content string for its first page.
+
+    Args:
+      filename: name of file
+    Returns:
+      string: Content string for first page
+    """
+
+    pdffile = OpenPDFFile(filename)
+    if pdffile is None:
+        return ''
+    try:
+        return _PageOneContents(pdffile)
+    finally:
+        pdffile.Close()
 
 
 def GetPDFPageOneContents(s):
@@ -509,7 +1036,7 @@ def GetPDFPageOneContents(s):
     the Root object, and also the crossref dictionary which gives
     byte offsets for all indirect objects.
     Then from Root object, find Pages object (a page tree), and
-    follow leftmost Kid until get to a leaf Page object, which
+    find its first leaf Page object, which
     in turn has the desired Contents object, which is a stream
     or an array of streams. Decompress (if necessary) the
     stream(s) and return their concatenation.
@@ -520,82 +1047,17 @@ def GetPDFPageOneContents(s):
       string: the decoded (possibly decompressed) contents of the first page
     """
 
-    (trailerdict, crossrefs) = GetPDFTrailerAndCrossrefs(s)
-    if not trailerdict or not crossrefs:
-        if WARN:
-            print('problem finding trailer or crossrefs')
-        return ''
-    if 'Root' not in trailerdict:
-        if WARN:
-            print('cannot find Root object')
-        return ''
-    root = GetTypedValFromDictEntry(trailerdict, 'Root', ODICT, s, crossrefs)
-    if root is None:
-        if WARN:
-            print('cannot find root dictionary')
-            return ''
-    pagesdict = GetTypedValFromDictEntry(root, 'Pages', ODICT, s, crossrefs)
-    if pagesdict is None:
-        if WARN:
-            print('cannot find Pages dictionary')
+    return _PageOneContents(PDFFile(s))
+
+
+def _PageOneContents(pdffile):
+    page = pdffile.FirstPage()
+    if page is None:
         return ''
-    pnode = pagesdict
-    while pnode:
-        pnodetype = PDFDictType(pnode)
-        if pnodetype == 'Pages':
-            kidsarray = GetTypedValFromDictEntry(pnode, 'Kids', OARRAY, s,
-                crossrefs)
-            if not kidsarray:
-                if WARN:
-                    print('cannot find Kids in Pages')
-                return ''
-            if len(kidsarray) == 0:
-                if WARN:
-                    print('Kids array has no Page')
-                return ''
-            pnodeobj = GetPDFObjFromIndirectRef(kidsarray[0], s, crossrefs)
-            if PDFObjHasType(pnodeobj, ODICT):
-                pnode = pnodeobj[1]
-            else:
-                if WARN:
-                    print('Kids element has unexpected type')
-                    return ''
-        elif pnodetype == 'Page':
-            contentsobj = GetPDFObjFromDictEntry(pnode, 'Contents', s,
-                crossrefs)
-            if contentsobj is None:
-                # it is legal for there to be no contents object:
-                # means empty page
-                if WARN:
-                    print('First Page is empty')
-                return ''
-            if contentsobj[0] == OSTREAM:
-                return GetPDFStreamContents(contentsobj, s, crossrefs)
-            elif contentsobj[0] == OARRAY:
-                pieces = []
-                for c in contentsobj[1]:
-                    if not PDFObjHasType(c, OINDIRECTREF):
-                        if WARN:
-                            print('Contents obj child not an indirect ref')
-                        return ''
-                    o = GetPDFObjFromIndirectRef(c, s, crossrefs)
-                    if not PDFObjHasType(o, OSTREAM):
-                        if WARN:
-                            print('Contents obj child not a stream')
-                        return ''
-                    pieces.append(GetPDFStreamContents(o, s, crossrefs))
-                return '\n'.join(pieces)
-            else:
-                if WARN:
-                    print('Contents object has unexpected type',
-                        contentsobj[0])
-                return ''
-        else:
-            if WARN:
-                print('Page tree node has unexpected type', pnodetype)
-            return ''
-    # shouldn't get here
-    return ''
+    contents = pdffile.PageContents(page)
+    if not contents and WARN:
+        print('First Page is empty')
+    return contents
 
 
 def GetPDFObjFromIndirectRef(obj, s, crossrefs):
@@ -715,3 +1177,10 @@ if __name__ == "__main__":
     if len(sys.argv) == 2:
         page1contents = ReadPDFPageOneContents(sys.argv[1])
         sys.stdout.write(page1contents)
+    elif len(sys.argv) == 3:
+        pdffile = OpenPDFFile(sys.argv[1])
+        if pdffile is not None:
+            pages = pdffile.Pages()
+            for i in ParsePageRange(sys.argv[2], len(pages)):
+                sys.stdout.write(pdffile.PageContents(pages[i]))
+            pdffile.Close()
@@ -24,7 +24,7 @@
 __author__ = "howard.trickey@gmail.com"
 
 import re
-import xml.dom.minidom
+import xml.parsers.expat
 from . import geom
 
 TOL = 1e-5
@@ -39,8 +39,10 @@ def ParseSVGFile(filename):
       geom.Art
     """
 
-    dom = xml.dom.minidom.parse(filename)
-    return _SVGDomToArt(dom)
+    parser = _SVGParser()
+    with open(filename, 'rb') as f:
+        parser.parser.ParseFile(f)
+    return parser.art
 
 
 def ParseSVGString(s):
@@ -52,8 +54,9 @@ def ParseSVGString(s):
       geom.Art
     """
 
-    dom = xml.dom.minidom.parseString(s)
-    return _SVGDomToArg(dom)
+    parser = _SVGParser()
+    parser.parser.Parse(s, True)
+    return parser.art
 
 
 class _SState(object):
@@ -68,83 +71,81 @@ class _SState(object):
         self.dpi = 90  # default Inkscape DPI
 
 
-def _SVGDomToArt(dom):
-    """Convert an svg file in dom form into an Art object.
-
-    Args:
-      dom: xml.dom.minidom.Document
-    Returns:
-      geom.Art
-    """
-
-    art = geom.Art()
-    svgs = dom.getElementsByTagName('svg')
-    if len(svgs) == 0:
-        return art
-    gs = _SState()
-    gs.ctm.d = -1.0
-    _ProcessChildren(svgs[0], art, gs)
-    return art
-
-
-def _ProcessChildren(nodes, art, gs):
-    """Process a list of SVG nodes, updating art.
-
-    Args:
-      nodes: list of xml.dom.Node
-      art: geom.Art
-      gs: _SState
-    Side effects:
-      Maybe adds paths to art.
-    """
-
-    for node in nodes.childNodes:
-        _ProcessNode(node, art, gs)
+class _SVGParser(object):
+    """Converts an svg document into an Art object while it is being read.
 
+    The document is never held in memory as a whole: the expat parser
+    calls _StartElement and _EndElement as it reads the input, and
+    the paths are added to art as soon as their elements are seen.
 
-def _ProcessNode(node, art, gs):
-    """Process an SVG node, updating art.
+    Only the contents of the first 'svg' element are converted,
+    and of the elements in there only 'g' elements are descended into.
 
-    Args:
-      node: xml.dom.Node
-      art: geom.Art
-      gs: _SState
-    Side effects:
-      Maybe adds paths to art.
+    Attributes:
+      parser: xml.parsers.expat.XMLParserType
+      art: geom.Art - the paths converted so far
+      stack: list of _SState or None - the graphics state for each
+          element that is open, None if its contents are skipped
+      seensvg: bool - True once the first 'svg' element has started
     """
 
-    if node.nodeType != node.ELEMENT_NODE:
-        return
-    tag = node.tagName
-    if tag == 'g':
-        _ProcessChildren(node, art, gs)
-    elif tag == 'defs':
-        pass  # TODO
-    elif tag == 'path':
-        _ProcessPath(node, art, gs)
-    elif tag == 'polygon':
-        _ProcessPolygon(node, art, gs)
-    elif tag == 'rect':
-        _ProcessRect(node, art, gs)
-    elif tag == 'ellipse':
-        _ProcessEllipse(node, art, gs)
-    elif tag == 'circle':
-        _ProcessCircle(node, art, gs)
-
-
-def _ProcessPolygon(node, art, gs):
-    """Process a 'polygon' SVG node, updating art.
+    def __init__(self):
+        self.parser = xml.parsers.expat.ParserCreate()
+        self.parser.StartElementHandler = self._StartElement
+        self.parser.EndElementHandler = self._EndElement
+        self.art = geom.Art()
+        self.stack = []
+        self.seensvg = False
+
+    def _StartElement(self, tag, attrs):
+        """Handle the start of an element.
+
+        Args:
+          tag: string - the element name
+          attrs: dict - the attributes of the element
+        Side effects:
+          Pushes the graphics state for the contents of the element,
+          maybe adds a path to art.
+        """
+
+        gs = None
+        outer = self.stack[-1] if self.stack else None
+        if outer is not None:
+            if tag == 'g':
+                gs = outer
+            elif tag in _ShapeProcs:
+                _ShapeProcs[tag](attrs, self.art, outer)
+        elif tag == 'svg' and not self.seensvg:
+            self.seensvg = True
+            gs = _SState()
+            gs.ctm.d = -1.0
+        self.stack.append(gs)
+
+    def _EndElement(self, tag):
+        """Handle the end of an element.
+
+        Args:
+          tag: string - the element name
+        Side effects:
+          Pops the graphics state of the element.
+        """
+
+        self.stack.pop()
+
+
+def _ProcessPolygon(attrs, art, gs):
+    """Process a 'polygon' SVG element, updating art.
 
     Args:
-      node: xml.dom.Node - a 'polygon' node
+      attrs: dict - attributes of the 'polygon' element
       arg: geom.Art
       gs: _SState
     Side effects:
       Adds path for polygon to art
     """
 
-    if node.hasAttribute('points'):
-        coords = _ParseCoordPairList(node.getAttribute('points'))
+    if 'points' in attrs:
+        coords = _ParseCoordPairList(attrs['points'])
         n = len(coords)
         if n > 0:
             c = [gs.ctm.Apply(coords[i]) for i in range(n)]
@@ -152,29 +153,29 @@ def _ProcessPolygon(node, art, gs):
             sp.segments = [('L', c[i], c[i % n]) for i in range(n)]
             sp.closed = True
             path = geom.Path()
-            _SetPathAttributes(path, node, gs)
+            _SetPathAttributes(path, attrs, gs)
             path.subpaths = [sp]
             art.paths.append(path)
 
 
-def _ProcessPath(node, art, gs):
-    """Process a 'polygon' SVG node, updating art.
+def _ProcessPath(attrs, art, gs):
+    """Process a 'path' SVG element, updating art.
 
     Args:
-      node: xml.dom.Node - a 'polygon' node
+      attrs: dict - attributes of the 'path' element
       arg: geom.Art
       gs: _SState
     Side effects:
-      Adds path for polygon to art
+      Adds path to art
     """
 
-    if not node.hasAttribute('d'):
+    if 'd' not in attrs:
         return
-    s = node.getAttribute('d')
+    s = attrs['d']
     i = 0
     n = len(s)
     path = geom.Path()
-    _SetPathAttributes(path, node, gs)
+    _SetPathAttributes(path, attrs, gs)
     initpt = (0.0, 0.0)
     subpath = None
     while i < len(s):
@@ -302,27 +303,27 @@ def _ParseSubpath(s, i, initpt, gs):
     return (i, None, cur)
 
 
-def _ProcessRect(node, art, gs):
-    """Process a 'rect' SVG node, updating art.
+def _ProcessRect(attrs, art, gs):
+    """Process a 'rect' SVG element, updating art.
 
     Args:
-      node: xml.dom.Node - a 'polygon' node
+      attrs: dict - attributes of the 'rect' element
       arg: geom.Art
       gs: _SState
     Side effects:
       Adds path for rectangle to art
     """
 
-    if not (node.hasAttribute('width') and node.hasAttribute('height')):
+    if not ('width' in attrs and 'height' in attrs):
         return
-    w = _ParseLengthAttrOrDefault(node, 'width', gs, 0.0)
-    h = _ParseLengthAttrOrDefault(node, 'height', gs, 0.0)
+    w = _ParseLengthAttrOrDefault(attrs, 'width', gs, 0.0)
+    h = _ParseLengthAttrOrDefault(attrs, 'height', gs, 0.0)
     if w <= 0.0 or h <= 0.0:
         return
-    x = _ParseCoordAttrOrDefault(node, 'x', 0.0)
-    y = _ParseCoordAttrOrDefault(node, 'y', 0.0)
-    rx = _ParseLengthAttrOrDefault(node, 'rx', gs, 0.0)
-    ry = _ParseLengthAttrOrDefault(node, 'ry', gs, 0.0)
+    x = _ParseCoordAttrOrDefault(attrs, 'x', 0.0)
+    y = _ParseCoordAttrOrDefault(attrs, 'y', 0.0)
+    rx = _ParseLengthAttrOrDefault(attrs, 'rx', gs, 0.0)
+    ry = _ParseLengthAttrOrDefault(attrs, 'ry', gs, 0.0)
     if rx == 0.0 and ry > 0.0:
         rx = ry
     elif rx > 0.0 and ry == 0.0:
@@ -369,62 +370,71 @@ def _ProcessRect(node, art, gs):
         subpath.AddSegment(_ArcSeg((x, y + ry), (x + rx, y),
             (rx, ry), 0.0, False, False, gs))
     path = geom.Path()
-    _SetPathAttributes(path, node, gs)
+    _SetPathAttributes(path, attrs, gs)
     path.subpaths = [subpath]
     art.paths.append(path)
 
 
-def _ProcessEllipse(node, art, gs):
-    """Process an 'ellipse' SVG node, updating art.
+def _ProcessEllipse(attrs, art, gs):
+    """Process an 'ellipse' SVG element, updating art.
 
     Args:
-      node: xml.dom.Node - a 'polygon' node
+      attrs: dict - attributes of the 'ellipse' element
       arg: geom.Art
       gs: _SState
     Side effects:
       Adds path for ellipse to art
     """
 
-    if not (node.hasAttribute('rx') and node.hasAttribute('ry')):
+    if not ('rx' in attrs and 'ry' in attrs):
         return
-    rx = _ParseLengthAttrOrDefault(node, 'rx', gs, 0.0)
-    ry = _ParseLengthAttrOrDefault(node, 'ry', gs, 0.0)
+    rx = _ParseLengthAttrOrDefault(attrs, 'rx', gs, 0.0)
+    ry = _ParseLengthAttrOrDefault(attrs, 'ry', gs, 0.0)
     if rx < TOL or ry < TOL:
         return
-    cx = _ParseCoordAttrOrDefault(node, 'cx', 0.0)
-    cy = _ParseCoordAttrOrDefault(node, 'cy', 0.0)
+    cx = _ParseCoordAttrOrDefault(attrs, 'cx', 0.0)
+    cy = _ParseCoordAttrOrDefault(attrs, 'cy', 0.0)
     subpath = _FullEllipseSubpath(cx, cy, rx, ry, gs)
     path = geom.Path()
     path.subpaths = [subpath]
-    _SetPathAttributes(path, node, gs)
+    _SetPathAttributes(path, attrs, gs)
     art.paths.append(path)
 
 
-def _ProcessCircle(node, art, gs):
-    """Process a 'circle' SVG node, updating art.
+def _ProcessCircle(attrs, art, gs):
+    """Process a 'circle' SVG element, updating art.
 
     Args:
-      node: xml.dom.Node - a 'polygon' node
+      attrs: dict - attributes of the 'circle' element
       arg: geom.Art
       gs: _SState
     Side effects:
       Adds path for circle to art
     """
 
-    if not node.hasAttribute('r'):
+    if 'r' not in attrs:
         return
-    r = _ParseLengthAttrOrDefault(node, 'r', gs, 0.0)
+    r = _ParseLengthAttrOrDefault(attrs, 'r', gs, 0.0)
     if r < TOL:
         return
-    cx = _ParseCoordAttrOrDefault(node, 'cx', 0.0)
-    cy = _ParseCoordAttrOrDefault(node, 'cy', 0.0)
+    cx = _ParseCoordAttrOrDefault(attrs, 'cx', 0.0)
+    cy = _ParseCoordAttrOrDefault(attrs, 'cy', 0.0)
     subpath = _FullEllipseSubpath(cx, cy, r, r, gs)
     path = geom.Path()
     path.subpaths = [subpath]
-    _SetPathAttributes(path, node, gs)
+    _SetPathAttributes(path, attrs, gs)
     art.paths.append(path)
 
 
+# the procedures that convert shape elements, by element name
+_ShapeProcs = {
+    'path': _ProcessPath,
+    'polygon': _ProcessPolygon,
+    'rect': _ProcessRect,
+    'ellipse': _ProcessEllipse,
+    'circle': _ProcessCircle}
+
+
 def _FullEllipseSubpath(cx, cy, rx, ry, gs):
     """Return a Subpath for a full ellipse.
 
@@ -516,15 +526,15 @@ def _ArcSeg(p1, p2, rad, rot, la, ccw, gs):
     return ('A', tp1, tp2, trad, rot, la, ccw)
 
 
-def _SetPathAttributes(path, node, gs):
+def _SetPathAttributes(path, attrs, gs):
     """Set the attributes related to filling/stroking in path.
 
-    Use attribute settings in node, if there, else those in the
+    Use attribute settings in attrs, if there, else those in the
     current graphics state, gs.
 
     Arguments:
       path: geom.Path
-      node: xml.dom.Node
+      attrs: dict - attributes of the element
       gs: _SState
     Side effects:
       May set filled, fillevenodd, stroked, fillpaint, strokepaint in path.
@@ -533,30 +543,30 @@ def _SetPathAttributes(path, node, gs):
     fill = gs.fill
     stroke = gs.stroke
     fillrule = gs.fillrule
-    if node.hasAttribute('style'):
-        style = _CSSInlineDict(node.getAttribute('style'))
+    if 'style' in attrs:
+        style = _CSSInlineDict(attrs['style'])
         if 'fill' in style:
             fill = style['fill']
         if 'stroke' in style:
             stroke = style['stroke']
         if 'fill-rule' in style:
             fillrule = style['fill-rule']
-    if node.hasAttribute('fill'):
-        fill = node.getAttribute('fill')
+    if 'fill' in attrs:
+        fill = attrs['fill']
     if fill != 'none':
         paint = _ParsePaint(fill)
         if paint is not None:
             path.fillpaint = paint
             path.filled = True
-    if node.hasAttribute('stroke'):
-        stroke = node.getAttribute('stroke')
+    if 'stroke' in attrs:
+        stroke = attrs['stroke']
     if stroke != 'none':
         paint = _ParsePaint(stroke)
         if stroke is not None:
             path.strokepaint = paint
             path.stroked = True
-    if node.hasAttribute('fill-rule'):
-        fillrule = node.getAttribute('fill-rule')
+    if 'fill-rule' in attrs:
+        fillrule = attrs['fill-rule']
     path.fillevenodd = (fillrule == 'evenodd')
 
 
@@ -617,11 +627,11 @@ def _ParsePaint(s):
     return geom.black_paint
 
 
-def _ParseLengthAttrOrDefault(node, attr, gs, default):
+def _ParseLengthAttrOrDefault(attrs, attr, gs, default):
     """Parse the given attribute as a length, else return default.
 
     Args:
-      node: xml.dom.Node
+      attrs: dict - attributes of the element
       attr: string - the attribute name
       gs: _SState - for dots-per-inch, for units conversion
       default: float - to return if no attr or error parsing it
@@ -629,29 +639,29 @@ def _ParseLengthAttrOrDefault(node, attr, gs, default):
       float - the length
     """
 
-    if not node.hasAttribute(attr):
+    if attr not in attrs:
         return default
-    (_, v) = _ParseLength(node.getAttribute(attr), gs, 0)
+    (_, v) = _ParseLength(attrs[attr], gs, 0)
     if v is None:
         return default
     else:
         return v
 
 
-def _ParseCoordAttrOrDefault(node, attr, default):
+def _ParseCoordAttrOrDefault(attrs, attr, default):
     """Parse the given attribute as a coordinate, else return default.
 
     Args:
-      node: xml.dom.Node
+      attrs: dict - attributes of the element
       attr: string - the attribute name
       default: float - to return if no attr or error parsing it
     Returns:
       float - the coordinate
     """
 
-    if not node.hasAttribute(attr):
+    if attr not in attrs:
         return default
-    (_, v) = _ParseCoord(node.getAttribute(attr), 0)
+    (_, v) = _ParseCoord(attrs[attr], 0)
     if v is None:
         return default
     else:
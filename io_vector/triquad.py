@@ -42,8 +42,15 @@ Angreflex = 3
 Angtangential = 4
 Ang360 = 5
 
+# Vertex kind constants for the sweep line triangulation
+Vstart = 1
+Vend = 2
+Vsplit = 3
+Vmerge = 4
+Vregular = 5
 
-def TriangulateFace(face, points):
+
+def TriangulateFace(face, points, triangulator='EARCHOP'):
     """Triangulate the given face.
 
     Uses an easy triangulation first, followed by a constrained delauney
@@ -52,6 +59,10 @@ def TriangulateFace(face, points):
     Args:
       face: list of int - indices in points, assumed CCW-oriented
       points: geom.Points - holds coordinates for vertices
+      triangulator: string - 'EARCHOP' to start from an ear chopping
+          triangulation, 'SWEEP' to start from a sweep line triangulation
+          (much faster on big faces; falls back to ear chopping if the
+          face is degenerate)
     Returns:
       list of (int, int, int) - 3-tuples are CCW-oriented vertices of
           triangles making up the triangulation
@@ -59,13 +70,11 @@ def TriangulateFace(face, points):
 
     if len(face) <= 3:
         return [tuple(face)]
-    tris = EarChopTriFace(face, points)
-    bord = _BorderEdges([face])
-    triscdt = _CDT(tris, bord, points)
+    (triscdt, _) = _TriangulateCDT(face, [], points, triangulator)
     return triscdt
 
 
-def TriangulateFaceWithHoles(face, holes, points):
+def TriangulateFaceWithHoles(face, holes, points, triangulator='EARCHOP'):
     """Like TriangulateFace, but with holes inside the face.
 
     Works by making one complex polygon that has segments to
@@ -77,23 +86,19 @@ def TriangulateFaceWithHoles(face, holes, points):
       holes: list of list of int - each sublist is like face
           but CW-oriented and assumed to be inside face
       points: geom.Points - holds coordinates for vertices
+      triangulator: string - see TriangulateFace
     Returns:
       list of (int, int, int) - 3-tuples are CCW-oriented vertices of
           triangles making up the triangulation
     """
 
     if len(holes) == 0:
-        return TriangulateFace(face, points)
-    allfaces = [face] + holes
-    sholes = [_SortFace(h, points) for h in holes]
-    joinedface = _JoinIslands(face, sholes, points)
-    tris = EarChopTriFace(joinedface, points)
-    bord = _BorderEdges(allfaces)
-    triscdt = _CDT(tris, bord, points)
+        return TriangulateFace(face, points, triangulator)
+    (triscdt, _) = _TriangulateCDT(face, holes, points, triangulator)
     return triscdt
 
 
-def QuadrangulateFace(face, points):
+def QuadrangulateFace(face, points, triangulator='EARCHOP'):
     """Quadrangulate the face (subdivide into convex quads and tris).
 
     Like TriangulateFace, but after triangulating, join as many pairs
@@ -102,6 +107,7 @@ def QuadrangulateFace(face, points):
     Args:
       face: list of int - indices in points, assumed CCW-oriented
       points: geom.Points - holds coordinates for vertices
+      triangulator: string - see TriangulateFace
     Returns:
       list of 3-tuples or 4-tuples of ints - CCW-oriented vertices of
           quadrilaterals and triangles making up the quadrangulation.
@@ -109,14 +115,12 @@ def QuadrangulateFace(face, points):
 
     if len(face) <= 3:
         return [tuple(face)]
-    tris = EarChopTriFace(face, points)
-    bord = _BorderEdges([face])
-    triscdt = _CDT(tris, bord, points)
+    (triscdt, bord) = _TriangulateCDT(face, [], points, triangulator)
     qs = _Quandrangulate(triscdt, bord, points)
     return qs
 
 
-def QuadrangulateFaceWithHoles(face, holes, points):
+def QuadrangulateFaceWithHoles(face, holes, points, triangulator='EARCHOP'):
     """Like QuadrangulateFace, but with holes inside the faces.
 
     Args:
@@ -124,23 +128,62 @@ def QuadrangulateFaceWithHoles(face, holes, points):
       holes: list of list of int - each sublist is like face
           but CW-oriented and assumed to be inside face
       points: geom.Points - holds coordinates for vertices
+      triangulator: string - see TriangulateFace
     Returns:
       list of 3-tuples or 4-tuples of ints - CCW-oriented vertices of
           quadrilaterals and triangles making up the quadrangulation.
     """
 
     if len(holes) == 0:
-        return QuadrangulateFace(face, points)
-    allfaces = [face] + holes
-    sholes = [_SortFace(h, points) for h in holes]
-    joinedface = _JoinIslands(face, sholes, points)
-    tris = EarChopTriFace(joinedface, points)
-    bord = _BorderEdges(allfaces)
-    triscdt = _CDT(tris, bord, points)
+        return QuadrangulateFace(face, points, triangulator)
+    (triscdt, bord) = _TriangulateCDT(face, holes, points, triangulator)
     qs = _Quandrangulate(triscdt, bord, points)
     return qs
 
 
+def _TriangulateCDT(face, holes, points, triangulator):
+    """Return (tris, bord): the constrained delaunay triangulation
+    of face with holes, and the border edges of face and holes."""
+
+    allfaces = [face] + holes
+    bord = _BorderEdges(allfaces)
+    if triangulator == 'SWEEP':
+        tris = SweepTriFace(face, holes, points)
+        if tris is not None:
+            return (_CanonicalTris(_HalfEdgeCDT(tris, points)), bord)
+    if len(holes) == 0:
+        joinedface = face
+    else:
+        sholes = [_SortFace(h, points) for h in holes]
+        joinedface = _JoinIslands(face, sholes, points)
+    tris = EarChopTriFace(joinedface, points)
+    return (_CanonicalTris(_CDT(tris, bord, points)), bord)
+
+
+def _CanonicalTris(tris):
+    """Return tris with each triangle rotated to start at its least
+    vertex index, in an order that only depends on the set of triangles.
+
+    The matching in _Quandrangulate is exponential in the worst case and
+    its running time depends a lot on the order of the triangles, so this
+    makes both triangulators give it the same input when they find the
+    same triangles.  The set order scatters neighboring triangles, which
+    is much faster for the matching than a sorted, spatially coherent
+    order."""
+
+    ans = []
+    for (a, b, c) in tris:
+        if b < a and b < c:
+            ans.append((b, c, a))
+        elif c < a and c < b:
+            ans.append((c, a, b))
+        else:
+            ans.append((a, b, c))
+    # insert in sorted order, so collisions don't depend on the input order
+    ans.sort()
+    return list(set(ans))
+
+
 def _SortFace(face, points):
     """Rotate face so leftmost vertex is first, where face is
     list of indices in points."""
@@ -548,6 +591,323 @@ def _OtherVert(tri, a, b):
     return None
 
 
+def SweepTriFace(face, holes, points):
+    """Triangulate face with holes by sweeping a horizontal line
+    from top to bottom.
+
+    The sweep adds the diagonals that split the face into y-monotone
+    pieces, each of which is then triangulated in one linear pass
+    (see chapter 3 of "Computational Geometry" by de Berg et al.).
+    Unlike EarChopTriFace the holes need not be joined to the face first,
+    and the whole thing takes O(n log n) time.
+
+    Args:
+      face: list of int - indices in points, assumed CCW-oriented
+      holes: list of list of int - each sublist is like face
+          but CW-oriented and assumed to be inside face
+      points: geom.Points - holds coordinates for vertices
+    Returns:
+      list of (int, int, int) - CCW-oriented triangles, or None if
+          the face is degenerate (repeated vertices, touching or wrongly
+          oriented rings) and some other method has to be used
+    """
+
+    rings = [face] + [h for h in holes if len(h) > 0]
+    verts = []
+    nxt = []
+    prv = []
+    for ring in rings:
+        k = len(ring)
+        if k < 3:
+            return None
+        base = len(verts)
+        verts.extend(ring)
+        nxt.extend(base + (i + 1) % k for i in range(k))
+        prv.extend(base + (i - 1) % k for i in range(k))
+    n = len(verts)
+    xs = [points.pos[v][0] for v in verts]
+    ys = [points.pos[v][1] for v in verts]
+    if len(set(verts)) != n or len(set(zip(xs, ys))) != n:
+        return None
+    # sweep order: top to bottom, left to right on the same height
+    order = sorted(range(n), key=lambda i: (-ys[i], xs[i]))
+    rank = [0] * n
+    for (r, i) in enumerate(order):
+        rank[i] = r
+    diags = _MonotoneDiagonals(order, rank, nxt, prv, xs, ys)
+    if diags is None:
+        return None
+    pieces = _MonotonePieces(nxt, prv, diags, xs, ys)
+    if pieces is None:
+        return None
+    tris = []
+    for piece in pieces:
+        _TriangulateMonotone(piece, rank, xs, ys, tris)
+    if len(tris) != n + 2 * len(rings) - 4:
+        return None
+    # the triangles have to cover exactly the area inside the rings
+    area = 0.0
+    for i in range(n):
+        j = nxt[i]
+        area += xs[i] * ys[j] - xs[j] * ys[i]
+    triarea = 0.0
+    for (a, b, c) in tris:
+        t = _Area2(a, b, c, xs, ys)
+        if t < -TOL:
+            return None
+        triarea += t
+    if area <= 0.0 or abs(triarea - area) > TOL * area:
+        return None
+    return [(verts[a], verts[b], verts[c]) for (a, b, c) in tris]
+
+
+def _Area2(a, b, c, xs, ys):
+    """Return twice the signed area of triangle abc, where a, b, c
+    index the coordinate lists xs and ys."""
+
+    return (xs[b] - xs[a]) * (ys[c] - ys[a]) - \
+        (ys[b] - ys[a]) * (xs[c] - xs[a])
+
+
+def _MonotoneDiagonals(order, rank, nxt, prv, xs, ys):
+    """Return the list of diagonals (u, v) that split the rings
+    (given by the nxt and prv vertex links) into y-monotone pieces,
+    or None if the sweep finds the rings inconsistent.
+    order is the sweep order of the vertices, rank the inverse of order."""
+
+    n = len(order)
+    kind = [Vregular] * n
+    for v in range(n):
+        p = prv[v]
+        q = nxt[v]
+        turn = _Area2(p, v, q, xs, ys)
+        if rank[p] > rank[v] and rank[q] > rank[v]:
+            if turn == 0.0:
+                return None
+            kind[v] = Vstart if turn > 0.0 else Vsplit
+        elif rank[p] < rank[v] and rank[q] < rank[v]:
+            if turn == 0.0:
+                return None
+            kind[v] = Vend if turn > 0.0 else Vmerge
+
+    # status holds the edges (named by their start vertex) that cross
+    # the sweep line with the inside of the face on their right,
+    # sorted from left to right
+    status = []
+    helper = [-1] * n
+    diags = []
+
+    def numleft(v):
+        # number of edges in status that cross the sweep line left of v
+        (x, y) = (xs[v], ys[v])
+        lo = 0
+        hi = len(status)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            a = status[mid]
+            b = nxt[a]
+            if ys[a] == ys[b]:
+                ex = xs[b]
+            else:
+                ex = xs[a] + (y - ys[a]) * (xs[b] - xs[a]) / (ys[b] - ys[a])
+            if ex < x:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    for v in order:
+        k = kind[v]
+        p = prv[v]
+        # a regular vertex either continues an edge with the inside on
+        # its right, or one with the inside on its left
+        downward = k == Vregular and rank[p] < rank[v]
+        upward = k == Vregular and rank[p] > rank[v]
+        if k == Vend or k == Vmerge or downward:
+            if kind[helper[p]] == Vmerge:
+                diags.append((v, helper[p]))
+            try:
+                status.remove(p)
+            except ValueError:
+                return None
+        if k == Vsplit or k == Vmerge or upward:
+            i = numleft(v)
+            if i == 0:
+                return None
+            e = status[i - 1]
+            if k == Vsplit or kind[helper[e]] == Vmerge:
+                diags.append((v, helper[e]))
+            helper[e] = v
+        if k == Vstart or k == Vsplit or downward:
+            status.insert(numleft(v), v)
+            helper[v] = v
+    return diags
+
+
+def _MonotonePieces(nxt, prv, diags, xs, ys):
+    """Return the faces that the rings (given by the nxt and prv vertex
+    links) are split into by the diagonals, as CCW lists of vertices,
+    or None if they don't split into proper faces."""
+
+    n = len(nxt)
+    nbrs = [[nxt[v], prv[v]] for v in range(n)]
+    for (u, v) in set(diags):
+        nbrs[u].append(v)
+        nbrs[v].append(u)
+    # sort the neighbors of every vertex counterclockwise, and
+    # remember where each neighbor is in the list
+    where = {}
+    for v in range(n):
+        if len(nbrs[v]) > 2:
+            nbrs[v].sort(key=lambda w: math.atan2(ys[w] - ys[v],
+                xs[w] - xs[v]))
+        for (i, w) in enumerate(nbrs[v]):
+            where[(v, w)] = i
+    halfedges = [(v, nxt[v]) for v in range(n)]
+    for (u, v) in set(diags):
+        halfedges.append((u, v))
+        halfedges.append((v, u))
+    seen = set()
+    pieces = []
+    for start in halfedges:
+        if start in seen:
+            continue
+        piece = []
+        e = start
+        while e not in seen:
+            seen.add(e)
+            (u, v) = e
+            piece.append(u)
+            # leave v by the next edge clockwise from the one we came in by
+            vn = nbrs[v]
+            w = vn[where[(v, u)] - 1]
+            if w == prv[v] or len(piece) > n:
+                return None
+            e = (v, w)
+        if e != start:
+            return None
+        pieces.append(piece)
+    return pieces
+
+
+def _TriangulateMonotone(piece, rank, xs, ys, tris):
+    """Triangulate the y-monotone CCW polygon piece and append the
+    triangles to tris.  rank gives the sweep order of the vertices."""
+
+    k = len(piece)
+    if k == 3:
+        tris.append(tuple(piece))
+        return
+    top = min(range(k), key=lambda i: rank[piece[i]])
+    bottom = piece[max(range(k), key=lambda i: rank[piece[i]])]
+    # going CCW from the top vertex runs down the left chain
+    left = set()
+    i = top
+    while piece[i] != bottom:
+        left.add(piece[i])
+        i = (i + 1) % k
+    u = sorted(piece, key=rank.__getitem__)
+    stack = [u[0], u[1]]
+    for j in range(2, k - 1):
+        w = u[j]
+        wleft = w in left
+        if wleft != (stack[-1] in left):
+            # w sees every vertex on the stack
+            for i in range(1, len(stack)):
+                if wleft:
+                    tris.append((w, stack[i], stack[i - 1]))
+                else:
+                    tris.append((w, stack[i - 1], stack[i]))
+            stack = [stack[-1], w]
+        else:
+            last = stack.pop()
+            while stack:
+                s = stack[-1]
+                if wleft:
+                    t = (s, last, w)
+                else:
+                    t = (w, last, s)
+                if _Area2(t[0], t[1], t[2], xs, ys) <= 0.0:
+                    break
+                tris.append(t)
+                last = stack.pop()
+            stack.append(last)
+            stack.append(w)
+    w = u[-1]
+    wleft = stack[-1] not in left
+    for i in range(1, len(stack)):
+        if wleft:
+            tris.append((w, stack[i], stack[i - 1]))
+        else:
+            tris.append((w, stack[i - 1], stack[i]))
+
+
+def _HalfEdgeCDT(tris, points):
+    """Like _CDT, but for a list of triangles that exactly covers the
+    region inside the border edges, and using an indexed half-edge
+    structure instead of dictionaries and sets of triangle tuples.
+
+    Half-edge h goes from verts[h] to the next vertex of triangle h // 3,
+    twin[h] is the opposite half-edge in the neighboring triangle
+    or -1 on the border.
+
+    Args:
+      tris: list of (int, int, int) - CCW-oriented indices into points
+      points: geom.Points - holds coordinates for vertices
+    Returns:
+      list of (int, int, int) - the flipped triangles
+    """
+
+    verts = [v for t in tris for v in t]
+    m = len(verts)
+    twin = [-1] * m
+    unpaired = dict()
+    for h in range(m):
+        a = verts[h]
+        b = verts[h - h % 3 + (h + 1) % 3]
+        g = unpaired.pop((b, a), None)
+        if g is None:
+            unpaired[(a, b)] = h
+        else:
+            twin[h] = g
+            twin[g] = h
+    stack = [h for h in range(m) if twin[h] > h]
+    while stack:
+        a = stack.pop()
+        b = twin[a]
+        if b < 0:
+            continue
+        a0 = a - a % 3
+        al = a0 + (a + 1) % 3
+        ar = a0 + (a + 2) % 3
+        b0 = b - b % 3
+        br = b0 + (b + 1) % 3
+        bl = b0 + (b + 2) % 3
+        p0 = verts[ar]
+        pr = verts[a]
+        pl = verts[al]
+        p1 = verts[bl]
+        if not InCircle(pr, pl, p0, p1, points):
+            continue
+        if not (Ccw(p1, pl, p0, points) and Ccw(p0, pr, p1, points)):
+            continue
+        # flip: triangle a becomes (p1, pl, p0), triangle b (p0, pr, p1)
+        verts[a] = p1
+        verts[b] = p0
+        hbl = twin[bl]
+        har = twin[ar]
+        twin[a] = hbl
+        if hbl >= 0:
+            twin[hbl] = a
+        twin[b] = har
+        if har >= 0:
+            twin[har] = b
+        twin[ar] = bl
+        twin[bl] = ar
+        stack.extend((a, al, b, br))
+    return [tuple(verts[h:h + 3]) for h in range(0, m, 3)]
+
+
 def _ClassifyAngles(face, n, points):
     """Return vector of anglekinds of the Angle around each point in face."""
 
@@ -725,6 +1085,10 @@ def _DCMatch(er):
     is either one that includes that edge or excludes it - and we can
     use a recursive call to _DCMatch to handle each component separately
     on what remains of the graph after including/excluding the separating edge.
+    Of all separating edges, use the one leaving the smallest biggest
+    component: splitting off a few triangles at a time makes the recursion
+    exponential, and which separating edge comes first depends on the order
+    of the triangles.
     If we're not lucky, we fall back on _EMatch (see below).
 
     Args:
@@ -738,53 +1102,51 @@ def _DCMatch(er):
         return ([], 0.0)
     if len(er) == 1:
         return (er, er[0][0])
-    match = []
-    matchw = 0.0
+    best = None
     for i in range(0, len(er)):
         (nc, comp) = _FindComponents(er, i)
         if nc == 1:
             # er[i] doesn't separate er
             continue
-        (wi, _, tl, tr) = er[i]
-        if comp[tl] != comp[tr]:
-            # case 1: er separates graph
-            # compare the matches that include er[i] versus
-            # those that exclude it
-            (a, b) = _PartitionComps(er, comp, i, comp[tl], comp[tr])
-            ax = _CopyExcluding(a, tl, tr)
-            bx = _CopyExcluding(b, tl, tr)
-            (axmatch, wax) = _DCMatch(ax)
-            (bxmatch, wbx) = _DCMatch(bx)
-            if len(ax) == len(a):
-                wa = wax
-                amatch = axmatch
-            else:
-                (amatch, wa) = _DCMatch(a)
-            if len(bx) == len(b):
-                wb = wbx
-                bmatch = bxmatch
-            else:
-                (bmatch, wb) = _DCMatch(b)
-            w = wa + wb
-            wx = wax + wbx + wi
-            if w > wx:
-                match = amatch + bmatch
-                matchw = w
-            else:
-                match = [er[i]] + axmatch + bxmatch
-                matchw = wx
+        sizes = dict()
+        for c in comp.values():
+            sizes[c] = sizes.get(c, 0) + 1
+        biggest = max(sizes.values())
+        if best is None or biggest < best[0]:
+            best = (biggest, i, comp)
+    if best is None:
+        return _EMatch(er)
+    (_, i, comp) = best
+    (wi, _, tl, tr) = er[i]
+    if comp[tl] != comp[tr]:
+        # case 1: er separates graph
+        # compare the matches that include er[i] versus
+        # those that exclude it
+        (a, b) = _PartitionComps(er, comp, i, comp[tl], comp[tr])
+        ax = _CopyExcluding(a, tl, tr)
+        bx = _CopyExcluding(b, tl, tr)
+        (axmatch, wax) = _DCMatch(ax)
+        (bxmatch, wbx) = _DCMatch(bx)
+        if len(ax) == len(a):
+            wa = wax
+            amatch = axmatch
         else:
-            # case 2: er not needed to separate graph
-            (a, b) = _PartitionComps(er, comp, -1, 0, 0)
             (amatch, wa) = _DCMatch(a)
+        if len(bx) == len(b):
+            wb = wbx
+            bmatch = bxmatch
+        else:
             (bmatch, wb) = _DCMatch(b)
-            match = amatch + bmatch
-            matchw = wa + wb
-        if match:
-            break
-    if not match:
-        return _EMatch(er)
-    return (match, matchw)
+        w = wa + wb
+        wx = wax + wbx + wi
+        if w > wx:
+            return (amatch + bmatch, w)
+        return ([er[i]] + axmatch + bxmatch, wx)
+    # case 2: er not needed to separate graph
+    (a, b) = _PartitionComps(er, comp, -1, 0, 0)
+    (amatch, wa) = _DCMatch(a)
+    (bmatch, wb) = _DCMatch(b)
+    return (amatch + bmatch, wa + wb)
 
 
 def _EMatch(er):
@@ -812,12 +1174,11 @@ def _EMatch(er):
     if not er:
         return ([], 0.0)
     if len(er) == 1:
-        return (er, er[1][1])
+        return (er, er[0][0])
     i = random.randint(0, len(er) - 1)
     eri = (wi, _, tl, tr) = er[i]
     # case a: include eri.  exlude other edges that touch tl or tr
     a = _CopyExcluding(er, tl, tr)
-    a.append(eri)
     (amatch, wa) = _DCMatch(a)
     wa += wi
     if len(a) == len(er) - 1:
@@ -1170,3 +1531,55 @@ def InCircle(a, b, c, d, points):
 def _Icc(p):
     (x, y) = (p[0], p[1])
     return (x, y, x * x + y * y)
+
+
+if __name__ == "__main__":
+
+    import time
+    import unittest
+
+    class TestQuadrangulate(unittest.TestCase):
+
+        def Star(self, points, cx, cy, r, n, rng, ccw=True):
+            face = []
+            for i in range(n):
+                a = 2.0 * math.pi * i / n
+                d = r * (0.5 + 0.5 * rng.random())
+                face.append(points.AddPoint((cx + d * math.cos(a),
+                    cy + d * math.sin(a))))
+            if not ccw:
+                face.reverse()
+            return face
+
+        def StarWithHoles(self, seed, n, nholes):
+            rng = random.Random(seed)
+            points = geom.Points()
+            face = self.Star(points, 0.0, 0.0, 10.0, n, rng)
+            holes = []
+            for j in range(nholes):
+                a = 2.0 * math.pi * j / nholes
+                holes.append(self.Star(points, 2.5 * math.cos(a),
+                    2.5 * math.sin(a), 1.0, 8 + j % 5, rng, False))
+            return (face, holes, points)
+
+        def test_sweep_matches_earchop(self):
+            for (seed, n, nholes) in ((1, 51, 4), (1, 31, 4), (6, 31, 4),
+                                      (22, 31, 4), (24, 21, 3), (35, 61, 2)):
+                (face, holes, points) = self.StarWithHoles(seed, n, nholes)
+                quads = []
+                for triangulator in ('EARCHOP', 'SWEEP'):
+                    random.seed(0)
+                    t = time.time()
+                    qs = QuadrangulateFaceWithHoles(face, holes, points,
+                        triangulator)
+                    self.assertLess(time.time() - t, 5.0)
+                    self.assertEqual(len(qs), len(set(qs)))
+                    # quads and tris together cover the triangles once
+                    ntris = sum(len(q) - 2 for q in qs)
+                    self.assertEqual(ntris,
+                        len(face) + sum(len(h) for h in holes) +
+                        2 * len(holes) - 2)
+                    quads.append(qs)
+                self.assertEqual(quads[0], quads[1])
+
+    unittest.main()
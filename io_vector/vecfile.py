@@ -28,6 +28,8 @@ and faces specified in a vector file.
 
 __author__ = "howard.trickey@gmail.com"
 
+import multiprocessing
+import os
 import re
 from . import geom
 from . import pdf
@@ -108,13 +110,17 @@ def _FindAdobeIllustrator(f):
     return False
 
 
-def ParseVecFile(filename):
+def ParseVecFile(filename, pages="", processes=0):
     """Parse a vector art file and return an Art object for it.
 
     Right now, handled file types  are: EPS, Adobe Illustrator, PDF
 
     Args:
       filename: string - name of the file to read and parse
+      pages: string - for PDF files, the pages to import
+          (see pdf.ParsePageRange); '' means the first page
+      processes: int - for PDF files, number of worker processes
+          that parse pages (0 means one per cpu)
     Returns:
       geom.Art: object containing paths drawn in the file.
            Return None if there was a major problem reading the file.
@@ -125,12 +131,7 @@ def ParseVecFile(filename):
         print("Couldn't get Art:", minor)
         return None
     if major == "pdf" or (major == "ai" and minor == "pdf"):
-        contents = pdf.ReadPDFPageOneContents(filename)
-        if contents:
-            toks = TokenizeAIEPS(contents)
-            return ParsePS(toks, major, minor)
-        else:
-            return None
+        return ParsePDFPages(filename, major, minor, pages, processes)
     elif major == "eps" or (major == "ai" and minor == "eps"):
         toks = TokenizeAIEPSFile(filename)
         return ParsePS(toks, major, minor)
@@ -140,6 +141,94 @@ def ParseVecFile(filename):
         return None
 
 
+def ParsePDFPages(filename, major, minor, pages="", processes=0):
+    """Parse some pages of a PDF file into one Art object.
+
+    The pages are laid out left to right, each one shifted by the
+    widths of the pages before it. The pages are parsed independently,
+    in a pool of forked worker processes if there is more than one.
+
+    Args:
+      filename: string - name of the file to read and parse
+      major: string - major version, as from ClassifyFile
+      minor: string - minor version, as from ClassifyFile
+      pages: string - the pages to import (see pdf.ParsePageRange)
+      processes: int - number of worker processes (0 means one per cpu)
+    Returns:
+      geom.Art or None if none of the pages has contents
+    """
+
+    global _poolpdf
+
+    pdffile = pdf.OpenPDFFile(filename)
+    if pdffile is None:
+        return None
+    try:
+        allpages = pdffile.Pages()
+        tasks = []
+        dx = 0.0
+        for i in pdf.ParsePageRange(pages, len(allpages)):
+            tasks.append((i, dx, major, minor))
+            dx += pdffile.PageWidth(allpages[i])
+        # forked workers inherit the open file (and its memory map)
+        _poolpdf = pdffile
+        arts = _MapPages(tasks, processes)
+    finally:
+        _poolpdf = None
+        pdffile.Close()
+    arts = [art for art in arts if art is not None]
+    if not arts:
+        return None
+    art = arts[0]
+    for other in arts[1:]:
+        art.paths.extend(other.paths)
+    return art
+
+
+# the PDFFile that ParsePDFPages is working on, for the worker processes
+_poolpdf = None
+
+
+def _MapPages(tasks, processes):
+    """Run _ParsePDFPage on all tasks, in parallel if possible."""
+
+    if processes <= 0:
+        # forking is needed, spawned processes can't import the addon
+        # outside of Blender
+        processes = multiprocessing.cpu_count() if hasattr(os, "fork") \
+            else 1
+    processes = min(processes, len(tasks))
+    if processes <= 1:
+        return [_ParsePDFPage(task) for task in tasks]
+    pool = multiprocessing.get_context("fork").Pool(processes)
+    try:
+        return pool.map(_ParsePDFPage, tasks, chunksize=1)
+    finally:
+        pool.close()
+        pool.join()
+
+
+def _ParsePDFPage(task):
+    """Parse one page of _poolpdf.
+
+    Args:
+      task: (int, float, string, string) - (page index, x shift,
+          major version, minor version)
+    Returns:
+      geom.Art or None if the page has no contents
+    """
+
+    (i, dx, major, minor) = task
+    contents = _poolpdf.PageContents(_poolpdf.Pages()[i])
+    if not contents:
+        return None
+    toks = TokenizeAIEPS(contents)
+    if dx != 0.0:
+        toks[0:0] = [(TNUM, 1.0), (TNUM, 0.0), (TNUM, 0.0), (TNUM, 1.0),
+            (TNUM, dx), (TNUM, 0.0), (TNAME, "cm")]
+    return ParsePS(toks, major, minor)
+
+
 def ParseAIEPSFile(filename):
     """Parse an AI (eps kind) file and return an Art object for it.
 
@@ -118,6 +118,7 @@ from mathutils import Vector
 import struct
 import bisect
 import os.path
+import numpy as np
 notZero = 0.0000000001
 #scn = bpy.context.scene
 winmgr = bpy.context.window_manager
@@ -905,6 +906,196 @@ def getCandidateSites(aList, iList = []):
     #print('FXNTIMER:getCandidateSites:', tt2-tt1, 'check 26 against:', len(aList)+len(iList))    
     return ncList
 
+######################################################################
+########################## INDEXED FSLG ENGINE #######################
+######################################################################
+def chargePotentials(sites, charges, weights = None):
+    ###---IN: sites -(3,N) ARRAY OF CANDIDATE SITES, charges -(3,M) ARRAY OF
+    ###       CHARGED CELLS, weights -(M) ARRAY OF CHARGES, 1 IF None
+    ###   OUT: (N) ARRAY OF POTENTIAL AT EACH SITE (FSLG - Eqn. 10)
+    r1 = 1/2
+    pots = np.zeros(sites.shape[1])
+    if not sites.shape[1] or not charges.shape[1]: return pots
+    ###---CHUNKS OF SITES, SO THE DISTANCE MATRIX STAYS SMALL
+    step = max(1, 2**20 // charges.shape[1])
+    for i in range(0, sites.shape[1], step):
+        s = sites[:, i:i+step, None]
+        d = np.sqrt((s[0] - charges[0]) ** 2 + (s[1] - charges[1]) ** 2 + \
+            (s[2] - charges[2]) ** 2)
+        with np.errstate(divide = 'ignore'):
+            Oi = 1 - (r1 / d)
+        Oi[d == 0] = 0   ###---NO INFLUENCE OF A CHARGE ON ITS OWN SITE
+        if weights is not None: Oi *= weights
+        pots[i:i+step] = Oi.sum(axis = 1)
+    return pots
+
+class FSLGGrid():
+    ###---CHARGED CELLS AND CANDIDATE SITES OF THE GROWTH LOOP
+    ###   CELLS ARE INDEXED IN SETS, CANDIDATE SITES AND THEIR POTENTIALS
+    ###   ARE KEPT IN ARRAYS IN THE SAME ORDER AS THE CANDIDATE LISTS,
+    ###   COORDINATES AS (3,N) ARRAYS SO X, Y AND Z ARE CONTIGUOUS
+    def __init__(self, cgrid, iList = [], eList = []):
+        ###---IN: cgrid -[(X,Y,Z)] INITIAL CHARGES, iList -INSULATOR SITES
+        ###       eList -[(X,Y,Z,W)] GROUND/CLOUD CHARGES
+        self.cgrid = []
+        self.charged = set()
+        self.insulated = set(iList)
+        self.candidates = set()
+        self.cellCo = np.zeros((3, max(64, 2 * len(cgrid))))
+        self.eCo = np.array([e[0:3] for e in eList], dtype = float).reshape(-1, 3).T
+        self.eCharge = np.array([e[3] for e in eList], dtype = float)
+        self.cSites = np.zeros((3, 0))
+        self.cPots = np.zeros(0)
+        for c in cgrid: self.addCharge(c)
+        self.addCandidates(cgrid)
+
+    def addCharge(self, c):
+        n = len(self.cgrid)
+        if n == self.cellCo.shape[1]:
+            self.cellCo = np.concatenate((self.cellCo, np.zeros_like(self.cellCo)), axis = 1)
+        self.cellCo[:, n] = c
+        self.cgrid.append(c)
+        self.charged.add(c)
+
+    def addCandidates(self, cells):
+        ###---ADD UNKNOWN STENCIL NEIGHBOURS OF cells WITH THEIR POTENTIAL
+        new = []
+        for c in cells:
+            for t in getStencil3D_26(c[0], c[1], c[2]):
+                if t in self.charged or t in self.insulated or \
+                t in self.candidates: continue
+                self.candidates.add(t)
+                new.append(t)
+        if not new: return
+        co = np.array(new, dtype = float).T
+        pots = chargePotentials(co, self.cellCo[:, :len(self.cgrid)])
+        pots += chargePotentials(co, self.eCo, self.eCharge)
+        self.cSites = np.concatenate((self.cSites, co), axis = 1)
+        self.cPots = np.concatenate((self.cPots, pots))
+
+    def grow(self, uN):
+        ###====== 1) SELECT NEW GROWTH SITE (Eqn. 12)
+        Omin = self.cPots.min(); Omax = self.cPots.max()
+        if Omin == Omax: Omax += notZero; Omin -= notZero
+        ###===(FSLG - Eqn. 13), NOT NORMALIZED, ONLY THE RATIOS MATTER
+        weights = np.power((self.cPots - Omin) / (Omax - Omin), uN)
+        ###===WEIGHTED RANDOM CHOICE OVER THE CUMULATIVE SUM
+        cweights = np.cumsum(weights)
+        gSitei = int(np.searchsorted(cweights,
+            random.uniform(0, cweights[-1]), side = 'right'))
+        gSitei = min(gSitei, len(cweights) - 1)
+        gsite = tuple(int(co) for co in self.cSites[:, gSitei])
+
+        ###====== 2) ADD NEW POINT CHARGE AT GROWTH SITE
+        self.addCharge(gsite)
+        self.candidates.discard(gsite)
+        self.cSites = np.delete(self.cSites, gSitei, axis = 1)
+        self.cPots = np.delete(self.cPots, gSitei)
+
+        ###====== 3) UPDATE POTENTIAL AT CANDIDATE SITES (Eqn. 11)
+        r1 = 1/2
+        self.cPots += 1 - (r1 / np.sqrt((self.cSites[0] - gsite[0]) ** 2 + \
+            (self.cSites[1] - gsite[1]) ** 2 + (self.cSites[2] - gsite[2]) ** 2))
+
+        ###====== 4) ADD NEW CANDIDATES SURROUNDING GROWTH SITE
+        ###====== 5) CALC POTENTIAL AT NEW CANDIDATE SITES (Eqn. 10)
+        self.addCandidates([gsite])
+        return gsite
+
+def growCells(cgrid, icList, eChargeList, uN, TSTEPS, groundZ = None, cloudCells = set(), verbose = False):
+    ###---IN: cgrid -INITIAL CHARGES, icList -INSULATOR SITES, eChargeList -GROUND/CLOUD CHARGES
+    ###       groundZ/cloudCells -TERMINATE THE LOOP WHEN HIT
+    ###   OUT: cgrid -[(X,Y,Z)] CHARGED CELLS IN ORDER OF GROWTH
+    ###====== 2) LOCATE CANDIDATE SITES AROUND CHARGE
+    ###====== 3) CALC POTENTIAL AT EACH SITE (Eqn. 10)
+    grid = FSLGGrid(cgrid, icList, eChargeList)
+
+    ts = 1
+    while ts <= TSTEPS:
+        gsite = grid.grow(uN)
+
+        ###===ITERATION COMPLETE
+        if verbose:
+            istr1 = ':::T-STEP: ' + str(ts) + '/' + str(TSTEPS) 
+            istr12 = ' | GROUNDZ: ' + str(groundZ) + ' | '
+            istr2 = 'CANDS: ' + str(len(grid.cPots)) + ' | '
+            istr3 = 'GSITE: ' + str(gsite)
+            print(istr1 + istr12 + istr2 + istr3)        
+        ts += 1
+
+        ###---EARLY TERMINATION FOR GROUND/CLOUD STRIKE
+        if groundZ is not None and gsite[2] == groundZ:
+            print('<<<<<<------EARLY TERMINATION DUE TO GROUNDSTRIKE')
+            break
+        if gsite in cloudCells:
+            print('<<<<<<------EARLY TERMINATION DUE TO CLOUDSTRIKE')
+            break
+    return grid.cgrid
+
+def growCells_KEEPFORREFERENCE(cgrid, icList, eChargeList, uN, TSTEPS, groundZ = None, cloudCells = set(), verbose = False):
+    ###---LIST BASED GROWTH LOOP, USED BY BENCH()
+    cgrid = list(cgrid)
+    ###====== 2) LOCATE CANDIDATE SITES AROUND CHARGE
+    cSites = getCandidateSites(cgrid, icList)
+    
+    ###====== 3) CALC POTENTIAL AT EACH SITE (Eqn. 10)
+    cSites = initialPointCharges(cgrid, cSites, eChargeList)
+    
+    ts = 1
+    while ts <= TSTEPS:
+        ###====== 1) SELECT NEW GROWTH SITE (Eqn. 12)
+        ###===GET PROBABILITIES AT CANDIDATE SITES
+        gProbs = getGrowthProbability(uN, cSites)
+        ###===CHOOSE NEW GROWTH SITE BASED ON PROBABILITIES
+        gSitei = weightedRandomChoice(gProbs)
+        gsite  = cSites[gSitei][0]
+
+        ###====== 2) ADD NEW POINT CHARGE AT GROWTH SITE
+        ###===ADD NEW GROWTH CELL TO GRID
+        cgrid.append(gsite)
+        ###===REMOVE NEW GROWTH CELL FROM CANDIDATE SITES
+        cSites.remove(cSites[gSitei])
+
+        ###====== 3) UPDATE POTENTIAL AT CANDIDATE SITES (Eqn. 11)
+        cSites = updatePointCharges(gsite, cSites, eChargeList)        
+
+        ###====== 4) ADD NEW CANDIDATES SURROUNDING GROWTH SITE
+        ###===GET CANDIDATE 'STENCIL'
+        ncSitesT = getCandidateSites([gsite], icList)
+        ###===REMOVE CANDIDATES ALREADY IN CANDIDATE LIST OR CHARGE GRID
+        ncSites = []
+        cSplit = splitList(cSites, 0)
+        for cn in ncSitesT:
+            if not cn in cSplit and \
+            not cn in cgrid:
+                ncSites.append((cn, 0))
+
+        ###====== 5) CALC POTENTIAL AT NEW CANDIDATE SITES (Eqn. 10)
+        ncSplit = splitList(ncSites, 0)        
+        ncSites = initialPointCharges(cgrid, ncSplit, eChargeList)
+
+        ###===ADD NEW CANDIDATE SITES TO CANDIDATE LIST
+        for ncs in ncSites:
+            cSites.append(ncs)
+
+        ###===ITERATION COMPLETE
+        if verbose:
+            istr1 = ':::T-STEP: ' + str(ts) + '/' + str(TSTEPS) 
+            istr12 = ' | GROUNDZ: ' + str(groundZ) + ' | '
+            istr2 = 'CANDS: ' + str(len(cSites)) + ' | '
+            istr3 = 'GSITE: ' + str(gsite)
+            print(istr1 + istr12 + istr2 + istr3)        
+        ts += 1
+        
+        ###---EARLY TERMINATION FOR GROUND/CLOUD STRIKE
+        if groundZ is not None and gsite[2] == groundZ:
+            print('<<<<<<------EARLY TERMINATION DUE TO GROUNDSTRIKE')
+            break
+        if gsite in cloudCells:
+            print('<<<<<<------EARLY TERMINATION DUE TO CLOUDSTRIKE')
+            break
+    return cgrid
+
 ######################################################################
 ############################# SETUP FXNS #############################
 ######################################################################
@@ -1003,69 +1194,12 @@ def FSLG():
         #writeArrayToCubes(icList, winmgr.GSCALE, winmgr.ORIGIN)
         #return 'THEEND'
         
-    ###====== 2) LOCATE CANDIDATE SITES AROUND CHARGE
-    cSites = getCandidateSites(cgrid, icList)
-    
-    ###====== 3) CALC POTENTIAL AT EACH SITE (Eqn. 10)
-    cSites = initialPointCharges(cgrid, cSites, eChargeList)
-    
-    ts = 1
-    while ts <= TSTEPS:
-        ###====== 1) SELECT NEW GROWTH SITE (Eqn. 12)
-        ###===GET PROBABILITIES AT CANDIDATE SITES
-        gProbs = getGrowthProbability(winmgr.BIGVAR, cSites)
-        ###===CHOOSE NEW GROWTH SITE BASED ON PROBABILITIES
-        gSitei = weightedRandomChoice(gProbs)
-        gsite  = cSites[gSitei][0]
-
-        ###====== 2) ADD NEW POINT CHARGE AT GROWTH SITE
-        ###===ADD NEW GROWTH CELL TO GRID
-        cgrid.append(gsite)
-        ###===REMOVE NEW GROWTH CELL FROM CANDIDATE SITES
-        cSites.remove(cSites[gSitei])
-
-        ###====== 3) UPDATE POTENTIAL AT CANDIDATE SITES (Eqn. 11)
-        cSites = updatePointCharges(gsite, cSites, eChargeList)        
-
-        ###====== 4) ADD NEW CANDIDATES SURROUNDING GROWTH SITE
-        ###===GET CANDIDATE 'STENCIL'
-        ncSitesT = getCandidateSites([gsite], icList)
-        ###===REMOVE CANDIDATES ALREADY IN CANDIDATE LIST OR CHARGE GRID
-        ncSites = []
-        cSplit = splitList(cSites, 0)
-        for cn in ncSitesT:
-            if not cn in cSplit and \
-            not cn in cgrid:
-                ncSites.append((cn, 0))
-
-        ###====== 5) CALC POTENTIAL AT NEW CANDIDATE SITES (Eqn. 10)
-        ncSplit = splitList(ncSites, 0)        
-        ncSites = initialPointCharges(cgrid, ncSplit, eChargeList)
-
-        ###===ADD NEW CANDIDATE SITES TO CANDIDATE LIST
-        for ncs in ncSites:
-            cSites.append(ncs)
-
-        ###===ITERATION COMPLETE
-        istr1 = ':::T-STEP: ' + str(ts) + '/' + str(TSTEPS) 
-        istr12 = ' | GROUNDZ: ' + str(winmgr.GROUNDZ) + ' | '
-        istr2 = 'CANDS: ' + str(len(cSites)) + ' | '
-        istr3 = 'GSITE: ' + str(gsite)
-        print(istr1 + istr12 + istr2 + istr3)        
-        ts += 1
-        
-        ###---EARLY TERMINATION FOR GROUND/CLOUD STRIKE
-        if winmgr.GROUNDBOOL:
-            if gsite[2] == winmgr.GROUNDZ:
-                ts = TSTEPS+1
-                print('<<<<<<------EARLY TERMINATION DUE TO GROUNDSTRIKE')
-                continue
-        if winmgr.CLOUDBOOL:
-            #if gsite in cloudList:
-            if gsite in splitListCo(eChargeList):
-                ts = TSTEPS+1
-                print('<<<<<<------EARLY TERMINATION DUE TO CLOUDSTRIKE')
-                continue            
+    ###====== 2-5) GROWTH LOOP
+    groundZ = None; cloudCells = set()
+    if winmgr.GROUNDBOOL: groundZ = winmgr.GROUNDZ
+    if winmgr.CLOUDBOOL: cloudCells = set(splitListCo(eChargeList))
+    cgrid = growCells(cgrid, icList, eChargeList, winmgr.BIGVAR, TSTEPS,
+        groundZ, cloudCells, verbose = True)
 
     tc2 = time.clock()
     tcRUN = tc2 - tc1
@@ -1243,31 +1377,26 @@ if __name__ == "__main__":
 ###########################
 ##### FXN BENCHMARKS ######
 ###########################
-def BENCH():
+def BENCH(tsteps = 1500, seed = 0, reference = True):
+###---TIME THE GROWTH LOOP WITH A FAKE GROUND PLANE, NO SCENE NEEDED
+###   RUN FROM THE PYTHON CONSOLE: object_laplace_lightning.BENCH()
     print('\n\n\n--->BEGIN BENCHMARK')
     bt0 = time.clock()
-    ###---MAKE A BIG LIST
-    tsize = 25
-    tlist = []
-    for x in range(tsize):
-        for y in range(tsize):
-            for z in range(tsize):
-                tlist.append((x,y,z))
-                tlist.append((x,y,z))
-
-    ###---FUNCTION TO TEST
-    bt1 = time.clock()
-
-    #ll = deDupe(tlist)
-    #ll = f5(tlist)
-    print('LENS - ', len(tlist), len(ll) )
-
-    bt2 = time.clock()
-    btRUNb = bt2 - bt1
-    btRUNa = bt1 - bt0
-    print('--->SETUP TIME    : ', btRUNa)
-    print('--->BENCHMARK TIME: ', btRUNb)
-    print('--->GRIDSIZE: ', tsize, ' - ', tsize*tsize*tsize)
+    groundZ = -200
+    eChargeList = fakeGroundChargePlane(groundZ, -250)
+    loops = [('FSLGGrid', growCells)]
+    if reference: loops.append(('LISTS', growCells_KEEPFORREFERENCE))
+    print('--->SETUP TIME    : ', time.clock() - bt0)
+
+    for name, loop in loops:
+        ###---FUNCTION TO TEST
+        random.seed(seed)
+        bt1 = time.clock()
+        cgrid = loop([(0, 0, 0)], [], eChargeList, 6.3, tsteps, groundZ)
+        bt2 = time.clock()
+        btRUNb = bt2 - bt1
+        print('--->' + name + ' CELLS: ', len(cgrid), ' LAST: ', cgrid[-1])
+        print('--->' + name + ' TIME : ', btRUNb, ' - ', len(cgrid) / btRUNb, 'CELLS/S')
     
 #BENCH()
 
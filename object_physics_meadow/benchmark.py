@@ -0,0 +1,79 @@
+### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# <pep8 compliant>
+
+# Timing comparison of the sample generators.
+# Run from the Blender python console or with
+#   blender -b --python-expr "from object_physics_meadow import benchmark; benchmark.run()"
+
+import time
+from math import *
+
+from object_physics_meadow.best_candidate import best_candidate_gen
+from object_physics_meadow.hierarchical_dart_throw import hierarchical_dart_throw_gen, hierarchical_dart_throw_array_gen
+from object_physics_meadow.tiled_sampling import tiled_dart_throw_gen
+from object_physics_meadow import progress
+
+def min_distance(samples, radius):
+    from object_physics_meadow.best_candidate import PointHashGrid
+    grid = PointHashGrid(radius)
+    dmin = float("inf")
+    for p in samples:
+        dmin = min(dmin, grid.nearest_dist(p[0], p[1]))
+        grid.insert(p)
+    return dmin
+
+def time_generator(name, gen, seed, num, radius):
+    start = time.time()
+    samples = [p[0:2] for p in gen(seed, num)]
+    duration = time.time() - start
+
+    print("{:<36} {:>8} samples {:>10.3f} s {:>10.1f} samples/s   min. distance {:.4f}".format(
+          name, len(samples), duration, len(samples) / duration if duration > 0.0 else 0.0,
+          min_distance(samples, radius)))
+    return samples, duration
+
+def compare_samplers(radius=1.0, size=100.0, seed=12345, levels=4, num=None):
+    # by default generate as many samples as the dart thrower manages,
+    # so both generators are timed at equal sample counts
+    xmin, xmax, ymin, ymax = 0.0, size, 0.0, size
+    if num is None:
+        num = int(size * size / (radius * radius))
+
+    show_progress_bar = progress.show_progress_bar
+    progress.show_progress_bar = False
+    try:
+        gen = hierarchical_dart_throw_gen(radius, levels, xmin, xmax, ymin, ymax)
+        samples, _ = time_generator("hierarchical dart throw", gen, seed, num, radius)
+
+        gen = hierarchical_dart_throw_array_gen(radius, levels, xmin, xmax, ymin, ymax)
+        time_generator("hierarchical dart throw (fast)", gen, seed, num, radius)
+
+        gen = tiled_dart_throw_gen(radius, levels, xmin, xmax, ymin, ymax)
+        time_generator("hierarchical dart throw (parallel)", gen, seed, num, radius)
+
+        gen = best_candidate_gen(radius, xmin, xmax, ymin, ymax)
+        time_generator("best candidate", gen, seed, len(samples), radius)
+    finally:
+        progress.show_progress_bar = show_progress_bar
+
+def run():
+    for size in (25.0, 50.0, 100.0, 200.0):
+        print("--- area {0} x {0}, radius 1.0 ---".format(size))
+        compare_samplers(radius=1.0, size=size)
@@ -20,51 +20,171 @@
 
 from math import *
 from mathutils import *
-from mathutils.kdtree import KDTree
 import random
 
+from object_physics_meadow.util import ifloor
+
 # simple uniform distribution for testing
 def uniform_2D(num, seed, xmin, xmax, ymin, ymax, radius):
     for i in range(num):
         yield (random.uniform(xmin, xmax), random.uniform(ymin, ymax))
 
+# Uniform hash grid for incremental nearest neighbor queries.
+# Cells are only allocated when points are inserted,
+# so inserting a point is O(1) and no rebuild is needed.
+class PointHashGrid():
+    def __init__(self, size):
+        self.size = size
+        self.invsize = 1.0 / size
+        self.cells = {}
+        self.points = []
+
+    def __len__(self):
+        return len(self.points)
+
+    def cell_index(self, x, y):
+        return ifloor(x * self.invsize), ifloor(y * self.invsize)
+
+    def insert(self, point):
+        point = (point[0], point[1])
+        self.points.append(point)
+        key = self.cell_index(point[0], point[1])
+        cell = self.cells.get(key, None)
+        if cell is None:
+            self.cells[key] = [point]
+        else:
+            cell.append(point)
+
+    # Distance to the nearest point, or inf if the grid is empty.
+    # The search stops early when a point closer than cutoff is found,
+    # the result is then only guaranteed to be <= cutoff.
+    def nearest_dist(self, x, y, cutoff=0.0):
+        if not self.points:
+            return float("inf")
+
+        cells = self.cells
+        size = self.size
+        cutoff2 = cutoff * cutoff
+        ci, cj = self.cell_index(x, y)
+        best2 = float("inf")
+        visited = 0
+        ring = 0
+        while True:
+            # rings up to ring - 1 have been searched,
+            # the remaining points are at least (ring - 1) * size away
+            bound = (ring - 1) * size
+            if ring > 0 and best2 <= bound * bound:
+                break
+            # sparse grid: scanning all points is cheaper than more rings
+            if visited > len(self.points):
+                for px, py in self.points:
+                    dx = px - x
+                    dy = py - y
+                    best2 = min(best2, dx*dx + dy*dy)
+                break
+
+            if ring == 0:
+                keys = ((ci, cj),)
+            else:
+                imin, imax = ci - ring, ci + ring
+                jmin, jmax = cj - ring, cj + ring
+                keys = [(i, jmin) for i in range(imin, imax + 1)]
+                keys += [(i, jmax) for i in range(imin, imax + 1)]
+                keys += [(imin, j) for j in range(jmin + 1, jmax)]
+                keys += [(imax, j) for j in range(jmin + 1, jmax)]
+            visited += len(keys)
+
+            for key in keys:
+                cell = cells.get(key, None)
+                if cell is None:
+                    continue
+                for px, py in cell:
+                    dx = px - x
+                    dy = py - y
+                    d2 = dx*dx + dy*dy
+                    if d2 < best2:
+                        best2 = d2
+                if best2 <= cutoff2:
+                    return sqrt(best2)
+
+            ring += 1
+
+        return sqrt(best2)
+
 # Mitchell's best candidate algorithm
 def best_candidate_gen(radius, xmin, xmax, ymin, ymax):
-    def best_candidate(k, tree):
+    num_candidates = 10
+
+    def best_candidate(k, grid):
+        if not grid:
+            return (random.uniform(xmin, xmax), random.uniform(ymin, ymax))
+
+        # generate the whole batch first, then evaluate against the grid
+        candidates = [(random.uniform(xmin, xmax), random.uniform(ymin, ymax)) for i in range(k)]
+
         best_dist = radius * 2.0
         best = None
-        
-        for i in range(k):
-            candidate = (random.uniform(xmin, xmax), random.uniform(ymin, ymax))
-            
-            npoint, nindex, ndist = tree.find((candidate[0], candidate[1], 0.0))
-            if not nindex:
-                return (random.uniform(xmin, xmax), random.uniform(ymin, ymax))
-            
+        for candidate in candidates:
+            # candidates closer than the current best can be rejected early
+            ndist = grid.nearest_dist(candidate[0], candidate[1], best_dist)
             if ndist > best_dist:
                 best_dist = ndist
                 best = candidate
-        
+
         return best
-    
-    num_candidates = 10
-    
+
     def gen(seed, num):
         random.seed(seed)
-        
-        data = []
-        tree = KDTree(0)
-        tree.balance()
+
+        grid = PointHashGrid(radius)
         for i in range(num):
-            best = best_candidate(num_candidates, tree)
+            best = best_candidate(num_candidates, grid)
             if not best:
                 break
             yield best
-            
-            data.append((best[0], best[1], 0.0))
-            tree = KDTree(len(data))
-            for i, p in enumerate(data):
-                tree.insert(p, i)
-            tree.balance()
+
+            grid.insert(best)
 
     return gen
+
+
+if __name__ == "__main__":
+
+    import unittest
+
+    class TestPointHashGrid(unittest.TestCase):
+
+        def brute(self, points, x, y):
+            return min((sqrt((px - x)**2 + (py - y)**2) for px, py in points), default=float("inf"))
+
+        def test_nearest_dist(self):
+            rng = random.Random(0)
+            for size, num in ((0.1, 50), (0.1, 2000), (1.0, 20), (0.25, 500)):
+                grid = PointHashGrid(size)
+                points = [(rng.uniform(-5, 5), rng.uniform(-5, 5)) for i in range(num)]
+                for p in points:
+                    grid.insert(p)
+                for i in range(2000):
+                    x, y = rng.uniform(-6, 6), rng.uniform(-6, 6)
+                    self.assertAlmostEqual(grid.nearest_dist(x, y), self.brute(points, x, y))
+
+        def test_cutoff(self):
+            rng = random.Random(1)
+            grid = PointHashGrid(0.2)
+            points = [(rng.uniform(0, 4), rng.uniform(0, 4)) for i in range(300)]
+            for p in points:
+                grid.insert(p)
+            for i in range(2000):
+                x, y = rng.uniform(-1, 5), rng.uniform(-1, 5)
+                cutoff = rng.uniform(0, 0.5)
+                d = self.brute(points, x, y)
+                dist = grid.nearest_dist(x, y, cutoff)
+                if d > cutoff:
+                    self.assertAlmostEqual(dist, d)
+                else:
+                    self.assertLessEqual(dist, cutoff)
+
+        def test_empty(self):
+            self.assertEqual(PointHashGrid(1.0).nearest_dist(0.0, 0.0), float("inf"))
+
+    unittest.main()
@@ -22,14 +22,13 @@ import bpy
 from bpy_extras import object_utils
 from math import *
 from mathutils import *
-from mathutils.kdtree import KDTree
-from mathutils.interpolate import poly_3d_calc
 from itertools import accumulate
 import random
+import numpy as np
 
 from object_physics_meadow import settings as _settings
 from object_physics_meadow import duplimesh
-from object_physics_meadow.duplimesh import project_on_ground
+from object_physics_meadow.duplimesh import project_on_ground, GroundProjector, matrix_to_array, transform_points
 from object_physics_meadow.util import *
 from object_physics_meadow import progress
 
@@ -137,6 +136,85 @@ def assign_blob(blobtree, loc, nor):
             return index
     return -1
 
+# assign samples to blobs in bulk, same distance weighting as assign_blob
+# blobco: (B, 2) blob locations, samples: (N, 2) sample locations
+def assign_blobs(blobco, samples, rng, num_nearest=4, chunk_size=65536):
+    blobco = np.asarray(blobco, dtype=np.float64).reshape(-1, 2)
+    samples = np.asarray(samples, dtype=np.float64).reshape(-1, 2)
+    nblobs = len(blobco)
+    num = len(samples)
+    if nblobs == 0 or num == 0:
+        return np.full(num, -1, dtype=np.int64)
+    k = min(num_nearest, nblobs)
+
+    # uniform grid with about one blob per cell,
+    # the k nearest blobs are searched in the surrounding 5x5 cells
+    ring = 2
+    bmin = blobco.min(axis=0)
+    extent = np.maximum(blobco.max(axis=0) - bmin, 1.0e-6)
+    cellsize = max(sqrt(extent[0] * extent[1] / nblobs), extent.max() / nblobs, 1.0e-6)
+    ni = int(extent[0] / cellsize) + 1
+    nj = int(extent[1] / cellsize) + 1
+    bcell = np.minimum(((blobco - bmin) / cellsize).astype(np.int64), (ni - 1, nj - 1))
+    bkey = bcell[:, 0] * nj + bcell[:, 1]
+    order = np.argsort(bkey, kind='mergesort')
+    cell_start = np.concatenate(([0], np.cumsum(np.bincount(bkey, minlength=ni * nj))))
+    maxcount = int(np.diff(cell_start).max())
+
+    offsets = [(di, dj) for di in range(-ring, ring + 1) for dj in range(-ring, ring + 1)]
+
+    nearest = np.empty((num, k), dtype=np.int64)
+    nearest_dist = np.empty((num, k))
+    for cstart in range(0, num, chunk_size):
+        chunk = samples[cstart:cstart + chunk_size]
+        n = len(chunk)
+        scell = np.floor((chunk - bmin) / cellsize).astype(np.int64)
+
+        cand = np.full((n, len(offsets) * maxcount), -1, dtype=np.int64)
+        col = 0
+        for di, dj in offsets:
+            i = scell[:, 0] + di
+            j = scell[:, 1] + dj
+            valid_cell = (i >= 0) & (i < ni) & (j >= 0) & (j < nj)
+            key = np.where(valid_cell, i * nj + j, 0)
+            start = cell_start[key]
+            end = np.where(valid_cell, cell_start[key + 1], start)
+            for c in range(maxcount):
+                valid = start + c < end
+                cand[:, col] = np.where(valid, order[np.minimum(start + c, nblobs - 1)], -1)
+                col += 1
+
+        d = blobco[np.maximum(cand, 0)] - chunk[:, None, :]
+        dist = np.where(cand >= 0, np.sqrt((d * d).sum(axis=2)), np.inf)
+        part = np.argpartition(dist, k - 1, axis=1)[:, :k]
+        rows = np.arange(n)[:, None]
+        ndist = dist[rows, part]
+        sort = np.argsort(ndist, axis=1)
+        nearest[cstart:cstart + n] = cand[rows, part][rows, sort]
+        nearest_dist[cstart:cstart + n] = ndist[rows, sort]
+
+    # blobs outside the searched cells are at least ring * cellsize away,
+    # do an exhaustive search if the k-th nearest blob could be further away
+    uncertain = np.nonzero(nearest_dist[:, k - 1] > ring * cellsize)[0]
+    for i in uncertain:
+        dist = np.sqrt(((blobco - samples[i]) ** 2).sum(axis=1))
+        idx = np.argsort(dist)[:k]
+        nearest[i] = idx
+        nearest_dist[i] = dist[idx]
+
+    if k == 1:
+        return nearest[:, 0].copy()
+
+    totdist = nearest_dist.sum(axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        norm = 1.0 / (float(k - 1) * totdist)
+        accum = np.cumsum(((totdist[:, None] - nearest_dist) * norm[:, None]) ** 8, axis=1)
+    u = rng.uniform(0.0, 1.0, size=num) * accum[:, -1]
+    chosen = (u[:, None] < accum)
+    result = np.where(chosen.any(axis=1), nearest[np.arange(num), chosen.argmax(axis=1)], -1)
+    result[~(totdist > 0.0)] = -1
+    return result
+
 def make_blob_object(context, index, loc, samples, display_radius):
     settings = _settings.get(context)
     
@@ -180,18 +258,128 @@ class Blob():
         self.poly_index = state[2]
         self.samples = [(Vector(sloc), Vector(snor), spoly, sverts, sweights) for sloc, snor, spoly, sverts, sweights in state[3]]
 
+# Blobs are stored in the ID datablock as a group of flat columns:
+#   blob_valid, blob_poly, blob_loc, blob_nor: one entry per blob
+#   blob_start: offsets of each blob's samples (num_blobs + 1 entries)
+#   sample_poly, sample_loc, sample_nor: one entry per sample
+#   sample_vert_start: offsets of each sample's verts (num_samples + 1 entries)
+#   sample_verts, sample_weights: poly vertices and weights of samples
+# Float columns are packed as float32 bits into int properties,
+# every column gets a trailing 0 so no property is empty.
+_blob_storage_version = 1
+
+def _pack_ints(values):
+    values = np.asarray(values, dtype=np.int32).ravel()
+    return np.append(values, 0).tolist()
+
+def _pack_floats(values):
+    values = np.asarray(values, dtype=np.float32).ravel()
+    return np.append(values.view(np.int32), 0).tolist()
+
+def _unpack_ints(values):
+    return np.array(values, dtype=np.int32)
+
+def _unpack_floats(values):
+    return np.array(values, dtype=np.int32).view(np.float32)
+
 # store blobs list in ID datablock as customdata
 def blobs_to_customprops(data, blobs):
-    import pickle, array
-    B = pickle.dumps(blobs)
-    pad = (4 - len(B)) % 4
-    A = array.array('i', B + b'\x00' * pad)
-    data['blobs'] = A.tolist()
+    blob_valid = [blob is not None for blob in blobs]
+    blob_poly = [blob.poly_index if blob else -1 for blob in blobs]
+    blob_loc = [blob.loc[:] if blob else (0.0, 0.0, 0.0) for blob in blobs]
+    blob_nor = [blob.nor[:] if blob else (0.0, 0.0, 1.0) for blob in blobs]
+    blob_start = [0]
+    sample_poly = []
+    sample_loc = []
+    sample_nor = []
+    sample_vert_start = [0]
+    sample_verts = []
+    sample_weights = []
+    for blob in blobs:
+        if blob:
+            for sloc, snor, spoly, sverts, sweights in blob.samples:
+                sample_loc.append(sloc[:])
+                sample_nor.append(snor[:])
+                sample_poly.append(spoly)
+                sample_verts.extend(sverts)
+                sample_weights.extend(sweights)
+                sample_vert_start.append(len(sample_verts))
+        blob_start.append(len(sample_poly))
+
+    data['blobs'] = {
+        "version" : _blob_storage_version,
+        "blob_valid" : _pack_ints(blob_valid),
+        "blob_poly" : _pack_ints(blob_poly),
+        "blob_loc" : _pack_floats(blob_loc),
+        "blob_nor" : _pack_floats(blob_nor),
+        "blob_start" : _pack_ints(blob_start),
+        "sample_poly" : _pack_ints(sample_poly),
+        "sample_loc" : _pack_floats(sample_loc),
+        "sample_nor" : _pack_floats(sample_nor),
+        "sample_vert_start" : _pack_ints(sample_vert_start),
+        "sample_verts" : _pack_ints(sample_verts),
+        "sample_weights" : _pack_floats(sample_weights),
+        }
+
+# List-like access to stored blobs, samples of a blob are only unpacked
+# from the ID properties when the blob is accessed
+class BlobStorage():
+    def __init__(self, props):
+        self.props = props
+        # small per-blob columns are loaded right away
+        self.valid = _unpack_ints(props["blob_valid"][:-1]).astype(bool)
+        self.poly = _unpack_ints(props["blob_poly"][:-1])
+        self.loc = _unpack_floats(props["blob_loc"][:-1]).reshape(-1, 3)
+        self.nor = _unpack_floats(props["blob_nor"][:-1]).reshape(-1, 3)
+        self.start = _unpack_ints(props["blob_start"][:-1])
+        self.cache = {}
+
+    def __len__(self):
+        return len(self.valid)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not self.valid[index]:
+            return None
+        blob = self.cache.get(index, None)
+        if blob is None:
+            blob = self.load_blob(index)
+            self.cache[index] = blob
+        return blob
+
+    def load_blob(self, index):
+        props = self.props
+        blob = Blob(Vector(self.loc[index]), Vector(self.nor[index]), int(self.poly[index]))
+
+        s0, s1 = int(self.start[index]), int(self.start[index + 1])
+        if s1 > s0:
+            sloc = _unpack_floats(props["sample_loc"][3*s0:3*s1]).reshape(-1, 3)
+            snor = _unpack_floats(props["sample_nor"][3*s0:3*s1]).reshape(-1, 3)
+            spoly = props["sample_poly"][s0:s1]
+            vstart = props["sample_vert_start"][s0:s1 + 1]
+            v0, v1 = vstart[0], vstart[-1]
+            sverts = props["sample_verts"][v0:v1]
+            sweights = _unpack_floats(props["sample_weights"][v0:v1]).tolist()
+            for i in range(s1 - s0):
+                a, b = vstart[i] - v0, vstart[i + 1] - v0
+                blob.add_sample(Vector(sloc[i]), Vector(snor[i]), spoly[i], list(sverts[a:b]), sweights[a:b])
+
+        return blob
 
 # load blobs list from ID datablock customdata
 def blobs_from_customprops(data):
+    props = data['blobs']
+    if hasattr(props, "keys"):
+        return BlobStorage(props)
+
+    # legacy storage: pickled blob list as int array
     import pickle, array
-    A = array.array('i', data['blobs'])
+    A = array.array('i', props)
     blobs = pickle.loads(A.tobytes())
     return blobs
 
@@ -241,48 +429,45 @@ def make_blob_visualizer(context, groundob, blobs, display_radius, hide, hide_re
 def make_blobs(context, gridob, groundob, samples2D, display_radius):
     blob_group_clear(context)
     blobs = []
-    
-    imat = groundob.matrix_world.inverted()
-
-    blobtree = KDTree(len(gridob.data.vertices))
-    for i, v in enumerate(gridob.data.vertices):
-        co = gridob.matrix_world * v.co
-        # note: only using 2D coordinates, otherwise weights get distorted by z offset
-        blobtree.insert((co[0], co[1], 0.0), i)
-    blobtree.balance()
-    
-    for v in gridob.data.vertices:
-        co = gridob.matrix_world * v.co
-        ok, loc, nor, poly_index = project_on_ground(groundob, co)
-        blobs.append(Blob(loc, nor, poly_index) if ok else None)
-    
+
+    projector = GroundProjector(groundob)
+    rng = np.random.RandomState(groundob.meadow.seed)
+
+    gridmesh = gridob.data
+    gridco = np.empty(len(gridmesh.vertices) * 3, dtype=np.float64)
+    gridmesh.vertices.foreach_get("co", gridco)
+    gridco = transform_points(matrix_to_array(gridob.matrix_world), gridco.reshape(-1, 3))
+
+    ok, loc, nor, poly_index, _, _ = projector.project(gridco)
+    for i in range(len(gridco)):
+        blobs.append(Blob(Vector(loc[i]), Vector(nor[i]), int(poly_index[i])) if ok[i] else None)
+
     with progress.ProgressContext("Grouping Samples", 0, len(samples2D)):
-        mpolys = groundob.data.polygons
-        mverts = groundob.data.vertices
-        for xy in samples2D:
+        samples = np.array([xy[0:2] for xy in samples2D], dtype=np.float64).reshape(-1, 2)
+
+        # note: use only 2D coordinates for weighting, z component should be 0
+        blob_index = assign_blobs(gridco[:, 0:2], samples, rng)
+
+        # project samples onto the ground object
+        sok, sloc, snor, spoly, scorners, sweights = projector.project(np.column_stack((samples, np.zeros(len(samples)))))
+
+        poly_verts = [tuple(poly.vertices) for poly in groundob.data.polygons]
+        valid = sok & (blob_index >= 0)
+        for i in np.nonzero(valid)[0]:
             progress.progress_add(1)
 
-            # note: use only 2D coordinates for weighting, z component should be 0
-            index = assign_blob(blobtree, (xy[0], xy[1], 0.0), nor)
-            if index < 0:
-                continue
-            blob = blobs[index]
+            blob = blobs[blob_index[i]]
             if blob is None:
                 continue
-            
-            # project samples onto the ground object
-            ok, sloc, snor, spoly = project_on_ground(groundob, xy[0:2]+(0,))
-            if not ok:
-                continue
-            
-            # calculate barycentric vertex weights on the poly
-            poly = mpolys[spoly]
-            sverts = list(poly.vertices)
-            # note: coordinate space has to be consistent, use sloc in object space
-            sweights = poly_3d_calc(tuple(mverts[i].co for i in sverts), imat * sloc)
 
-            blob.add_sample(sloc, snor, spoly, sverts, sweights)
-    
+            # barycentric vertex weights of the hit triangle on the poly
+            sverts = list(poly_verts[spoly[i]])
+            weights = [0.0] * len(sverts)
+            for corner, w in zip(scorners[i], sweights[i]):
+                weights[corner] = float(w)
+
+            blob.add_sample(Vector(sloc[i]), Vector(snor[i]), int(spoly[i]), sverts, weights)
+
     blobs_to_customprops(groundob.meadow, blobs)
 
     make_blob_visualizer(context, groundob, blobs, display_radius, hide=True)
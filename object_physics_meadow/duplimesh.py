@@ -21,6 +21,7 @@
 import bpy, sys
 from math import *
 from mathutils import *
+import numpy as np
 
 def project_on_ground(groundob, co):
     groundmat4 = groundob.matrix_world
@@ -41,6 +42,157 @@ def project_on_ground(groundob, co):
         return False, co, (0.0, 0.0, 1.0), -1
 
 
+def matrix_to_array(mat):
+    return np.array([tuple(row) for row in mat], dtype=np.float64)
+
+def transform_points(mat, co):
+    return co.dot(mat[0:3, 0:3].T) + mat[0:3, 3]
+
+# Projects many points onto the ground at once, along the local Z axis
+# of the ground object (same as project_on_ground).
+# The ground polygons are fan-triangulated and binned into a 2D grid
+# over the object space XY plane, so all points can be tested against
+# their candidate triangles in a few array operations.
+class GroundProjector():
+    def __init__(self, groundob):
+        mesh = groundob.data
+        self.mat = matrix_to_array(groundob.matrix_world)
+        self.imat = matrix_to_array(groundob.matrix_world.inverted())
+
+        nverts = len(mesh.vertices)
+        npolys = len(mesh.polygons)
+        nloops = len(mesh.loops)
+
+        co = np.empty(nverts * 3, dtype=np.float64)
+        mesh.vertices.foreach_get("co", co)
+        self.verts = co.reshape(-1, 3)
+
+        loop_verts = np.empty(nloops, dtype=np.int64)
+        mesh.loops.foreach_get("vertex_index", loop_verts)
+        loop_start = np.empty(npolys, dtype=np.int64)
+        mesh.polygons.foreach_get("loop_start", loop_start)
+        loop_total = np.empty(npolys, dtype=np.int64)
+        mesh.polygons.foreach_get("loop_total", loop_total)
+        poly_nor = np.empty(npolys * 3, dtype=np.float64)
+        mesh.polygons.foreach_get("normal", poly_nor)
+        self.poly_normals = poly_nor.reshape(-1, 3)
+        self.loop_start = loop_start
+
+        # fan triangulation, corners are stored as loop indices
+        ntris = np.maximum(loop_total - 2, 0)
+        self.tri_poly = np.repeat(np.arange(npolys), ntris)
+        local = np.arange(len(self.tri_poly)) - np.repeat(np.cumsum(ntris) - ntris, ntris)
+        first = loop_start[self.tri_poly]
+        self.tri_loops = np.column_stack((first, first + local + 1, first + local + 2))
+        self.tris = loop_verts[self.tri_loops]
+
+        self.build_grid()
+
+    def build_grid(self):
+        tris = self.tris
+        ntris = len(tris)
+        txy = self.verts[tris][:, :, 0:2]
+        tmin = txy.min(axis=1)
+        tmax = txy.max(axis=1)
+
+        if ntris == 0:
+            self.gridmin = np.zeros(2)
+            self.cellsize = 1.0
+            self.ni = self.nj = 1
+            self.cell_start = np.zeros(2, dtype=np.int64)
+            self.cell_tris = np.empty(0, dtype=np.int64)
+            return
+
+        gridmin = tmin.min(axis=0)
+        gridmax = tmax.max(axis=0)
+        extent = np.maximum(gridmax - gridmin, 1.0e-6)
+        # about one triangle per cell
+        cellsize = max(sqrt(extent[0] * extent[1] / ntris), 1.0e-6)
+        ni = int(extent[0] / cellsize) + 1
+        nj = int(extent[1] / cellsize) + 1
+
+        i0 = np.clip(((tmin[:, 0] - gridmin[0]) / cellsize).astype(np.int64), 0, ni - 1)
+        i1 = np.clip(((tmax[:, 0] - gridmin[0]) / cellsize).astype(np.int64), 0, ni - 1)
+        j0 = np.clip(((tmin[:, 1] - gridmin[1]) / cellsize).astype(np.int64), 0, nj - 1)
+        j1 = np.clip(((tmax[:, 1] - gridmin[1]) / cellsize).astype(np.int64), 0, nj - 1)
+
+        # one entry for every cell overlapped by a triangle bounding box
+        wi = i1 - i0 + 1
+        counts = wi * (j1 - j0 + 1)
+        entry_tri = np.repeat(np.arange(ntris), counts)
+        local = np.arange(len(entry_tri)) - np.repeat(np.cumsum(counts) - counts, counts)
+        entry_cell = (i0[entry_tri] + local % wi[entry_tri]) * nj + (j0[entry_tri] + local // wi[entry_tri])
+
+        order = np.argsort(entry_cell, kind='mergesort')
+        self.cell_tris = entry_tri[order]
+        self.cell_start = np.concatenate(([0], np.cumsum(np.bincount(entry_cell, minlength=ni * nj))))
+
+        self.gridmin = gridmin
+        self.cellsize = cellsize
+        self.ni = ni
+        self.nj = nj
+
+    # co: (N, 3) world space locations
+    # returns hit mask, world space locations and normals, polygon indices,
+    # and for each hit the 3 triangle corners (indices into the polygon vertices) and barycentric weights
+    def project(self, co):
+        co = np.asarray(co, dtype=np.float64).reshape(-1, 3)
+        num = len(co)
+        obco = transform_points(self.imat, co)
+        px = obco[:, 0]
+        py = obco[:, 1]
+
+        ci = np.floor((px - self.gridmin[0]) / self.cellsize).astype(np.int64)
+        cj = np.floor((py - self.gridmin[1]) / self.cellsize).astype(np.int64)
+        inside = (ci >= 0) & (ci < self.ni) & (cj >= 0) & (cj < self.nj)
+        cell = np.where(inside, ci * self.nj + cj, 0)
+        start = self.cell_start[cell]
+        end = np.where(inside, self.cell_start[cell + 1], start)
+
+        hit_tri = np.full(num, -1, dtype=np.int64)
+        hit_z = np.full(num, -np.inf)
+        hit_bary = np.zeros((num, 3))
+
+        verts = self.verts
+        eps = 1.0e-9
+        maxcount = int((end - start).max()) if num > 0 else 0
+        for c in range(maxcount):
+            valid = start + c < end
+            t = self.cell_tris[np.minimum(start + c, len(self.cell_tris) - 1)]
+            a = verts[self.tris[t, 0]]
+            b = verts[self.tris[t, 1]]
+            d = verts[self.tris[t, 2]]
+
+            v0x = b[:, 0] - a[:, 0]
+            v0y = b[:, 1] - a[:, 1]
+            v1x = d[:, 0] - a[:, 0]
+            v1y = d[:, 1] - a[:, 1]
+            v2x = px - a[:, 0]
+            v2y = py - a[:, 1]
+            den = v0x * v1y - v1x * v0y
+            with np.errstate(divide='ignore', invalid='ignore'):
+                u = (v2x * v1y - v1x * v2y) / den
+                v = (v0x * v2y - v2x * v0y) / den
+            w = 1.0 - u - v
+            z = w * a[:, 2] + u * b[:, 2] + v * d[:, 2]
+
+            # rays come from above, the highest triangle is hit first
+            better = valid & (den != 0.0) & (u >= -eps) & (v >= -eps) & (w >= -eps) & (z > hit_z)
+            hit_tri[better] = t[better]
+            hit_z[better] = z[better]
+            hit_bary[better] = np.column_stack((w, u, v))[better]
+
+        ok = hit_tri >= 0
+        poly = np.where(ok, self.tri_poly[np.maximum(hit_tri, 0)], -1)
+
+        hit_obco = np.column_stack((px, py, hit_z))
+        loc = np.where(ok[:, None], transform_points(self.mat, np.where(ok[:, None], hit_obco, 0.0)), co)
+        nor = np.where(ok[:, None], self.poly_normals[np.maximum(poly, 0)].dot(self.mat[0:3, 0:3].T), (0.0, 0.0, 1.0))
+        corners = self.tri_loops[np.maximum(hit_tri, 0)] - self.loop_start[np.maximum(poly, 0)][:, None]
+
+        return ok, loc, nor, poly, corners, hit_bary
+
+
 def make_dupli_mesh(name, obmat, samples, scale):
     scalemat = Matrix()
     scalemat[0][0] = scalemat[1][1] = scalemat[2][2] = scale
@@ -21,19 +21,22 @@
 import bpy
 from mathutils import *
 
-from object_physics_meadow.pointcache import OCacheFrame, ParticleTimes, BoidData
+import numpy as np
+
+from object_physics_meadow.pointcache import OCacheFrame, _dtype_boid
 
 def write_cache(cachedir, filename, locations):
     totpoint = len(locations)
-    indices = [i for i in range(totpoint)]
-    velocities = [(0.0, 0.0, 0.0) for i in range(totpoint)]
+    indices = np.arange(totpoint, dtype=np.uint32)
+    velocities = np.zeros((totpoint, 3), dtype=np.float32)
     q = Quaternion()
     q.identity()
-    rotations = [q[:] for i in range(totpoint)]
-    angvels = [(0.0, 0.0, 0.0) for i in range(totpoint)]
-    sizes = [1.0 for i in range(totpoint)]
-    times = [ParticleTimes(1.0, 1000000.0, 1000001.0) for i in range(totpoint)]
-    boids = [BoidData(1.0, (0.0, 0.0, 0.0), 0, 0) for i in range(totpoint)]
+    rotations = np.tile(np.array(q[:], dtype=np.float32), (totpoint, 1))
+    angvels = np.zeros((totpoint, 3), dtype=np.float32)
+    sizes = np.ones(totpoint, dtype=np.float32)
+    times = np.tile(np.array((1.0, 1000000.0, 1000001.0), dtype=np.float32), (totpoint, 1))
+    boids = np.zeros(totpoint, dtype=_dtype_boid)
+    boids['health'] = 1.0
     
     cache = OCacheFrame(filename, 'PARTICLES', totpoint)
     cache.set_data('INDEX', indices)
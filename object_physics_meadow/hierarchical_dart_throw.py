@@ -283,3 +283,231 @@ def hierarchical_dart_throw_gen(radius, max_levels, xmin, xmax, ymin, ymax):
                     break
 
     return gen
+
+#-----------------------------------------------------------------------
+# Array-based implementation
+#
+# Same algorithm as above, but cells, points and distance tests are stored
+# in numpy arrays and processed in batches of cells from the same level.
+# Uses its own random number generator, so results differ from the
+# reference implementation above for the same seed.
+
+import numpy as np
+
+class GridLevelArray():
+    __slots__ = ('index', 'size', 'weight', 'cells', 'count')
+
+    def __init__(self, index, size):
+        self.index = index
+        self.size = size
+        self.weight = size * size # 2D
+        self.cells = np.empty((1024, 2), dtype=np.int64)
+        self.count = 0
+
+    def set_active_cells(self, imin, imax, jmin, jmax):
+        jj, ii = np.mgrid[jmin:jmax, imin:imax]
+        self.cells = np.column_stack((ii.ravel(), jj.ravel())).astype(np.int64)
+        self.count = len(self.cells)
+
+    def activate(self, cells):
+        tot = self.count + len(cells)
+        if tot > len(self.cells):
+            grown = np.empty((max(tot, 2 * len(self.cells)), 2), dtype=np.int64)
+            grown[:self.count] = self.cells[:self.count]
+            self.cells = grown
+        self.cells[self.count:tot] = cells
+        self.count = tot
+
+    # remove a random batch of distinct cells by swapping in cells from the end
+    def pop_batch(self, rng, batch_size):
+        n = self.count
+        if batch_size >= n:
+            indices = np.arange(n)
+        else:
+            indices = np.unique(rng.randint(0, n, size=batch_size))
+        k = len(indices)
+        batch = self.cells[indices].copy()
+
+        holes = indices[indices < n - k]
+        # cells at the end which are not removed themselves
+        keep = np.ones(k, dtype=bool)
+        keep[indices[indices >= n - k] - (n - k)] = False
+        tail = np.arange(n - k, n)[keep]
+        self.cells[holes] = self.cells[tail]
+        self.count = n - k
+
+        return batch
+
+def pop_level(rng, levels):
+    weights = np.array([level.count * level.weight for level in levels])
+    totweight = weights.sum()
+    if totweight <= 0.0:
+        return None
+    u = rng.uniform(0.0, totweight)
+    for level, w in zip(levels, weights):
+        if u < w:
+            return level
+        u -= w
+    # rounding errors
+    return max(levels, key=lambda level: level.count)
+
+class PointGridArray():
+    # points with distance >= radius in a radius-sized cell (half-open),
+    # at most 3 are possible
+    capacity = 4
+
+    # offsets of the 3x3 neighborhood
+    offsets = np.array([(da, db) for da in (-1, 0, 1) for db in (-1, 0, 1)], dtype=np.int64)
+
+    def __init__(self, radius, gridmin, gridmax):
+        size = radius
+        self.size = size
+        self.invsize = 1.0 / size
+
+        # two border cells: points within radius outside the bounds
+        # (e.g. from neighboring tiles) keep a full 3x3 neighborhood
+        self.amin = ifloor(gridmin[0] / size) - 2
+        self.bmin = ifloor(gridmin[1] / size) - 2
+        self.na = ifloor(gridmax[0] / size) + 3 - self.amin
+        self.nb = ifloor(gridmax[1] / size) + 3 - self.bmin
+
+        self.points = np.full((self.na * self.nb, self.capacity, 2), np.nan)
+        self.counts = np.zeros(self.na * self.nb, dtype=np.int64)
+
+    def cell_index(self, co):
+        a = np.floor(co[:, 0] * self.invsize).astype(np.int64) - self.amin
+        b = np.floor(co[:, 1] * self.invsize).astype(np.int64) - self.bmin
+        np.clip(a, 1, self.na - 2, out=a)
+        np.clip(b, 1, self.nb - 2, out=b)
+        return a * self.nb + b
+
+    # (N, 9 * capacity, 2) array of points in the 3x3 neighborhood, unused slots are NaN
+    def neighbors(self, co):
+        keys = self.cell_index(co)
+        nkeys = keys[:, None] + self.offsets[:, 0] * self.nb + self.offsets[:, 1]
+        return self.points[nkeys].reshape(len(co), len(self.offsets) * self.capacity, 2)
+
+    def insert(self, co):
+        keys = self.cell_index(co)
+        # slot of each point, counting earlier points of the batch in the same cell
+        order = np.argsort(keys, kind='mergesort')
+        skeys = keys[order]
+        first = np.searchsorted(skeys, skeys, side='left')
+        rank = np.empty(len(keys), dtype=np.int64)
+        rank[order] = np.arange(len(keys)) - first
+
+        slots = self.counts[keys] + rank
+        self.points[keys, slots] = co
+        np.add.at(self.counts, keys, 1)
+
+def is_covered_array(radius2, b0, pgrid, centers):
+    npoints = pgrid.neighbors(centers)
+    # distance test according to section 3.2 of the paper
+    dx = np.abs(npoints[:, :, 0] - centers[:, 0, None]) + 0.5*b0
+    dy = np.abs(npoints[:, :, 1] - centers[:, 1, None]) + 0.5*b0
+    # NaN entries compare False
+    return (dx*dx + dy*dy <= radius2).any(axis=1)
+
+def test_disk_array(radius2, pgrid, points):
+    npoints = pgrid.neighbors(points)
+    dx = npoints[:, :, 0] - points[:, 0, None]
+    dy = npoints[:, :, 1] - points[:, 1, None]
+    return ~(dx*dx + dy*dy < radius2).any(axis=1)
+
+# reject points of a batch conflicting with an earlier point of the same batch
+def test_disk_batch(radius2, pgrid, points):
+    num = len(points)
+    if num < 2:
+        return np.ones(num, dtype=bool)
+
+    # sort the batch by grid cell, so points in neighboring cells
+    # can be found by binary search
+    keys = pgrid.cell_index(points)
+    order = np.argsort(keys, kind='mergesort')
+    skeys = keys[order]
+
+    nkeys = keys[:, None] + pgrid.offsets[:, 0] * pgrid.nb + pgrid.offsets[:, 1]
+    lo = np.searchsorted(skeys, nkeys, side='left')
+    hi = np.searchsorted(skeys, nkeys, side='right')
+
+    ok = np.ones(num, dtype=bool)
+    for c in range(int((hi - lo).max())):
+        valid = lo + c < hi
+        other = order[np.minimum(lo + c, num - 1)]
+        dx = points[other, 0] - points[:, 0, None]
+        dy = points[other, 1] - points[:, 1, None]
+        conflict = valid & (other < np.arange(num)[:, None]) & (dx*dx + dy*dy < radius2)
+        ok &= ~conflict.any(axis=1)
+    return ok
+
+def split_cells_array(radius2, b0, pgrid, child_level, cells):
+    s = child_level.size
+    children = np.concatenate([cells * 2 + (ci, cj) for cj in (0, 1) for ci in (0, 1)])
+    centers = (children + 0.5) * s
+    covered = is_covered_array(radius2, b0, pgrid, centers)
+    child_level.activate(children[~covered])
+
+# Generates batches of sample points as (N, 2) arrays.
+# Optional fixed points are taken into account for the disk test,
+# but are not returned themselves.
+# clip is an optional (xmin, xmax, ymin, ymax) rectangle, points outside of it are
+# rejected before they are inserted, so they don't block candidates inside it
+def dart_throw_array_batches(radius, max_levels, gridmin, gridmax, rng, num, fixed_points=None, batch_size=1024, clip=None):
+    radius2 = radius * radius
+    b0, imin, imax, jmin, jmax = base_grid_size(radius, gridmin, gridmax)
+
+    base_level = GridLevelArray(0, b0)
+    levels = [base_level] + [GridLevelArray(i, base_level.size / (2**i)) for i in range(1, max_levels)]
+
+    base_level.set_active_cells(imin, imax, jmin, jmax)
+    pgrid = PointGridArray(radius, gridmin, gridmax)
+    if fixed_points is not None and len(fixed_points) > 0:
+        pgrid.insert(np.asarray(fixed_points, dtype=np.float64))
+
+    tot = 0
+    while tot < num:
+        level = pop_level(rng, levels)
+        if level is None:
+            break
+
+        # smaller batches when few cells are left, to limit conflicts inside the batch
+        cells = level.pop_batch(rng, min(batch_size, num - tot, max(level.count // 8, 1)))
+        tot += len(cells)
+        progress.progress_add(len(cells))
+
+        s = level.size
+        if clip is not None:
+            # cells entirely outside of the clip rectangle can't yield any points
+            lo = cells * s
+            hi = lo + s
+            cells = cells[(hi[:, 0] > clip[0]) & (lo[:, 0] < clip[1]) & (hi[:, 1] > clip[2]) & (lo[:, 1] < clip[3])]
+        centers = (cells + 0.5) * s
+        uncovered = ~is_covered_array(radius2, b0, pgrid, centers)
+        cells = cells[uncovered]
+
+        points = (cells + rng.uniform(0.0, 1.0, size=(len(cells), 2))) * s
+        ok = test_disk_array(radius2, pgrid, points)
+        if clip is not None:
+            ok &= (points[:, 0] >= clip[0]) & (points[:, 0] < clip[1]) & (points[:, 1] >= clip[2]) & (points[:, 1] < clip[3])
+        ok[ok] = test_disk_batch(radius2, pgrid, points[ok])
+
+        accepted = points[ok]
+        pgrid.insert(accepted)
+        yield accepted
+
+        if level.index < max_levels - 1:
+            split_cells_array(radius2, b0, pgrid, levels[level.index+1], cells[~ok])
+
+def hierarchical_dart_throw_array_gen(radius, max_levels, xmin, xmax, ymin, ymax, batch_size=1024):
+    gridmin = (xmin, ymin)
+    gridmax = (xmax, ymax)
+
+    def gen(seed, num):
+        rng = np.random.RandomState(seed)
+
+        with progress.ProgressContext("Generate Samples", 0, num):
+            for points in dart_throw_array_batches(radius, max_levels, gridmin, gridmax, rng, num, batch_size=batch_size):
+                for x, y in points:
+                    yield (x, y, 0.0)
+
+    return gen
@@ -30,7 +30,8 @@ from object_physics_meadow.duplimesh import project_on_ground
 from object_physics_meadow.util import *
 
 from object_physics_meadow.best_candidate import best_candidate_gen
-from object_physics_meadow.hierarchical_dart_throw import hierarchical_dart_throw_gen
+from object_physics_meadow.hierarchical_dart_throw import hierarchical_dart_throw_gen, hierarchical_dart_throw_array_gen
+from object_physics_meadow.tiled_sampling import tiled_dart_throw_gen
 
 use_profiling = False
 
@@ -61,8 +62,14 @@ def make_samples(context, gridob, groundob):
     bbmax = mat * Vector(tuple(max(p[i] for p in groundob.bound_box) for i in range(3)))
     
     # get a sample generator implementation
-    #gen = best_candidate_gen(groundob.meadow.sample_distance, bbmin[0], bbmax[0], bbmin[1], bbmax[1])
-    gen = hierarchical_dart_throw_gen(groundob.meadow.sample_distance, groundob.meadow.sampling_levels, bbmin[0], bbmax[0], bbmin[1], bbmax[1])
+    if groundob.meadow.sampling_method == 'BEST_CANDIDATE':
+        gen = best_candidate_gen(groundob.meadow.sample_distance, bbmin[0], bbmax[0], bbmin[1], bbmax[1])
+    elif groundob.meadow.sampling_method == 'HIERARCHICAL_DART_THROW_FAST':
+        gen = hierarchical_dart_throw_array_gen(groundob.meadow.sample_distance, groundob.meadow.sampling_levels, bbmin[0], bbmax[0], bbmin[1], bbmax[1])
+    elif groundob.meadow.sampling_method == 'HIERARCHICAL_DART_THROW_TILED':
+        gen = tiled_dart_throw_gen(groundob.meadow.sample_distance, groundob.meadow.sampling_levels, bbmin[0], bbmax[0], bbmin[1], bbmax[1])
+    else:
+        gen = hierarchical_dart_throw_gen(groundob.meadow.sample_distance, groundob.meadow.sampling_levels, bbmin[0], bbmax[0], bbmin[1], bbmax[1])
     
     loc2D = [p[0:2] for p in gen(groundob.meadow.seed, groundob.meadow.max_samples)]
     
@@ -18,8 +18,19 @@
 
 # <pep8 compliant>
 
-import os, struct, sys, argparse
+import os, struct, sys, argparse, multiprocessing
 from os import path
+import numpy as np
+
+try:
+    import lzma
+except ImportError:
+    lzma = None
+
+try:
+    import lzo
+except ImportError:
+    lzo = None
 
 _byteorder = 'little'
 _byteorder_fmt = '<'
@@ -104,9 +115,12 @@ def pack_particle_times(v):
     return struct.pack('fff', v.birthtime, v.lifetime, v.dietime)
 
 def unpack_particle_times(b):
-    birthtime, lifetime, dietime = struct.unpack('fff')
+    birthtime, lifetime, dietime = struct.unpack('fff', b)
     return ParticleTimes(birthtime, lifetime, dietime)
 
+def particle_times_to_tuple(v):
+    return (v.birthtime, v.lifetime, v.dietime) if isinstance(v, ParticleTimes) else v
+
 class BoidData():
     __slots__ = ('health', 'acceleration', 'state_id', 'mode')
 
@@ -120,19 +134,43 @@ def pack_boid(v):
     return struct.pack('ffffhh', v.health, v.acceleration[0], v.acceleration[1], v.acceleration[2], v.state_id, v.mode)
 
 def unpack_boid(b):
-    health, acc0, acc1, acc2, state_id, mode = struct.unpack('ffffhh')
+    health, acc0, acc1, acc2, state_id, mode = struct.unpack('ffffhh', b)
     return BoidData(health, (acc0, acc1, acc2), state_id, mode)
 
+def boid_to_tuple(v):
+    return (v.health, v.acceleration, v.state_id, v.mode) if isinstance(v, BoidData) else v
+
+# numpy types of the point data, matching the pack/unpack functions
+_dtype_uint = np.dtype('<u4')
+_dtype_float = np.dtype('<f4')
+_dtype_vector = np.dtype(('<f4', 3))
+_dtype_quaternion = np.dtype(('<f4', 4))
+_dtype_color = np.dtype(('<f4', 4))
+_dtype_particle_times = np.dtype(('<f4', 3))
+_dtype_boid = np.dtype([('health', '<f4'), ('acceleration', '<f4', 3), ('state_id', '<i2'), ('mode', '<i2')])
+
 
 class TypeDesc():
     """Data type descriptor"""
 
-    def __init__(self, index, name, size, pack, unpack):
+    def __init__(self, index, name, size, pack, unpack, dtype, to_tuple=None):
         self.index = index
         self.name = name
         self.size = size
         self.pack = pack
         self.unpack = unpack
+        self.dtype = dtype
+        # converts a point value object to a plain tuple for array conversion
+        self.to_tuple = to_tuple
+
+    def to_array(self, values):
+        if isinstance(values, np.ndarray):
+            return values
+        if self.to_tuple:
+            values = [self.to_tuple(v) for v in values]
+        if self.dtype.fields:
+            return np.array([tuple(v) for v in values], dtype=self.dtype)
+        return np.asarray(values, dtype=self.dtype.base)
 
     def __str__(self):
         return self.name
@@ -141,39 +179,39 @@ class TypeDesc():
         return "TypeDesc(name=%r, size=%d)" % (self.name, self.size)
 
 _data_types_softbody = (
-    TypeDesc(1, 'LOCATION', 12, pack_vector, unpack_vector),
-    TypeDesc(2, 'VELOCITY', 12, pack_vector, unpack_vector),
+    TypeDesc(1, 'LOCATION', 12, pack_vector, unpack_vector, _dtype_vector),
+    TypeDesc(2, 'VELOCITY', 12, pack_vector, unpack_vector, _dtype_vector),
     )
 
 _data_types_particles = (
-    TypeDesc(0, 'INDEX', 4, pack_uint, unpack_uint),
-    TypeDesc(1, 'LOCATION', 12, pack_vector, unpack_vector),
-    TypeDesc(2, 'VELOCITY', 12, pack_vector, unpack_vector),
-    TypeDesc(3, 'ROTATION', 16, pack_quaternion, unpack_quaternion),
-    TypeDesc(4, 'AVELOCITY', 12, pack_vector, unpack_vector),
-    TypeDesc(5, 'SIZE', 4, pack_float, unpack_float),
-    TypeDesc(6, 'TIMES', 12, pack_particle_times, unpack_particle_times),
-    TypeDesc(7, 'BOIDS', 20, pack_boid, unpack_boid),
+    TypeDesc(0, 'INDEX', 4, pack_uint, unpack_uint, _dtype_uint),
+    TypeDesc(1, 'LOCATION', 12, pack_vector, unpack_vector, _dtype_vector),
+    TypeDesc(2, 'VELOCITY', 12, pack_vector, unpack_vector, _dtype_vector),
+    TypeDesc(3, 'ROTATION', 16, pack_quaternion, unpack_quaternion, _dtype_quaternion),
+    TypeDesc(4, 'AVELOCITY', 12, pack_vector, unpack_vector, _dtype_vector),
+    TypeDesc(5, 'SIZE', 4, pack_float, unpack_float, _dtype_float),
+    TypeDesc(6, 'TIMES', 12, pack_particle_times, unpack_particle_times, _dtype_particle_times, particle_times_to_tuple),
+    TypeDesc(7, 'BOIDS', 20, pack_boid, unpack_boid, _dtype_boid, boid_to_tuple),
     )
 
 _data_types_cloth = (
-    TypeDesc(1, 'LOCATION', 12, pack_vector, unpack_vector),
-    TypeDesc(2, 'VELOCITY', 12, pack_vector, unpack_vector),
-    TypeDesc(4, 'XCONST', 12, pack_vector, unpack_vector),
+    TypeDesc(1, 'LOCATION', 12, pack_vector, unpack_vector, _dtype_vector),
+    TypeDesc(2, 'VELOCITY', 12, pack_vector, unpack_vector, _dtype_vector),
+    TypeDesc(4, 'XCONST', 12, pack_vector, unpack_vector, _dtype_vector),
     )
 
 _data_types_smoke = (
-    TypeDesc(1, 'SMOKE_LOW', 12, pack_vector, unpack_vector),
-    TypeDesc(2, 'SMOKE_HIGH', 12, pack_vector, unpack_vector),
+    TypeDesc(1, 'SMOKE_LOW', 12, pack_vector, unpack_vector, _dtype_vector),
+    TypeDesc(2, 'SMOKE_HIGH', 12, pack_vector, unpack_vector, _dtype_vector),
     )
 
 _data_types_dynamicpaint = (
-    TypeDesc(3, 'DYNAMICPAINT', 16, pack_color, unpack_color),
+    TypeDesc(3, 'DYNAMICPAINT', 16, pack_color, unpack_color, _dtype_color),
     )
 
 _data_types_rigidbody = (
-    TypeDesc(1, 'LOCATION', 12, pack_vector, unpack_vector),
-    TypeDesc(3, 'ROTATION', 16, pack_quaternion, unpack_quaternion),
+    TypeDesc(1, 'LOCATION', 12, pack_vector, unpack_vector, _dtype_vector),
+    TypeDesc(3, 'ROTATION', 16, pack_quaternion, unpack_quaternion, _dtype_quaternion),
     )
 
 _type_map = {
@@ -197,6 +235,71 @@ _flag_map = {
     0x00020000 : 'extra_data',
     }
 
+#-----------------------------------------------------------------------
+# Compressed data blocks, same layout as ptcache_file_compressed_write in Blender:
+#   uchar mode (0 = uncompressed, 1 = LZO, 2 = LZMA)
+#   mode 0: raw data
+#   else:   uint size, compressed data of size bytes
+#   mode 2: uint props size, LZMA props
+
+_compression_modes = {
+    'NONE' : 0,
+    'LZO' : 1,
+    'LZMA' : 2,
+    }
+
+# LZMA settings used by Blender (LzmaCompress level 5)
+_lzma_dict_size = 1 << 24
+_lzma_lc = 3
+_lzma_lp = 0
+_lzma_pb = 2
+
+def _lzma_filters(lc, lp, pb, dict_size):
+    return [{'id' : lzma.FILTER_LZMA1, 'dict_size' : dict_size, 'lc' : lc, 'lp' : lp, 'pb' : pb}]
+
+def compress_block(raw, mode):
+    mode = _compression_modes[mode]
+    out = None
+    props = None
+    if mode == 1 and lzo:
+        out = lzo.compress(raw, 1, False)
+    elif mode == 2 and lzma:
+        out = lzma.compress(raw, format=lzma.FORMAT_RAW, filters=_lzma_filters(_lzma_lc, _lzma_lp, _lzma_pb, _lzma_dict_size))
+        props = bytes(((_lzma_pb * 5 + _lzma_lp) * 9 + _lzma_lc,)) + struct.pack('<I', _lzma_dict_size)
+
+    # like Blender, store uncompressed data if compression is unavailable or does not help
+    if out is None or len(out) >= len(raw):
+        return b'\x00' + raw
+
+    block = bytes((mode,)) + pack_uint(len(out)) + out
+    if props is not None:
+        block += pack_uint(len(props)) + props
+    return block
+
+def read_compressed_block(f, size):
+    mode = f.read(1)[0]
+    if mode == 0:
+        return f.read(size)
+
+    in_len = unpack_uint(f.read(4))
+    data = f.read(in_len)
+    if mode == 1:
+        if not lzo:
+            raise Exception("LZO compressed caches need the lzo module")
+        return lzo.decompress(data, False, size)
+    elif mode == 2:
+        props_len = unpack_uint(f.read(4))
+        props = f.read(props_len)
+        if not lzma:
+            raise Exception("LZMA compressed caches need the lzma module")
+        d = props[0]
+        lc, lp, pb = d % 9, (d // 9) % 5, d // 45
+        dict_size = struct.unpack('<I', props[1:5])[0]
+        decompressor = lzma.LZMADecompressor(format=lzma.FORMAT_RAW, filters=_lzma_filters(lc, lp, pb, dict_size))
+        return decompressor.decompress(data)[:size]
+    else:
+        raise Exception("Unknown cache compression mode %d" % mode)
+
 #-----------------------------------------------------------------------
 
 def cache_filename(base, index, cfra):
@@ -204,9 +307,18 @@ def cache_filename(base, index, cfra):
 
 #-----------------------------------------------------------------------
 
+_header_size = 20
+
+def record_dtype(data_types):
+    """Structured dtype of the interleaved point records"""
+    return np.dtype([(dt.name, dt.dtype) for dt in data_types])
+
 class CacheBase():
     __slots__ = ['filename', 'cachetype', 'data_types', 'totpoint', 'data', 'compress', 'extra_data']
 
+    def record_dtype(self):
+        return record_dtype(self.data_types)
+
     def get_data_type(self, name):
         for dt in self.data_types:
             if dt.name == name:
@@ -227,16 +339,20 @@ class ICacheFrame(CacheBase):
         self.data_types = tuple()
         self.data = tuple()
 
-    def read(self, directory, read_data):
+    def read(self, directory, read_data, use_mmap=False):
         cachetype = ""
         data_types = {}
 
-        f = open(path.join(directory, self.filename), "rb")
+        filepath = path.join(directory, self.filename)
+        f = open(filepath, "rb")
         try:
             cachetype, data_types = self.read_header(f)
 
             if read_data:
-                self.read_points(f)
+                if use_mmap and not self.compress:
+                    self.map_points(filepath)
+                else:
+                    self.read_points(f)
             else:
                 self.data = None
 
@@ -266,22 +382,30 @@ class ICacheFrame(CacheBase):
 
         return cachetype, data_types
 
-    def read_points(self, f):
-        data = tuple([None] * self.totpoint for dt in self.data_types)
+    def set_records(self, records):
+        self.data = tuple(records[dt.name] for dt in self.data_types)
 
+    def read_points(self, f):
         if self.compress:
-            raise Exception("Compressed caches are not supported yet, sorry ...")
-            return data
-
-        def interleaved():
-            for k in range(self.totpoint):
-                yield k, tuple(dt.unpack(f.read(dt.size)) if dt else None for dt in self.data_types)
-
-        for k, data_point in interleaved():
-            for data_list, value in zip(data, data_point):
-                data_list[k] = value
-
-        self.data = data
+            # compressed data is stored in separate blocks for each data type
+            data = []
+            for dt in self.data_types:
+                raw = read_compressed_block(f, self.totpoint * dt.dtype.itemsize)
+                if len(raw) < self.totpoint * dt.dtype.itemsize:
+                    raise Exception("Cache file %s is truncated" % self.filename)
+                data.append(np.frombuffer(raw, dtype=dt.dtype, count=self.totpoint))
+            self.data = tuple(data)
+            return
+
+        records = np.fromfile(f, dtype=self.record_dtype(), count=self.totpoint)
+        if len(records) < self.totpoint:
+            raise Exception("Cache file %s is truncated (%d points, expected %d)" % (self.filename, len(records), self.totpoint))
+        self.set_records(records)
+
+    def map_points(self, filepath):
+        """Memory-map the point records, data is only loaded when accessed"""
+        records = np.memmap(filepath, dtype=self.record_dtype(), mode='r', offset=_header_size, shape=(self.totpoint,))
+        self.set_records(records)
 
 #-----------------------------------------------------------------------
 
@@ -297,6 +421,13 @@ class OCacheFrame(CacheBase):
 
         self.compress = False
         self.extra_data = False
+        # compression mode used when compress is enabled, 'LZO' or 'LZMA'
+        self.compression = 'LZMA'
+
+    def set_compression(self, mode):
+        self.compress = mode in {'LZO', 'LZMA'}
+        if self.compress:
+            self.compression = mode
 
     def set_data(self, name, values):
         if name not in {dt.name for dt in self.data_types}:
@@ -338,31 +469,83 @@ class OCacheFrame(CacheBase):
 
         data_types_flag = 0
         for dt, data in zip(self.data_types, self.data):
-            if data:
+            if data is not None:
                 data_types_flag = data_types_flag | (1<<dt.index)
         f.write(pack_uint(data_types_flag))
 
+    def make_records(self):
+        records = np.empty(self.totpoint, dtype=self.record_dtype())
+        for dt, data in zip(self.data_types, self.data):
+            records[dt.name] = dt.to_array(data)
+        return records
+
     def write_points(self, f):
         if self.compress:
-            raise Exception("Compressed caches are not supported yet, sorry ...")
-            return data
-
-        for k in range(self.totpoint):
             for dt, data in zip(self.data_types, self.data):
-                f.write(dt.pack(data[k]))
+                # to_array already gives the element type, passing the subarray dtype again would add a dimension
+                raw = np.ascontiguousarray(dt.to_array(data)).tobytes()
+                f.write(compress_block(raw, self.compression))
+            return
+
+        self.make_records().tofile(f)
 
     def verify_data(self):
         for dt, data in zip(self.data_types, self.data):
-            if not data:
+            if data is None:
                 raise Exception("Data attribute %s undefined!" % dt.name)
             if len(data) != self.totpoint:
                 raise Exception("Data sequence size for attribute %s does not match (%d, must be %d)" % (dt.name, len(data), self.totpoint))
 
 #-----------------------------------------------------------------------
 
-"""
+# Batch reading and writing of frames in a process pool.
+# Compression and decompression of frames are independent,
+# so many frames can be processed in parallel.
+
+def _default_processes():
+    # forking is needed, spawned processes can't import the addon outside of Blender
+    if not hasattr(os, "fork"):
+        return 1
+    return multiprocessing.cpu_count()
+
+def _map_frames(func, tasks, processes):
+    if processes <= 0:
+        processes = _default_processes()
+    processes = min(processes, len(tasks))
+    if processes <= 1 or not hasattr(os, "fork"):
+        return list(map(func, tasks))
+
+    # fork explicitly, the default start method may be spawn or forkserver
+    pool = multiprocessing.get_context("fork").Pool(processes)
+    try:
+        return pool.map(func, tasks)
+    finally:
+        pool.close()
+        pool.join()
+
+def _write_frame(args):
+    directory, frame = args
+    frame.write(directory)
+
+def _read_frame(args):
+    directory, filename = args
+    frame = ICacheFrame(filename)
+    frame.read(directory, read_data=True)
+    return frame
+
+def write_frames(directory, frames, processes=0):
+    """Write (and compress) a list of OCacheFrame in parallel"""
+    _map_frames(_write_frame, [(directory, frame) for frame in frames], processes)
+
+def read_frames(directory, filenames, processes=0):
+    """Read (and decompress) a list of cache files in parallel, returns ICacheFrame list"""
+    return _map_frames(_read_frame, [(directory, filename) for filename in filenames], processes)
+
 class PointCache():
+    """All frames of a point cache, frame data is memory-mapped on first access"""
+
     def __init__(self, directory, index=0):
+        self.directory = directory
         self.files = cache_file_list(directory, index)
         if not self.files:
             raise Exception("No point cache files for index %d in directory %s" % (index, directory))
@@ -370,7 +553,7 @@ class PointCache():
         self.start_frame, info_filename = self.files[0]
         self.end_frame, _ = self.files[-1]
 
-        info_frame = CacheFrame(info_filename)
+        info_frame = ICacheFrame(info_filename)
         cachetype, data_types = info_frame.read(directory, read_data=False)
 
         self.cachetype = cachetype
@@ -380,9 +563,108 @@ class PointCache():
             setattr(self, flag, getattr(info_frame, flag))
         self.totpoint = info_frame.totpoint
 
+        self.frame_files = dict(self.files)
+        self.frames = {}
+
     def get_data_type(self, name):
         for dt in self.data_types:
             if dt.name == name:
                 return dt
         return None
-"""
+
+    def frame_numbers(self):
+        return [cfra for cfra, _ in self.files]
+
+    def frame(self, cfra):
+        frame = self.frames.get(cfra, None)
+        if frame is None:
+            filename = self.frame_files.get(cfra, None)
+            if filename is None:
+                raise KeyError("No cache file for frame %d" % cfra)
+            frame = ICacheFrame(filename)
+            frame.read(self.directory, read_data=True, use_mmap=True)
+            self.frames[cfra] = frame
+        return frame
+
+    def get_data(self, cfra, name):
+        return self.frame(cfra).get_data(name)
+
+    def load_frames(self, frame_numbers=None, processes=0):
+        """Read many frames at once, compressed frames are decoded in parallel"""
+        if frame_numbers is None:
+            frame_numbers = self.frame_numbers()
+        frame_numbers = [cfra for cfra in frame_numbers if cfra not in self.frames]
+        if self.compress:
+            frames = read_frames(self.directory, [self.frame_files[cfra] for cfra in frame_numbers], processes)
+            self.frames.update(zip(frame_numbers, frames))
+        else:
+            for cfra in frame_numbers:
+                self.frame(cfra)
+
+    def free_frames(self):
+        self.frames.clear()
+
+
+if __name__ == "__main__":
+
+    import unittest
+    import tempfile
+
+    class TestPointCache(unittest.TestCase):
+
+        def make_frame(self, totpoint, compression):
+            rng = np.random.RandomState(totpoint)
+            frame = OCacheFrame(cache_filename("test", 0, 1), 'PARTICLES', totpoint)
+            frame.set_compression(compression)
+            for dt in frame.data_types:
+                if dt.dtype.fields:
+                    values = [(rng.uniform(), rng.uniform(size=3), rng.randint(100), rng.randint(4)) for i in range(totpoint)]
+                elif dt.dtype.shape:
+                    values = rng.uniform(-10, 10, (totpoint,) + dt.dtype.shape).astype(np.float32)
+                else:
+                    values = np.arange(totpoint, dtype=dt.dtype)
+                frame.set_data(dt.name, values)
+            return frame
+
+        def roundtrip(self, compression):
+            with tempfile.TemporaryDirectory() as directory:
+                frame = self.make_frame(1000, compression)
+                frame.write(directory)
+                expected = frame.make_records()
+
+                # the payload of every block matches the uncompressed records
+                with open(path.join(directory, frame.filename), 'rb') as f:
+                    f.seek(_header_size)
+                    for dt in frame.data_types:
+                        raw = read_compressed_block(f, frame.totpoint * dt.dtype.itemsize)
+                        self.assertEqual(raw, np.ascontiguousarray(expected[dt.name]).tobytes())
+                    self.assertEqual(f.read(), b'')
+
+                iframe = ICacheFrame(frame.filename)
+                iframe.read(directory, read_data=True)
+                self.assertTrue(iframe.compress)
+                self.assertEqual(iframe.totpoint, frame.totpoint)
+                for dt in frame.data_types:
+                    self.assertTrue(np.array_equal(iframe.get_data(dt.name), expected[dt.name]))
+
+        def test_lzma(self):
+            if lzma is None:
+                self.skipTest("lzma module not available")
+            self.roundtrip('LZMA')
+
+        def test_lzo(self):
+            if lzo is None:
+                self.skipTest("lzo module not available")
+            self.roundtrip('LZO')
+
+        def test_uncompressed(self):
+            with tempfile.TemporaryDirectory() as directory:
+                frame = self.make_frame(1000, 'NONE')
+                frame.write(directory)
+                iframe = ICacheFrame(frame.filename)
+                iframe.read(directory, read_data=True)
+                self.assertFalse(iframe.compress)
+                for dt in frame.data_types:
+                    self.assertTrue(np.array_equal(iframe.get_data(dt.name), frame.make_records()[dt.name]))
+
+    unittest.main()
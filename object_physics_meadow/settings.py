@@ -73,6 +73,13 @@ type_items = [
     ]
 unique_types = {'GROUND', 'BLOBGRID'}
 
+sampling_method_items = [
+    ('HIERARCHICAL_DART_THROW', 'Hierarchical Dart Throw', 'Poisson disk sampling by hierarchical dart throwing (reference implementation)'),
+    ('HIERARCHICAL_DART_THROW_FAST', 'Hierarchical Dart Throw (Fast)', 'Poisson disk sampling by hierarchical dart throwing, array based (different samples for the same seed)'),
+    ('HIERARCHICAL_DART_THROW_TILED', 'Hierarchical Dart Throw (Parallel)', 'Poisson disk sampling on tiles in multiple processes'),
+    ('BEST_CANDIDATE', 'Best Candidate', "Mitchell's best candidate sampling"),
+    ]
+
 def type_update(self, context):
     # ensure unique types
     if self.type in unique_types:
@@ -151,6 +158,13 @@ class MeadowObjectSettings(PropertyGroup):
         default=12345
         )
 
+    sampling_method = EnumProperty(
+        name="Sampling Method",
+        description="Algorithm for generating sample locations",
+        items=sampling_method_items,
+        default='HIERARCHICAL_DART_THROW'
+        )
+
     sampling_levels = IntProperty(
         name="Sampling Levels",
         description="Maximum number of sampling subdivision levels",
@@ -0,0 +1,144 @@
+### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+# <pep8 compliant>
+
+import multiprocessing, os
+from math import *
+import numpy as np
+
+from object_physics_meadow import progress
+from object_physics_meadow.hierarchical_dart_throw import dart_throw_array_batches
+
+# Parallel Poisson disk sampling on tiles.
+#
+# The sampling area is split into square tiles, which are processed in 4 phases
+# in a checkerboard pattern: tiles of the same phase are at least one tile size
+# apart, so they can be sampled independently in worker processes.
+# Each tile takes the points of already finished neighbor tiles inside
+# a guard band of the sample radius into account, so the union of all tiles
+# is a valid Poisson disk set. Random seeds are derived from the tile index,
+# the result does not depend on the number of processes.
+
+phases = ((0, 0), (1, 0), (0, 1), (1, 1))
+
+def _init_worker():
+    # workers are forked from Blender, make sure they don't touch the UI
+    progress._progress_context = None
+    progress.show_progress_bar = False
+    progress.show_stdout = False
+
+def _sample_tile(args):
+    radius, max_levels, seed, ti, tj, x0, x1, y0, y1, num, fixed_points = args
+    rng = np.random.RandomState([seed & 0xffffffff, ti & 0xffffffff, tj & 0xffffffff])
+
+    # cells of the dart thrower extend beyond the bounds, only keep the tile itself
+    batches = list(dart_throw_array_batches(radius, max_levels, (x0, y0), (x1, y1), rng, num, fixed_points,
+                                            clip=(x0, x1, y0, y1)))
+    points = np.concatenate(batches) if batches else np.empty((0, 2))
+    return ti, tj, points
+
+def default_processes():
+    # forking is needed, spawned processes can't import bpy
+    if not hasattr(os, "fork"):
+        return 1
+    return multiprocessing.cpu_count()
+
+def tiled_dart_throw_gen(radius, max_levels, xmin, xmax, ymin, ymax, tile_size=0.0, processes=0):
+    if processes <= 0:
+        processes = default_processes()
+
+    width = max(xmax - xmin, radius)
+    height = max(ymax - ymin, radius)
+    if tile_size <= 0.0:
+        # roughly 1000 samples per tile, independent of the number of processes
+        # so the result is the same on every machine
+        tile_size = 32.0 * radius
+    # same-phase tiles must be separated by more than the sample radius
+    tile_size = max(tile_size, 4.0 * radius)
+
+    ni = max(int(ceil(width / tile_size)), 1)
+    nj = max(int(ceil(height / tile_size)), 1)
+
+    def tile_bounds(ti, tj):
+        x0 = xmin + ti * tile_size
+        y0 = ymin + tj * tile_size
+        return x0, min(x0 + tile_size, xmin + width), y0, min(y0 + tile_size, ymin + height)
+
+    def guard_points(tiles, ti, tj):
+        x0, x1, y0, y1 = tile_bounds(ti, tj)
+        result = []
+        for nj in range(tj - 1, tj + 2):
+            for ni in range(ti - 1, ti + 2):
+                points = tiles.get((ni, nj), None)
+                if points is None or len(points) == 0:
+                    continue
+                inside = (points[:, 0] >= x0 - radius) & (points[:, 0] < x1 + radius) & \
+                         (points[:, 1] >= y0 - radius) & (points[:, 1] < y1 + radius)
+                result.append(points[inside])
+        return np.concatenate(result) if result else None
+
+    def tile_budgets(num):
+        # distribute the sample budget by tile area, rounding so the budgets add up to num
+        budgets = {}
+        area = 0.0
+        assigned = 0
+        for tj in range(nj):
+            for ti in range(ni):
+                x0, x1, y0, y1 = tile_bounds(ti, tj)
+                area += (x1 - x0) * (y1 - y0)
+                total = int(round(num * area / (width * height)))
+                budgets[(ti, tj)] = total - assigned
+                assigned = total
+        return budgets
+
+    def gen(seed, num):
+        budgets = tile_budgets(num)
+
+        tiles = {}
+        with progress.ProgressContext("Generate Samples", 0, ni * nj):
+            # fork explicitly, the default start method may be spawn or forkserver
+            if processes > 1 and hasattr(os, "fork"):
+                pool = multiprocessing.get_context("fork").Pool(processes, initializer=_init_worker)
+            else:
+                pool = None
+            try:
+                for pi, pj in phases:
+                    tasks = []
+                    for tj in range(pj, nj, 2):
+                        for ti in range(pi, ni, 2):
+                            x0, x1, y0, y1 = tile_bounds(ti, tj)
+                            tasks.append((radius, max_levels, seed, ti, tj, x0, x1, y0, y1, budgets[(ti, tj)],
+                                          guard_points(tiles, ti, tj)))
+
+                    results = pool.imap_unordered(_sample_tile, tasks) if pool else map(_sample_tile, tasks)
+                    for ti, tj, points in results:
+                        progress.progress_add(1)
+                        tiles[(ti, tj)] = points
+            finally:
+                if pool:
+                    pool.close()
+                    pool.join()
+
+        # yield in deterministic tile order
+        for tj in range(nj):
+            for ti in range(ni):
+                for x, y in tiles[(ti, tj)]:
+                    yield (x, y, 0.0)
+
+    return gen
@@ -88,7 +88,10 @@ class OBJECT_PT_Meadow(Panel):
             sub2 = col.row(align=True)
             sub2.prop(meadow, "max_samples")
             sub2.operator("meadow.estimate_max_samples", text="Estimate")
-            sub.prop(meadow, "sampling_levels")
+            sub.prop(meadow, "sampling_method")
+            sub2 = sub.row()
+            sub2.active = meadow.sampling_method in {'HIERARCHICAL_DART_THROW', 'HIERARCHICAL_DART_THROW_FAST', 'HIERARCHICAL_DART_THROW_TILED'}
+            sub2.prop(meadow, "sampling_levels")
             
             if has_samples:
                 box.operator("meadow.delete_blobs", icon='X', text="Delete Samples")